@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import sys
 from dataclasses import replace
 from pathlib import Path
@@ -225,6 +226,12 @@ def lint(
 @click.option("--diff", "show_diff", is_flag=True, help="Print unified diff, don't write files")
 @click.option("--check", "check_only", is_flag=True, help="Exit 1 if any file would change")
 @click.option("--tryout", is_flag=True, help="Interactively approve each fix")
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes (default: CPU count)",
+)
 @click.pass_context
 def fix(
     ctx: click.Context,
@@ -233,6 +240,7 @@ def fix(
     show_diff: bool,
     check_only: bool,
     tryout: bool,
+    jobs: int | None,
 ) -> None:
     """Apply safe autofixes to Python files."""
     exclusive: int = sum([show_diff, check_only, tryout])
@@ -249,7 +257,10 @@ def fix(
     if not paths:
         paths = (Path("."),)
 
-    result: FixResult = fix_paths(paths=paths, config=cfg)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    result: FixResult = fix_paths(paths=paths, config=cfg, jobs=jobs)
 
     if show_diff:
         for path in sorted(result.changes):
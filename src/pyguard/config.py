@@ -1,6 +1,8 @@
 """Configuration loading and validation for PyGuard."""
 from __future__ import annotations
 
+import functools
+import sys
 import tomllib
 from pathlib import Path
 from types import MappingProxyType
@@ -9,6 +11,7 @@ from typing import Any
 from pyguard.constants import (
     DEFAULT_EXCLUDES,
     DEFAULT_SEVERITIES,
+    DEFAULT_TYP003_SCOPE,
     RULE_CODES,
     AnnotationScope,
     ColorMode,
@@ -39,18 +42,19 @@ class ConfigLoader:
 
         Returns:
             Path to pyproject.toml if found, None otherwise.
+
+        Results are cached per resolved start directory; call
+        ``clear_cache()`` if pyproject.toml files are created or removed.
         """
         if start_path is None:
             start_path = Path.cwd()
 
-        start_path = start_path.resolve()
-
-        for directory in [start_path, *start_path.parents]:
-            config_path: Path = directory / "pyproject.toml"
-            if config_path.is_file():
-                return config_path
+        return _find_config_file(start_path.resolve())
 
-        return None
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached ``find_config_file`` results."""
+        _find_config_file.cache_clear()
 
     @staticmethod
     def load(*, path: Path | None = None) -> PyGuardConfig:
@@ -169,78 +173,52 @@ class ConfigLoader:
 
     @staticmethod
     def _parse_rules(data: dict[str, Any], errors: list[str]) -> RuleConfig:
-        """Parse rules configuration."""
+        """Parse rules configuration in a single pass over the table."""
         severities: dict[str, Severity] = dict(DEFAULT_SEVERITIES)
+        typ001: TYP001Options = TYP001Options()
+        typ003: TYP003Options = TYP003Options()
+        kw001: KW001Options = KW001Options()
 
         for key, value in data.items():
-            if key.upper() not in RULE_CODES and not isinstance(value, dict):
-                errors.append(f"rules.{key} is not a recognized rule code")
+            # Interned so lookups against rule-code literals hit the identity fast path
+            rule_code: str = sys.intern(key.upper())
+            if rule_code not in RULE_CODES:
+                if not isinstance(value, dict):
+                    errors.append(f"rules.{key} is not a recognized rule code")
                 continue
-            if key.upper() in RULE_CODES:
-                rule_code: str = key.upper()
-                if isinstance(value, str):
-                    try:
-                        severities[rule_code] = Severity(value.lower())
-                    except ValueError:
-                        valid: list[str] = [s.value for s in Severity]
-                        errors.append(f"rules.{key} must be one of {valid}")
-                elif isinstance(value, dict):
-                    severity_value: Any = value.get("severity")
-                    if severity_value is not None:
-                        if not isinstance(severity_value, str):
-                            errors.append(
-                                f"rules.{key}.severity must be a string, "
-                                f"got {type(severity_value).__name__}"
-                            )
-                        else:
-                            try:
-                                severities[rule_code] = Severity(severity_value.lower())
-                            except ValueError:
-                                valid = [s.value for s in Severity]
-                                errors.append(f"rules.{key}.severity must be one of {valid}")
-
-        # Parse TYP001 options
-        typ001_data: dict[str, Any] = data.get("TYP001", {})
-        typ001: TYP001Options
-        if isinstance(typ001_data, dict):
-            typ001 = TYP001Options(
-                exempt_dunder=typ001_data.get("exempt_dunder", True),
-                exempt_self_cls=typ001_data.get("exempt_self_cls", True),
-            )
-        else:
-            typ001 = TYP001Options()
-
-        # Parse TYP003 options
-        typ003_data: dict[str, Any] = data.get("TYP003", {})
-        typ003: TYP003Options
-        if isinstance(typ003_data, dict):
-            scope_values: list[str] = typ003_data.get("scope", ["module"])
-            scope: frozenset[AnnotationScope]
-            if isinstance(scope_values, list):
+
+            if isinstance(value, str):
                 try:
-                    scope = frozenset(AnnotationScope(s) for s in scope_values)
+                    severities[rule_code] = Severity(value.lower())
                 except ValueError:
-                    valid = [s.value for s in AnnotationScope]
-                    errors.append(f"rules.TYP003.scope values must be from {valid}")
-                    scope = frozenset({AnnotationScope.MODULE})
-            else:
-                scope = frozenset({AnnotationScope.MODULE})
-            typ003 = TYP003Options(scope=scope)
-        else:
-            typ003 = TYP003Options()
-
-        # Parse KW001 options
-        kw001_data: dict[str, Any] = data.get("KW001", {})
-        kw001: KW001Options
-        if isinstance(kw001_data, dict):
-            kw001 = KW001Options(
-                min_params=kw001_data.get("min_params", 2),
-                exempt_dunder=kw001_data.get("exempt_dunder", True),
-                exempt_private=kw001_data.get("exempt_private", True),
-                exempt_overrides=kw001_data.get("exempt_overrides", True),
-            )
-        else:
-            kw001 = KW001Options()
+                    valid: list[str] = [s.value for s in Severity]
+                    errors.append(f"rules.{key} must be one of {valid}")
+                continue
+
+            if not isinstance(value, dict):
+                continue
+
+            severity_value: Any = value.get("severity")
+            if severity_value is not None:
+                if not isinstance(severity_value, str):
+                    errors.append(
+                        f"rules.{key}.severity must be a string, "
+                        f"got {type(severity_value).__name__}"
+                    )
+                else:
+                    try:
+                        severities[rule_code] = Severity(severity_value.lower())
+                    except ValueError:
+                        valid = [s.value for s in Severity]
+                        errors.append(f"rules.{key}.severity must be one of {valid}")
+
+            match rule_code:
+                case "TYP001":
+                    typ001 = ConfigLoader._parse_typ001(value)
+                case "TYP003":
+                    typ003 = ConfigLoader._parse_typ003(value, errors)
+                case "KW001":
+                    kw001 = ConfigLoader._parse_kw001(value)
 
         return RuleConfig(
             severities=MappingProxyType(severities),
@@ -249,6 +227,37 @@ class ConfigLoader:
             kw001=kw001,
         )
 
+    @staticmethod
+    def _parse_typ001(data: dict[str, Any]) -> TYP001Options:
+        """Parse TYP001 options."""
+        return TYP001Options(
+            exempt_dunder=data.get("exempt_dunder", True),
+            exempt_self_cls=data.get("exempt_self_cls", True),
+        )
+
+    @staticmethod
+    def _parse_typ003(data: dict[str, Any], errors: list[str]) -> TYP003Options:
+        """Parse TYP003 options."""
+        scope_values: list[str] = data.get("scope", ["module"])
+        scope: frozenset[AnnotationScope] = DEFAULT_TYP003_SCOPE
+        if isinstance(scope_values, list):
+            try:
+                scope = frozenset(AnnotationScope(s) for s in scope_values)
+            except ValueError:
+                valid: list[str] = [s.value for s in AnnotationScope]
+                errors.append(f"rules.TYP003.scope values must be from {valid}")
+        return TYP003Options(scope=scope)
+
+    @staticmethod
+    def _parse_kw001(data: dict[str, Any]) -> KW001Options:
+        """Parse KW001 options."""
+        return KW001Options(
+            min_params=data.get("min_params", 2),
+            exempt_dunder=data.get("exempt_dunder", True),
+            exempt_private=data.get("exempt_private", True),
+            exempt_overrides=data.get("exempt_overrides", True),
+        )
+
     @staticmethod
     def _parse_ignores(data: dict[str, Any], errors: list[str]) -> IgnoreGovernance:
         """Parse ignore governance configuration."""
@@ -269,10 +278,11 @@ class ConfigLoader:
                         f"got {type(entry).__name__}: {entry!r}"
                     )
                     continue
-                if entry.upper() not in RULE_CODES:
+                code: str = sys.intern(entry.upper())
+                if code not in RULE_CODES:
                     errors.append(f"ignores.disallow contains unknown rule code: {entry}")
                 else:
-                    valid_codes.append(entry.upper())
+                    valid_codes.append(code)
             disallow = frozenset(valid_codes)
         else:
             errors.append("ignores.disallow must be a list")
@@ -290,6 +300,17 @@ class ConfigLoader:
         )
 
 
+@functools.lru_cache(maxsize=256)
+def _find_config_file(start_path: Path) -> Path | None:
+    """Walk up from an already-resolved start_path looking for pyproject.toml."""
+    for directory in [start_path, *start_path.parents]:
+        config_path: Path = directory / "pyproject.toml"
+        if config_path.is_file():
+            return config_path
+
+    return None
+
+
 def load_config(*, path: Path | None = None) -> PyGuardConfig:
     """
     Convenience function to load configuration.
@@ -62,8 +62,13 @@ DEFAULT_SEVERITIES: Final[dict[str, Severity]] = {
     "EXP002": Severity.OFF,
 }
 
+DEFAULT_TYP003_SCOPE: Final[frozenset[AnnotationScope]] = frozenset({AnnotationScope.MODULE})
+
 SYNTAX_ERROR_CODE: Final[str] = "SYN001"
 
+# Below this many files, process-pool startup costs more than it saves
+PARALLEL_THRESHOLD: Final[int] = 8
+
 IGN001_CODE: Final[str] = "IGN001"
 IGN002_CODE: Final[str] = "IGN002"
 IGN003_CODE: Final[str] = "IGN003"
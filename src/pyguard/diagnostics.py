@@ -32,40 +32,73 @@ class Diagnostic:
 
 @dataclass(slots=True)
 class DiagnosticCollection:
-    """Mutable collection of diagnostics with sorting and counting."""
+    """Mutable collection of diagnostics with sorting and counting.
+
+    Severity counts are maintained as diagnostics are added so the
+    counting properties are O(1).
+    """
 
     _diagnostics: list[Diagnostic] = field(default_factory=list)
+    _error_count: int = field(default=0, init=False)
+    _warning_count: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self._count(self._diagnostics)
 
     def add(self, *, diagnostic: Diagnostic) -> None:
         """Add a single diagnostic."""
         self._diagnostics.append(diagnostic)
+        severity: Severity = diagnostic.severity
+        if severity is Severity.ERROR:
+            self._error_count += 1
+        elif severity is Severity.WARN:
+            self._warning_count += 1
 
     def add_all(self, *, diagnostics: list[Diagnostic]) -> None:
         """Add multiple diagnostics."""
         self._diagnostics.extend(diagnostics)
+        self._count(diagnostics)
+
+    def _count(self, diagnostics: list[Diagnostic]) -> None:
+        errors: int = 0
+        warnings: int = 0
+        for d in diagnostics:
+            if d.severity is Severity.ERROR:
+                errors += 1
+            elif d.severity is Severity.WARN:
+                warnings += 1
+        self._error_count += errors
+        self._warning_count += warnings
 
     @property
     def sorted(self) -> list[Diagnostic]:
         """Return diagnostics sorted by file, line, column."""
-        return sorted(
-            self._diagnostics,
-            key=lambda d: (str(d.file), d.location.line, d.location.column),
-        )
+        # Many diagnostics share a file, so stringify each path only once
+        file_keys: dict[Path, str] = {}
+
+        def sort_key(d: Diagnostic) -> tuple[str, int, int]:
+            file_key: str | None = file_keys.get(d.file)
+            if file_key is None:
+                file_key = file_keys[d.file] = str(d.file)
+            location: SourceLocation = d.location
+            return (file_key, location.line, location.column)
+
+        return sorted(self._diagnostics, key=sort_key)
 
     @property
     def has_errors(self) -> bool:
         """Return True if any diagnostic has ERROR severity."""
-        return any(d.severity == Severity.ERROR for d in self._diagnostics)
+        return self._error_count > 0
 
     @property
     def error_count(self) -> int:
         """Count of ERROR severity diagnostics."""
-        return sum(1 for d in self._diagnostics if d.severity == Severity.ERROR)
+        return self._error_count
 
     @property
     def warning_count(self) -> int:
         """Count of WARN severity diagnostics."""
-        return sum(1 for d in self._diagnostics if d.severity == Severity.WARN)
+        return self._warning_count
 
     def __len__(self) -> int:
         return len(self._diagnostics)
@@ -0,0 +1,80 @@
+"""Single-pass dispatch for insertion-only fixers."""
+from __future__ import annotations
+
+import ast
+from collections.abc import Callable, Sequence
+from tokenize import TokenInfo
+from typing import Any, Protocol, TypeVar
+
+from pyguard.fixers._util import apply_insertions, parse_source, tokenize_source
+
+_N = TypeVar("_N", bound=ast.AST)
+
+
+class FixerRegistry:
+    """Map AST node types to the fixer hooks interested in them."""
+
+    def __init__(self) -> None:
+        self._handlers: dict[type[ast.AST], list[Callable[[Any], None]]] = {}
+
+    def register(self, node_type: type[_N], handler: Callable[[_N], None]) -> None:
+        """Call *handler* for every node of exactly *node_type*."""
+        self._handlers.setdefault(node_type, []).append(handler)
+
+    def walk(self, tree: ast.AST) -> None:
+        """Visit every node once, dispatching to all registered hooks."""
+        handlers: dict[type[ast.AST], list[Callable[[Any], None]]] = self._handlers
+        stack: list[ast.AST] = [tree]
+        while stack:
+            node: ast.AST = stack.pop()
+            for handler in handlers.get(type(node), ()):
+                handler(node)
+            stack.extend(ast.iter_child_nodes(node))
+
+
+class InsertionFixer(Protocol):
+    """A fixer that only inserts text at positions in the original source."""
+
+    @property
+    def pending(self) -> bool: ...
+
+    def register(self, registry: FixerRegistry) -> None: ...
+
+    def insertions(self, tokens: list[TokenInfo]) -> list[tuple[int, int, str]]: ...
+
+
+def apply_insertion_fixers(source: str, *, fixers: Sequence[InsertionFixer]) -> str:
+    """Run *fixers* over one parse, one tree walk and one tokenize.
+
+    Insertions are ``(line_0indexed, col, text)`` against the original
+    source and are spliced in reverse order so earlier offsets stay valid.
+    """
+    tree: ast.Module | None = parse_source(source)
+    if tree is None:
+        return source
+
+    registry: FixerRegistry = FixerRegistry()
+    for fixer in fixers:
+        fixer.register(registry)
+    registry.walk(tree)
+
+    if not any(fixer.pending for fixer in fixers):
+        return source
+
+    tokens: list[TokenInfo] = tokenize_source(source)
+    if not tokens:
+        return source
+
+    insertions: list[tuple[int, int, str]] = []
+    for fixer in fixers:
+        insertions.extend(fixer.insertions(tokens))
+
+    if not insertions:
+        return source
+
+    lines: list[str] = source.splitlines(keepends=True)
+    for line_idx, col, text in sorted(insertions, reverse=True):
+        line: str = lines[line_idx]
+        lines[line_idx] = line[:col] + text + line[col:]
+
+    return apply_insertions(source, lines)
@@ -2,9 +2,13 @@
 from __future__ import annotations
 
 import ast
+import functools
 import io
+import itertools
 import tokenize
+from collections.abc import Callable, Iterable
 from tokenize import TokenInfo
+from typing import Any, ClassVar
 
 
 def tokenize_source(source: str) -> list[TokenInfo]:
@@ -15,14 +19,26 @@ def tokenize_source(source: str) -> list[TokenInfo]:
         return []
 
 
+@functools.lru_cache(maxsize=64)
 def parse_source(source: str) -> ast.Module | None:
-    """Parse source code, returning ``None`` on error."""
+    """Parse source code, returning ``None`` on error.
+
+    Results are memoized per source string: within ``fix_all`` each
+    fixer re-parses the previous fixer's validated output, so most
+    parses after the first are cache hits.  Callers must treat the
+    returned tree as read-only since it may be shared.
+    """
     try:
         return ast.parse(source)
     except (SyntaxError, RecursionError, ValueError):
         return None
 
 
+def clear_parse_cache() -> None:
+    """Drop memoized ``parse_source`` results."""
+    parse_source.cache_clear()
+
+
 def apply_insertions(source: str, lines: list[str]) -> str:
     """Join modified lines and validate the result is still valid Python.
 
@@ -33,3 +49,68 @@ def apply_insertions(source: str, lines: list[str]) -> str:
     if parse_source(result) is None:
         return source
     return result
+
+
+def line_offsets(data: bytes) -> list[int]:
+    """Return the byte offset of the start of each line, plus the total length.
+
+    Lines are split the way the tokenizer counts them, so
+    ``offsets[node.lineno - 1] + node.col_offset`` is a node's byte offset.
+    """
+    return [0, *itertools.accumulate(len(line) for line in data.splitlines(keepends=True))]
+
+
+def apply_edits(source: str, edits: Iterable[tuple[int, int, str]]) -> str:
+    """Splice ``(start, end, replacement)`` byte-offset edits into *source*.
+
+    Edits must not overlap.  They are applied from the end of a single
+    buffer so earlier offsets stay valid, and the result is validated
+    like ``apply_insertions``.
+    """
+    buffer: bytearray = bytearray(source.encode("utf-8"))
+    for start, end, replacement in sorted(edits, reverse=True):
+        buffer[start:end] = replacement.encode("utf-8")
+    result: str = buffer.decode("utf-8")
+    if parse_source(result) is None:
+        return source
+    return result
+
+
+class DispatchVisitor:
+    """Drop-in ``ast.NodeVisitor`` replacement with table-driven dispatch.
+
+    Subclasses define ``visit_<NodeType>`` methods as usual.  The
+    type-to-method table is built once per class, so visiting a node is a
+    single dict lookup instead of a string format plus ``getattr``.
+    """
+
+    __slots__ = ()
+
+    _dispatch: ClassVar[dict[type[ast.AST], Callable[[Any, Any], None]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        table: dict[type[ast.AST], Callable[[Any, Any], None]] = {}
+        for name in dir(cls):
+            if not name.startswith("visit_"):
+                continue
+            node_type: object = getattr(ast, name[len("visit_"):], None)
+            if isinstance(node_type, type) and issubclass(node_type, ast.AST):
+                table[node_type] = getattr(cls, name)
+        cls._dispatch = table
+
+    def visit(self, node: ast.AST) -> None:
+        handler: Callable[[Any, Any], None] | None = self._dispatch.get(type(node))
+        if handler is None:
+            self.generic_visit(node)
+        else:
+            handler(self, node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        dispatch: dict[type[ast.AST], Callable[[Any, Any], None]] = self._dispatch
+        for child in ast.iter_child_nodes(node):
+            handler: Callable[[Any, Any], None] | None = dispatch.get(type(child))
+            if handler is None:
+                self.generic_visit(child)
+            else:
+                handler(self, child)
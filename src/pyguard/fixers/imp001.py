@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import ast
+import functools
+import re
 import sys
 
-from pyguard.fixers._util import parse_source
+from pyguard.fixers._util import DispatchVisitor, apply_edits, line_offsets, parse_source
 
 _STDLIB_MODULES: frozenset[str] = (
     frozenset(sys.stdlib_module_names)
@@ -12,6 +14,12 @@ _STDLIB_MODULES: frozenset[str] = (
     else frozenset()
 )
 
+# Cheap pre-filter: a movable local import starts an indented line
+_INDENTED_IMPORT_RE: re.Pattern[str] = re.compile(r"^[ \t]+(?:import|from)\b", re.MULTILINE)
+
+# Imports are statements, so only these statement-list fields can lead to one
+_STATEMENT_FIELDS: tuple[str, ...] = ("body", "orelse", "finalbody", "handlers", "cases")
+
 
 def fix_local_imports(source: str) -> str:
     """
@@ -20,11 +28,26 @@ def fix_local_imports(source: str) -> str:
     Only handles simple, single-line imports.  Skips conditional
     imports (try/except ImportError) and multi-line imports.
     """
+    if _INDENTED_IMPORT_RE.search(source) is None:
+        return source
+    return _fix_local_imports(source)
+
+
+def clear_fix_cache() -> None:
+    """Drop memoized ``fix_local_imports`` results."""
+    _fix_local_imports.cache_clear()
+
+
+@functools.lru_cache(maxsize=128)
+def _fix_local_imports(source: str) -> str:
+    """Memoized core of ``fix_local_imports``; output depends only on *source*."""
     tree: ast.Module | None = parse_source(source)
     if tree is None:
         return source
 
-    lines: list[str] = source.splitlines(keepends=True)
+    data: bytes = source.encode("utf-8")
+    offsets: list[int] = line_offsets(data)
+    lines: list[str] = [line.decode("utf-8") for line in data.splitlines(keepends=True)]
     if not lines:
         return source
 
@@ -60,16 +83,13 @@ def fix_local_imports(source: str) -> str:
         return source
 
     # Remove local import lines
-    kept_lines: list[str] = [
-        line for idx, line in enumerate(lines) if idx not in lines_to_remove
+    edits: list[tuple[int, int, str]] = [
+        (offsets[idx], offsets[idx + 1], "") for idx in lines_to_remove
     ]
 
     if not new_import_texts:
         # All were duplicates — just return with removals
-        result: str = "".join(kept_lines)
-        if parse_source(result) is None:
-            return source
-        return result
+        return apply_edits(source, edits)
 
     # Separate stdlib from non-stdlib
     stdlib_texts: list[str] = [
@@ -88,23 +108,19 @@ def fix_local_imports(source: str) -> str:
     for imp in other_texts:
         import_block.append(imp + "\n")
 
-    # Find insertion position
+    # Find insertion position, as the index of the kept line it precedes
+    kept: list[int] = [idx for idx in range(len(lines)) if idx not in lines_to_remove]
     insert_pos: int = 0
     if not stdlib_texts:
-        insert_pos = _after_last_import(kept_lines)
+        insert_pos = _after_last_import([lines[idx] for idx in kept])
 
     # Add blank line separator if next line is non-blank
-    if insert_pos < len(kept_lines) and kept_lines[insert_pos].strip():
+    if insert_pos < len(kept) and lines[kept[insert_pos]].strip():
         import_block.append("\n")
 
-    # Insert the block
-    for i, imp_line in enumerate(import_block):
-        kept_lines.insert(insert_pos + i, imp_line)
-
-    result = "".join(kept_lines)
-    if parse_source(result) is None:
-        return source
-    return result
+    insert_at: int = offsets[kept[insert_pos]] if insert_pos < len(kept) else len(data)
+    edits.append((insert_at, insert_at, "".join(import_block)))
+    return apply_edits(source, edits)
 
 
 def _after_last_import(lines: list[str]) -> int:
@@ -159,9 +175,17 @@ def _catches_import_error(handler: ast.ExceptHandler) -> bool:
     return False
 
 
-class _ImportCollector(ast.NodeVisitor):
+class _ImportCollector(DispatchVisitor):
     """Collect module-level and function-level import nodes."""
 
+    __slots__ = (
+        "_function_depth",
+        "_in_type_checking",
+        "_in_try_except_import",
+        "module_imports",
+        "local_imports",
+    )
+
     def __init__(self) -> None:
         self._function_depth: int = 0
         self._in_type_checking: bool = False
@@ -169,6 +193,14 @@ class _ImportCollector(ast.NodeVisitor):
         self.module_imports: list[ast.Import | ast.ImportFrom] = []
         self.local_imports: list[ast.Import | ast.ImportFrom] = []
 
+    def generic_visit(self, node: ast.AST) -> None:
+        # Skip expression subtrees entirely; they can never contain imports
+        for name in _STATEMENT_FIELDS:
+            children: list[ast.AST] | None = getattr(node, name, None)
+            if children:
+                for child in children:
+                    self.visit(child)
+
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         self._function_depth += 1
         self.generic_visit(node)
@@ -2,14 +2,18 @@
 from __future__ import annotations
 
 import ast
-import tokenize
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from tokenize import TokenInfo
 
-from pyguard.fixers._util import parse_source, tokenize_source
+from pyguard.constants import PARALLEL_THRESHOLD
+from pyguard.fixers._util import DispatchVisitor, apply_edits, line_offsets, parse_source
 from pyguard.types import KW001Options, PyGuardConfig
 
+_DEF_RE: re.Pattern[str] = re.compile(r"\bdef\b")
+
 
 @dataclass(frozen=True, slots=True)
 class CallSiteWarning:
@@ -35,25 +39,54 @@ def fix_keyword_only(
     *,
     sources: dict[Path, str],
     config: PyGuardConfig,
+    jobs: int | None = None,
 ) -> FixResult:
     """
     Fix KW001: insert * separator and rewrite call sites.
 
     Phase 1: Insert ``*`` in function signatures.
     Phase 2: Rewrite call sites (not yet implemented).
+
+    Identical sources (vendored or generated copies) are fixed once and
+    the result shared.  Files are independent, so batches of
+    ``PARALLEL_THRESHOLD`` or more unique sources are fixed in a process
+    pool of *jobs* workers (every CPU when ``None``); ``jobs=1`` stays
+    serial.
     """
     opts: KW001Options = config.rules.kw001
-    fixed_sources: dict[Path, str] = {}
+    unique: list[str] = list(dict.fromkeys(sources.values()))
+    items: list[tuple[str, KW001Options]] = [(source, opts) for source in unique]
+    workers: int = jobs if jobs is not None else (os.cpu_count() or 1)
+
+    fixed: list[str]
+    if workers > 1 and len(items) >= PARALLEL_THRESHOLD:
+        chunksize: int = max(1, len(items) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            fixed = list(executor.map(_fix_one, items, chunksize=chunksize))
+    else:
+        fixed = [_fix_one(item) for item in items]
+
+    by_source: dict[str, str] = dict(zip(unique, fixed, strict=True))
+    return FixResult(
+        sources={file_path: by_source[source] for file_path, source in sources.items()},
+    )
 
-    for file_path, source in sources.items():
-        fixed: str = _fix_signatures(source, opts=opts)
-        fixed_sources[file_path] = fixed
 
-    return FixResult(sources=fixed_sources)
+def _fix_one(item: tuple[str, KW001Options]) -> str:
+    """Fix a single source; module-level so it can be pickled for workers."""
+    source, opts = item
+    return _fix_signatures(source, opts=opts)
 
 
 def _fix_signatures(source: str, *, opts: KW001Options) -> str:
     """Insert ``*, `` in function signatures that need keyword-only params."""
+    # Cheap pre-filter: no function definitions, or too few commas for any
+    # signature to reach min_params, means nothing can be fixable
+    if _DEF_RE.search(source) is None:
+        return source
+    if opts.min_params >= 2 and "," not in source:
+        return source
+
     tree: ast.Module | None = parse_source(source)
     if tree is None:
         return source
@@ -64,36 +97,27 @@ def _fix_signatures(source: str, *, opts: KW001Options) -> str:
     if not visitor.fixable:
         return source
 
-    tokens: list[TokenInfo] = tokenize_source(source)
-    if not tokens:
-        return source
-
-    insertions: list[tuple[int, int, str]] = []
-
+    # AST columns are UTF-8 byte offsets, so splice in the encoded source
+    data: bytes = source.encode("utf-8")
+    offsets: list[int] = line_offsets(data)
+    edits: list[tuple[int, int, str]] = []
     for func_node in visitor.fixable:
-        insertion: tuple[int, int, str] | None = _find_star_insertion(
-            tokens, node=func_node,
+        edit: tuple[int, int, str] | None = _star_edit(
+            func_node, data=data, line_offsets=offsets,
         )
-        if insertion is not None:
-            insertions.append(insertion)
+        if edit is not None:
+            edits.append(edit)
 
-    if not insertions:
+    if not edits:
         return source
+    return apply_edits(source, edits)
 
-    lines: list[str] = source.splitlines(keepends=True)
-    for line_idx, col, text in sorted(insertions, reverse=True):
-        original_line: str = lines[line_idx]
-        lines[line_idx] = original_line[:col] + text + original_line[col:]
 
-    modified: str = "".join(lines)
-    if parse_source(modified) is None:
-        return source
-    return modified
-
-
-class _FixableVisitor(ast.NodeVisitor):
+class _FixableVisitor(DispatchVisitor):
     """Find functions that need a ``*`` separator inserted."""
 
+    __slots__ = ("_opts", "_class_depth", "fixable")
+
     def __init__(self, *, opts: KW001Options) -> None:
         self._opts: KW001Options = opts
         self._class_depth: int = 0
@@ -115,112 +139,62 @@ class _FixableVisitor(ast.NodeVisitor):
         self.generic_visit(node)
 
     def _is_fixable(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
-        if self._opts.exempt_dunder and _is_dunder(node.name):
-            return False
-        if self._opts.exempt_private and _is_private(node.name):
-            return False
-        if self._opts.exempt_overrides and _has_override_decorator(node):
-            return False
-        if node.args.kwonlyargs or node.args.vararg is not None:
+        # Structural checks first: they are cheap and reject most functions
+        # before the name and decorator exemptions need to run
+        args: ast.arguments = node.args
+        if args.kwonlyargs or args.vararg is not None:
             return False
 
-        is_method: bool = self._class_depth > 0
-        positional: list[ast.arg] = list(node.args.args)
+        positional: list[ast.arg] = args.args
         self_cls_offset: int = 0
-        if is_method and positional and positional[0].arg in ("self", "cls"):
+        if self._class_depth > 0 and positional and positional[0].arg in ("self", "cls"):
             self_cls_offset = 1
+        if len(positional) - self_cls_offset < self._opts.min_params:
+            return False
 
-        return len(positional) - self_cls_offset >= self._opts.min_params
+        if self._opts.exempt_dunder and _is_dunder(node.name):
+            return False
+        if self._opts.exempt_private and _is_private(node.name):
+            return False
+        return not (self._opts.exempt_overrides and _has_override_decorator(node))
 
 
-def _find_star_insertion(
-    tokens: list[TokenInfo],
-    *,
+def _star_edit(
     node: ast.FunctionDef | ast.AsyncFunctionDef,
+    *,
+    data: bytes,
+    line_offsets: list[int],
 ) -> tuple[int, int, str] | None:
     """
-    Find where to insert ``*, `` in a function's parameter list.
+    Find the byte-offset edit inserting ``*, `` in a function's parameter list.
 
-    Returns ``(line_0indexed, col, text_to_insert)`` or ``None``.
+    The separator goes right after the ``(`` or ``,`` that precedes the
+    first positional parameter after any leading ``self``/``cls``; after a
+    comma it keeps one space on each side.  When a comment or backslash
+    continuation separates the two, it goes directly before the parameter
+    instead.  Returns ``None`` if there is no such parameter.
     """
-    func_line: int = node.lineno
-    open_paren_idx: int | None = _find_def_open_paren(
-        tokens, func_line=func_line, name=node.name,
-    )
-    if open_paren_idx is None:
+    params: list[ast.arg] = node.args.args
+    skip: int = 1 if params and params[0].arg in ("self", "cls") else 0
+    if len(params) <= skip:
         return None
+    first: ast.arg = params[skip]
+    param_start: int = line_offsets[first.lineno - 1] + first.col_offset
 
-    has_self_cls: bool = bool(
-        node.args.args and node.args.args[0].arg in ("self", "cls")
-    )
-
-    if has_self_cls:
-        return _insert_after_first_param(tokens, paren_idx=open_paren_idx)
-    return _insert_after_open_paren(tokens, paren_idx=open_paren_idx)
+    delimiter_end: int = param_start
+    while delimiter_end > 0 and data[delimiter_end - 1] in b" \t\f\r\n":
+        delimiter_end -= 1
+    delimiter: bytes = data[delimiter_end - 1:delimiter_end]
+    gap: bytes = data[delimiter_end:param_start]
 
-
-def _find_def_open_paren(
-    tokens: list[TokenInfo],
-    *,
-    func_line: int,
-    name: str,
-) -> int | None:
-    """Find the index of the ``(`` token for a function definition."""
-    for token_idx, token in enumerate(tokens):
-        if (
-            token.type == tokenize.NAME
-            and token.string == "def"
-            and token.start[0] == func_line
-            and token_idx + 1 < len(tokens)
-            and tokens[token_idx + 1].string == name
-        ):
-            for search_idx in range(token_idx + 2, len(tokens)):
-                if tokens[search_idx].type == tokenize.OP and tokens[search_idx].string == "(":
-                    return search_idx
-            break
-    return None
-
-
-def _insert_after_open_paren(
-    tokens: list[TokenInfo],
-    *,
-    paren_idx: int,
-) -> tuple[int, int, str] | None:
-    """Insert ``*, `` right after the opening ``(``."""
-    paren_token: TokenInfo = tokens[paren_idx]
-    line_0indexed: int = paren_token.end[0] - 1
-    col: int = paren_token.end[1]
-    return (line_0indexed, col, "*, ")
-
-
-def _insert_after_first_param(
-    tokens: list[TokenInfo],
-    *,
-    paren_idx: int,
-) -> tuple[int, int, str] | None:
-    """Insert ``*, `` after the comma following the first parameter (self/cls)."""
-    depth: int = 0
-    for token_idx in range(paren_idx, len(tokens)):
-        token: TokenInfo = tokens[token_idx]
-        if token.type == tokenize.OP and token.string == "(":
-            depth += 1
-        elif token.type == tokenize.OP and token.string == ")":
-            depth -= 1
-            if depth == 0:
-                break
-        elif token.type == tokenize.OP and token.string == "," and depth == 1:
-            # Found the comma after self/cls — insert after it
-            line_0indexed: int = token.end[0] - 1
-            col: int = token.end[1]
-            next_idx: int = token_idx + 1
-            if next_idx < len(tokens) and tokens[next_idx].type == tokenize.NL:
-                next_idx += 1
-            if next_idx < len(tokens):
-                next_token: TokenInfo = tokens[next_idx]
-                if next_token.start[0] == token.end[0] and next_token.start[1] > token.end[1]:
-                    return (line_0indexed, col + 1, "*, ")
-            return (line_0indexed, col, " *, ")
-    return None
+    if delimiter == b"(":
+        return (delimiter_end, delimiter_end, "*, ")
+    if delimiter == b",":
+        if gap and b"\n" not in gap and b"\r" not in gap:
+            return (delimiter_end + 1, delimiter_end + 1, "*, ")
+        return (delimiter_end, delimiter_end, " *, ")
+    # A comment or line continuation sits before the parameter
+    return (param_start, param_start, "*, ")
 
 
 def _is_dunder(name: str) -> bool:
@@ -232,9 +206,8 @@ def _is_private(name: str) -> bool:
 
 
 def _has_override_decorator(node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
-    for decorator in node.decorator_list:
-        if isinstance(decorator, ast.Name) and decorator.id == "override":
-            return True
-        if isinstance(decorator, ast.Attribute) and decorator.attr == "override":
-            return True
-    return False
+    return any(
+        (isinstance(decorator, ast.Name) and decorator.id == "override")
+        or (isinstance(decorator, ast.Attribute) and decorator.attr == "override")
+        for decorator in node.decorator_list
+    )
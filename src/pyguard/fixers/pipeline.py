@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from pyguard.fixers._registry import apply_insertion_fixers
 from pyguard.fixers.imp001 import fix_local_imports
-from pyguard.fixers.typ002 import fix_missing_return_none
-from pyguard.fixers.typ003 import fix_missing_variable_annotations
+from pyguard.fixers.typ002 import ReturnNoneFixer
+from pyguard.fixers.typ003 import VariableAnnotationFixer
 from pyguard.fixers.typ010 import fix_legacy_typing
 
 
@@ -14,11 +15,13 @@ def fix_all(source: str) -> str:
     Order matters:
     1. TYP010 — modernize typing syntax, may remove imports (changes line count)
     2. IMP001 — move in-function imports to module level
-    3. TYP002 — add ``-> None`` to trivial functions
-    4. TYP003 — add variable type annotations
+    3. TYP002 + TYP003 — add ``-> None`` to trivial functions and
+       variable type annotations; both only insert text, so they share
+       a single parse, tree walk and tokenize pass
     """
     source = fix_legacy_typing(source)
     source = fix_local_imports(source)
-    source = fix_missing_return_none(source)
-    source = fix_missing_variable_annotations(source)
+    source = apply_insertion_fixers(
+        source, fixers=[ReturnNoneFixer(), VariableAnnotationFixer()],
+    )
     return source
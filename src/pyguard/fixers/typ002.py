@@ -5,7 +5,7 @@ import ast
 import tokenize
 from tokenize import TokenInfo
 
-from pyguard.fixers._util import apply_insertions, parse_source, tokenize_source
+from pyguard.fixers._registry import FixerRegistry, apply_insertion_fixers
 
 
 def fix_missing_return_none(source: str) -> str:
@@ -17,53 +17,34 @@ def fix_missing_return_none(source: str) -> str:
     - Function is not a generator (no yield / yield from)
     - Function is not a dunder method
     """
-    tree: ast.Module | None = parse_source(source)
-    if tree is None:
-        return source
+    return apply_insertion_fixers(source, fixers=[ReturnNoneFixer()])
 
-    visitor: _FixableVisitor = _FixableVisitor()
-    visitor.visit(tree)
 
-    if not visitor.fixable:
-        return source
-
-    tokens: list[TokenInfo] = tokenize_source(source)
-    if not tokens:
-        return source
-
-    insertions: list[tuple[int, int]] = []
-
-    for node in visitor.fixable:
-        pos: tuple[int, int] | None = _find_def_colon(tokens, node=node)
-        if pos is not None:
-            insertions.append(pos)
-
-    if not insertions:
-        return source
-
-    lines: list[str] = source.splitlines(keepends=True)
-    for line_idx, col in sorted(insertions, reverse=True):
-        line: str = lines[line_idx]
-        lines[line_idx] = line[:col] + " -> None" + line[col:]
-
-    return apply_insertions(source, lines)
-
-
-class _FixableVisitor(ast.NodeVisitor):
+class ReturnNoneFixer:
     """Find functions that can safely receive ``-> None`` annotation."""
 
     def __init__(self) -> None:
         self.fixable: list[ast.FunctionDef | ast.AsyncFunctionDef] = []
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        if _is_fixable(node):
-            self.fixable.append(node)
-        self.generic_visit(node)
+    @property
+    def pending(self) -> bool:
+        return bool(self.fixable)
 
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+    def register(self, registry: FixerRegistry) -> None:
+        registry.register(ast.FunctionDef, self._visit_function)
+        registry.register(ast.AsyncFunctionDef, self._visit_function)
+
+    def insertions(self, tokens: list[TokenInfo]) -> list[tuple[int, int, str]]:
+        result: list[tuple[int, int, str]] = []
+        for node in self.fixable:
+            pos: tuple[int, int] | None = _find_def_colon(tokens, node=node)
+            if pos is not None:
+                result.append((pos[0], pos[1], " -> None"))
+        return result
+
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
         if _is_fixable(node):
             self.fixable.append(node)
-        self.generic_visit(node)
 
 
 def _is_fixable(node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
@@ -5,7 +5,7 @@ import ast
 import tokenize
 from tokenize import TokenInfo
 
-from pyguard.fixers._util import apply_insertions, parse_source, tokenize_source
+from pyguard.fixers._registry import FixerRegistry, apply_insertion_fixers
 
 _BUILTIN_CONSTRUCTORS: frozenset[str] = frozenset({
     "int",
@@ -31,39 +31,40 @@ def fix_missing_variable_annotations(source: str) -> str:
     - The target name is not ``_``
     - The assigned value is a literal with obvious type or a builtin constructor call
     """
-    tree: ast.Module | None = parse_source(source)
-    if tree is None:
-        return source
+    return apply_insertion_fixers(source, fixers=[VariableAnnotationFixer()])
 
-    visitor: _FixableVisitor = _FixableVisitor()
-    visitor.visit(tree)
 
-    if not visitor.fixable:
-        return source
-
-    tokens: list[TokenInfo] = tokenize_source(source)
-    if not tokens:
-        return source
-
-    insertions: list[tuple[int, int, str]] = []
-
-    for node, type_name in visitor.fixable:
-        target: ast.Name = node.targets[0]  # type: ignore[assignment]
-        pos: tuple[int, int] | None = _find_name_token_end(
-            tokens, name=target.id, line=target.lineno, col=target.col_offset,
-        )
-        if pos is not None:
-            insertions.append((pos[0], pos[1], type_name))
-
-    if not insertions:
-        return source
-
-    lines: list[str] = source.splitlines(keepends=True)
-    for line_idx, col, type_name in sorted(insertions, reverse=True):
-        line: str = lines[line_idx]
-        lines[line_idx] = line[:col] + f": {type_name}" + line[col:]
+class VariableAnnotationFixer:
+    """Find assignments that can safely receive a type annotation."""
 
-    return apply_insertions(source, lines)
+    def __init__(self) -> None:
+        self.fixable: list[tuple[ast.Name, str]] = []
+
+    @property
+    def pending(self) -> bool:
+        return bool(self.fixable)
+
+    def register(self, registry: FixerRegistry) -> None:
+        registry.register(ast.Assign, self._visit_assign)
+
+    def insertions(self, tokens: list[TokenInfo]) -> list[tuple[int, int, str]]:
+        result: list[tuple[int, int, str]] = []
+        for target, type_name in self.fixable:
+            pos: tuple[int, int] | None = _find_name_token_end(
+                tokens, name=target.id, line=target.lineno, col=target.col_offset,
+            )
+            if pos is not None:
+                result.append((pos[0], pos[1], f": {type_name}"))
+        return result
+
+    def _visit_assign(self, node: ast.Assign) -> None:
+        if len(node.targets) != 1:
+            return
+        target: ast.expr = node.targets[0]
+        if isinstance(target, ast.Name) and target.id != "_":
+            type_name: str | None = _infer_type_annotation(node.value)
+            if type_name is not None:
+                self.fixable.append((target, type_name))
 
 
 def _infer_type_annotation(node: ast.expr) -> str | None:
@@ -100,24 +101,6 @@ def _infer_type_annotation(node: ast.expr) -> str | None:
     return None
 
 
-class _FixableVisitor(ast.NodeVisitor):
-    """Find assignments that can safely receive a type annotation."""
-
-    def __init__(self) -> None:
-        self.fixable: list[tuple[ast.Assign, str]] = []
-
-    def visit_Assign(self, node: ast.Assign) -> None:
-        if (
-            len(node.targets) == 1
-            and isinstance(node.targets[0], ast.Name)
-            and node.targets[0].id != "_"
-        ):
-            type_name: str | None = _infer_type_annotation(node.value)
-            if type_name is not None:
-                self.fixable.append((node, type_name))
-        self.generic_visit(node)
-
-
 def _find_name_token_end(
     tokens: list[TokenInfo],
     *,
@@ -1,13 +1,25 @@
 """Output formatters for PyGuard diagnostics."""
 from __future__ import annotations
 
+import functools
 import json
-from typing import Protocol
+from typing import Final, Protocol
 
-from pyguard.constants import OutputFormat
-from pyguard.diagnostics import DiagnosticCollection
+from pyguard.constants import OutputFormat, Severity
+from pyguard.diagnostics import DiagnosticCollection, SourceLocation
 from pyguard.types import PyGuardConfig
 
+# Looked up once per diagnostic instead of going through the enum descriptors.
+_SEVERITY_LABELS: Final[dict[Severity, str]] = {sev: sev.name for sev in Severity}
+_SEVERITY_VALUES: Final[dict[Severity, str]] = {sev: sev.value for sev in Severity}
+_PLURAL_SUFFIXES: Final[dict[int, str]] = {1: ""}
+
+
+@functools.lru_cache(maxsize=256)
+def _tag(severity: Severity, code: str) -> str:
+    """Return the shared ``SEVERITY [CODE]`` prefix for a diagnostic."""
+    return f"{_SEVERITY_LABELS[severity]} [{code}]"
+
 
 class Formatter(Protocol):
     def format(
@@ -26,20 +38,21 @@ class TextFormatter:
         config: PyGuardConfig,
     ) -> str:
         lines: list[str] = []
+        append = lines.append
+        show_source: bool = config.show_source
 
         for diag in diagnostics.sorted:
-            severity_str: str = diag.severity.value.upper()
-            line: str = (
-                f"{diag.file}:{diag.location.line}:{diag.location.column}: "
-                f"{severity_str} [{diag.code}] {diag.message}"
+            location: SourceLocation = diag.location
+            append(
+                f"{diag.file}:{location.line}:{location.column}: "
+                f"{_tag(diag.severity, diag.code)} {diag.message}"
             )
-            lines.append(line)
 
-            if config.show_source and diag.source_line is not None:
-                lines.append(f"    {diag.source_line}")
-                caret_pos: int = max(0, diag.location.column - 1)
-                lines.append(f"    {' ' * caret_pos}^")
-                lines.append("")
+            if show_source and diag.source_line is not None:
+                append("    " + diag.source_line)
+                # 4-space gutter plus (column - 1) spaces of padding
+                append(" " * (max(1, location.column) + 3) + "^")
+                append("")
 
         return "\n".join(lines)
 
@@ -52,6 +65,7 @@ class JsonFormatter:
         config: PyGuardConfig,
     ) -> str:
         items: list[dict[str, object]] = []
+        values: dict[Severity, str] = _SEVERITY_VALUES
 
         for diag in diagnostics.sorted:
             item: dict[str, object] = {
@@ -61,14 +75,14 @@ class JsonFormatter:
                 "end_line": diag.location.end_line,
                 "end_column": diag.location.end_column,
                 "code": diag.code,
-                "severity": diag.severity.value,
+                "severity": values[diag.severity],
                 "message": diag.message,
             }
             if config.show_source:
                 item["source_line"] = diag.source_line
             items.append(item)
 
-        return json.dumps(items, indent=2)
+        return json.dumps(items, separators=(",", ":"))
 
 
 def get_formatter(*, output_format: OutputFormat) -> Formatter:
@@ -83,9 +97,9 @@ def format_summary(*, diagnostics: DiagnosticCollection) -> str:
 
     parts: list[str] = []
     if error_count > 0:
-        parts.append(f"{error_count} error{'s' if error_count != 1 else ''}")
+        parts.append(f"{error_count} error{_PLURAL_SUFFIXES.get(error_count, 's')}")
     if warning_count > 0:
-        parts.append(f"{warning_count} warning{'s' if warning_count != 1 else ''}")
+        parts.append(f"{warning_count} warning{_PLURAL_SUFFIXES.get(warning_count, 's')}")
 
     if not parts:
         return "No issues found."
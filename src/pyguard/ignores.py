@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import ast
-import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Final
@@ -12,12 +12,13 @@ from pyguard.diagnostics import Diagnostic, SourceLocation
 from pyguard.parser import ParseResult
 from pyguard.types import IgnoreGovernance
 
-_IGNORE_PATTERN: Final[re.Pattern[str]] = re.compile(
-    r"#\s*pyguard:\s*ignore\[([^\]]+)\](?:\s+because:\s*(.+))?$"
-)
-_IGNORE_FILE_PATTERN: Final[re.Pattern[str]] = re.compile(
-    r"#\s*pyguard:\s*ignore-file\[([^\]]+)\](?:\s+because:\s*(.+))?$"
-)
+# Directive grammar: ``# pyguard: ignore[CODES]`` or
+# ``# pyguard: ignore-file[CODES]``, optionally followed by
+# ``because: REASON``.  Matched by ``_scan_directive`` without regexes.
+_DIRECTIVE_MARKER: Final[str] = "pyguard:"
+_IGNORE_KEYWORD: Final[str] = "ignore["
+_IGNORE_FILE_KEYWORD: Final[str] = "ignore-file["
+_REASON_KEYWORD: Final[str] = "because:"
 
 
 @dataclass(frozen=True, slots=True)
@@ -36,31 +37,35 @@ def parse_ignore_directives(
     directives: list[IgnoreDirective] = []
 
     for idx, line_text in enumerate(source_lines):
+        if _DIRECTIVE_MARKER not in line_text:
+            continue
         line_num: int = idx + 1
 
-        file_match: re.Match[str] | None = _IGNORE_FILE_PATTERN.search(line_text)
+        file_match: tuple[int, str, str | None] | None = _scan_directive(
+            line_text, keyword=_IGNORE_FILE_KEYWORD,
+        )
         if file_match is not None:
-            codes: frozenset[str] = _parse_codes(file_match.group(1))
-            reason: str | None = _clean_reason(file_match.group(2))
+            _, raw_codes, raw_reason = file_match
             directives.append(IgnoreDirective(
                 line=line_num,
-                codes=codes,
-                reason=reason,
+                codes=_parse_codes(raw_codes),
+                reason=_clean_reason(raw_reason),
                 is_file_level=True,
                 is_inline=False,
             ))
             continue
 
-        match: re.Match[str] | None = _IGNORE_PATTERN.search(line_text)
+        match: tuple[int, str, str | None] | None = _scan_directive(
+            line_text, keyword=_IGNORE_KEYWORD,
+        )
         if match is not None:
-            codes = _parse_codes(match.group(1))
-            reason = _clean_reason(match.group(2))
-            before_comment: str = line_text[:match.start()].strip()
+            comment_start, raw_codes, raw_reason = match
+            before_comment: str = line_text[:comment_start].strip()
             is_inline: bool = len(before_comment) > 0
             directives.append(IgnoreDirective(
                 line=line_num,
-                codes=codes,
-                reason=reason,
+                codes=_parse_codes(raw_codes),
+                reason=_clean_reason(raw_reason),
                 is_file_level=False,
                 is_inline=is_inline,
             ))
@@ -75,6 +80,11 @@ def apply_ignores(
     governance: IgnoreGovernance,
 ) -> list[Diagnostic]:
     """Also enforces governance rules — returned list may include IGN0xx violations."""
+    # One scan of the whole source rules out the common no-directive case
+    # without walking source_lines in Python
+    if _DIRECTIVE_MARKER not in parse_result.source:
+        return diagnostics
+
     directives: list[IgnoreDirective] = parse_ignore_directives(
         source_lines=parse_result.source_lines,
     )
@@ -89,40 +99,22 @@ def apply_ignores(
         source_lines=parse_result.source_lines,
     )
 
-    file_codes: frozenset[str] = frozenset()
-    for d in directives:
-        if d.is_file_level:
-            file_codes = file_codes | d.codes
-
-    line_ignores: dict[int, frozenset[str]] = {}
-    for d in directives:
-        if not d.is_file_level and d.is_inline:
-            existing: frozenset[str] = line_ignores.get(d.line, frozenset())
-            line_ignores[d.line] = existing | d.codes
-
-    block_ranges: list[tuple[int, int, frozenset[str]]] = _resolve_block_ranges(
+    index: _IgnoreIndex = _build_ignore_index(
         directives=directives,
         tree=parse_result.tree,
     )
+    file_codes: frozenset[str] = index.file_codes
+    line_codes: dict[int, frozenset[str]] = index.line_codes
 
     disallowed: frozenset[str] = governance.disallow
     kept: list[Diagnostic] = []
     for diag in diagnostics:
-        if diag.code in disallowed:
+        code: str = diag.code
+        if code in disallowed:
             kept.append(diag)
             continue
 
-        if diag.code in file_codes:
-            continue
-
-        line_codes: frozenset[str] | None = line_ignores.get(diag.location.line)
-        if line_codes is not None and diag.code in line_codes:
-            continue
-
-        if any(
-            start <= diag.location.line <= end and diag.code in codes
-            for start, end, codes in block_ranges
-        ):
+        if code in file_codes or code in line_codes.get(diag.location.line, ()):
             continue
 
         kept.append(diag)
@@ -130,8 +122,96 @@ def apply_ignores(
     return governance_violations + kept
 
 
+def _scan_directive(
+    line: str,
+    *,
+    keyword: str,
+) -> tuple[int, str, str | None] | None:
+    """Find the first ``# pyguard: <keyword>CODES]`` comment in *line*.
+
+    Returns ``(comment_start, raw_codes, raw_reason)``.  The directive
+    must run to the end of the line, either directly after ``]`` or via
+    whitespace, ``because:`` and a non-empty reason.
+    """
+    start: int = line.find("#")
+    while start != -1:
+        pos: int = _skip_whitespace(line, start + 1)
+        if line.startswith(_DIRECTIVE_MARKER, pos):
+            pos = _skip_whitespace(line, pos + len(_DIRECTIVE_MARKER))
+            if line.startswith(keyword, pos):
+                pos += len(keyword)
+                close: int = line.find("]", pos)
+                if close > pos:
+                    rest: str = line[close + 1:]
+                    if not rest:
+                        return (start, line[pos:close], None)
+                    clause: str = rest.lstrip()
+                    if len(clause) < len(rest) and clause.startswith(_REASON_KEYWORD):
+                        reason: str = clause[len(_REASON_KEYWORD):]
+                        if reason:
+                            return (start, line[pos:close], reason)
+        start = line.find("#", start + 1)
+    return None
+
+
+def _skip_whitespace(line: str, pos: int) -> int:
+    end: int = len(line)
+    while pos < end and line[pos].isspace():
+        pos += 1
+    return pos
+
+
+@dataclass(frozen=True, slots=True)
+class _IgnoreIndex:
+    """Suppressed codes for a file, resolved once per ``apply_ignores`` call."""
+
+    file_codes: frozenset[str]
+    line_codes: dict[int, frozenset[str]]
+
+
+def _build_ignore_index(
+    *,
+    directives: list[IgnoreDirective],
+    tree: ast.Module | None,
+) -> _IgnoreIndex:
+    """Fold file, inline and block directives into O(1) lookups.
+
+    Block ranges are expanded to the lines they cover, so filtering a
+    diagnostic no longer scans every block directive.  A bisect over
+    block starts would not do: block ranges nest (a class and a method
+    inside it), so the nearest preceding start is not always the only
+    enclosing one.
+    """
+    file_codes: frozenset[str] = frozenset()
+    line_codes: dict[int, frozenset[str]] = {}
+    for d in directives:
+        if d.is_file_level:
+            file_codes = file_codes | d.codes
+        elif d.is_inline:
+            _add_line_codes(line_codes, d.line, d.codes)
+
+    for start, end, codes in _resolve_block_ranges(directives=directives, tree=tree):
+        for line in range(start, end + 1):
+            _add_line_codes(line_codes, line, codes)
+
+    return _IgnoreIndex(file_codes=file_codes, line_codes=line_codes)
+
+
+def _add_line_codes(
+    line_codes: dict[int, frozenset[str]], line: int, codes: frozenset[str],
+) -> None:
+    # Share the directive's own set until a second directive covers the
+    # line, so expanding a large block allocates nothing per line
+    existing: frozenset[str] | None = line_codes.get(line)
+    line_codes[line] = codes if existing is None else existing | codes
+
+
 def _parse_codes(raw: str) -> frozenset[str]:
-    return frozenset(c.strip().upper() for c in raw.split(",") if c.strip())
+    # Interned so they share storage with the rule-code literals they are
+    # compared against
+    return frozenset(
+        sys.intern(c.strip().upper()) for c in raw.split(",") if c.strip()
+    )
 
 
 def _clean_reason(raw: str | None) -> str | None:
@@ -9,6 +9,8 @@ from pyguard.diagnostics import Diagnostic, SourceLocation
 from pyguard.parser import ParseResult
 from pyguard.types import PyGuardConfig
 
+_TYPING_MODULE: str = "typing"
+
 _LEGACY_NAMES: frozenset[str] = frozenset({
     "Optional",
     "Union",
@@ -45,6 +47,10 @@ class TYP010Rule:
     ) -> list[Diagnostic]:
         if parse_result.tree is None:
             return []
+        # Both legacy spellings need the word "typing" in the source (the
+        # import or the module prefix), so most modules skip the walk
+        if _TYPING_MODULE not in parse_result.source:
+            return []
         visitor: _Visitor = _Visitor(
             config=config,
             file=parse_result.file,
@@ -71,7 +77,7 @@ class _Visitor(ast.NodeVisitor):
         self.diagnostics: list[Diagnostic] = []
 
     def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
-        if node.module == "typing" and node.names:
+        if node.module == _TYPING_MODULE and node.names:
             for alias in node.names:
                 if alias.name in _LEGACY_NAMES:
                     self._typing_imports.add(alias.asname or alias.name)
@@ -150,7 +156,7 @@ class _Visitor(ast.NodeVisitor):
         if (
             isinstance(value, ast.Attribute)
             and isinstance(value.value, ast.Name)
-            and value.value.id == "typing"
+            and value.value.id == _TYPING_MODULE
             and value.attr in _LEGACY_NAMES
         ):
             return value.attr
@@ -236,7 +242,7 @@ def _get_legacy_name_static(
     if (
         isinstance(value, ast.Attribute)
         and isinstance(value.value, ast.Name)
-        and value.value.id == "typing"
+        and value.value.id == _TYPING_MODULE
         and value.attr in _LEGACY_NAMES
     ):
         return value.attr
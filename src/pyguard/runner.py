@@ -4,11 +4,14 @@ from __future__ import annotations
 import difflib
 import logging
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
-from pyguard.constants import SYNTAX_ERROR_CODE, Severity
+from pyguard.constants import PARALLEL_THRESHOLD, SYNTAX_ERROR_CODE, Severity
 from pyguard.diagnostics import Diagnostic, DiagnosticCollection, SourceLocation
+from pyguard.fixers._util import clear_parse_cache
+from pyguard.fixers.imp001 import clear_fix_cache
 from pyguard.fixers.pipeline import fix_all
 from pyguard.formatters import Formatter, format_summary, get_formatter
 from pyguard.ignores import apply_ignores
@@ -96,24 +99,65 @@ def lint_paths(*, paths: tuple[Path, ...], config: PyGuardConfig) -> LintResult:
     )
 
 
-def fix_paths(*, paths: tuple[Path, ...], config: PyGuardConfig) -> FixResult:
-    """Apply all safe autofixes to files matching the config patterns."""
+def _fix_file(file: Path) -> tuple[str, str] | None:
+    """Read and fix one file, returning ``(old, new)`` if it would change.
+
+    Module-level so it can be pickled for worker processes.
+    """
+    try:
+        old: str = file.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    new: str = fix_all(old)
+    if new == old:
+        return None
+    return (old, new)
+
+
+def fix_paths(
+    *,
+    paths: tuple[Path, ...],
+    config: PyGuardConfig,
+    jobs: int = 1,
+) -> FixResult:
+    """Apply all safe autofixes to files matching the config patterns.
+
+    With ``jobs > 1`` directories are scanned on threads, and batches of
+    ``PARALLEL_THRESHOLD`` or more files are fixed in a process pool;
+    results are collected in scan order so output stays deterministic.
+    """
     t0: float = time.monotonic()
-    files: list[Path] = scan_files(paths=paths, config=config)
+    files: list[Path] = scan_files(paths=paths, config=config, jobs=jobs)
     logger.info("Found %d files to fix", len(files))
     changes: dict[Path, tuple[str, str]] = {}
 
-    for file in files:
-        logger.debug("Fixing %s", file)
-        try:
-            old: str = file.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
-            continue
-
-        new: str = fix_all(old)
-        if new != old:
+    results: list[tuple[str, str] | None]
+    if jobs > 1 and len(files) >= PARALLEL_THRESHOLD:
+        workers: int = min(jobs, len(files))
+        chunksize: int = max(1, len(files) // (4 * workers))
+        logger.debug("Fixing with %d workers", workers)
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for file, result in zip(
+                files, executor.map(_fix_file, files, chunksize=chunksize), strict=True,
+            ):
+                logger.debug("Fixed %s", file)
+                results.append(result)
+    else:
+        results = []
+        for file in files:
+            logger.debug("Fixing %s", file)
+            results.append(_fix_file(file))
+        # Workers parse and fix in their own processes; only a serial run
+        # fills this process's caches
+        clear_parse_cache()
+        clear_fix_cache()
+
+    for file, change in zip(files, results, strict=True):
+        if change is not None:
             logger.debug("  Changed: %s", file)
-            changes[file] = (old, new)
+            changes[file] = change
 
     elapsed: float = time.monotonic() - t0
     logger.info(
@@ -1,139 +1,480 @@
 """File discovery for PyGuard using glob patterns."""
 from __future__ import annotations
 
+import contextlib
+import fnmatch
+import functools
 import logging
-from fnmatch import fnmatch
+import os
+import re
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TypeAlias
 
 from pyguard.types import PyGuardConfig
 
 logger: logging.Logger = logging.getLogger("pyguard.scanner")
 
 
-def _matches_pattern(*, path: Path, patterns: tuple[str, ...], base: Path) -> bool:
-    """Check if path matches any of the glob patterns."""
+_GlobMatcher: TypeAlias = Callable[[str], bool]
+
+
+def _relative_posix(*, path: Path, base: Path) -> str:
+    """Return *path* relative to *base* (when inside it) with ``/`` separators."""
     try:
         rel_path: Path = path.relative_to(base)
     except ValueError:
         rel_path = path
 
-    rel_str: str = str(rel_path).replace("\\", "/")
+    return str(rel_path).replace("\\", "/")
+
+
+def _matches_any(*, path: str, matchers: tuple[_GlobMatcher, ...]) -> bool:
+    """Check if a relative POSIX path matches any compiled glob."""
+    return any(matcher(path) for matcher in matchers)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_globs(patterns: tuple[str, ...]) -> tuple[_GlobMatcher, ...]:
+    """Compile a config's include or exclude patterns once.
+
+    Two or more literal ``**/name/**`` patterns share one set lookup.
+    """
+    names: frozenset[str] = frozenset(
+        os.path.normcase(pattern[3:-3]) for pattern in patterns if _is_component_literal(pattern)
+    )
+    if len(names) < 2:
+        return tuple(_compile_glob(pattern) for pattern in patterns)
+    rest: tuple[_GlobMatcher, ...] = tuple(
+        _compile_glob(pattern) for pattern in patterns if not _is_component_literal(pattern)
+    )
+    return (_component_set_matcher(names, last=False), *rest)
+
+
+def _fnmatcher(pattern: str) -> _GlobMatcher:
+    """Precompile *pattern* with the same semantics as :func:`fnmatch.fnmatch`."""
+    match: Callable[[str], re.Match[str] | None] = re.compile(
+        fnmatch.translate(os.path.normcase(pattern))
+    ).match
+    normcase: Callable[[str], str] = os.path.normcase
+
+    def matcher(name: str) -> bool:
+        return match(normcase(name)) is not None
+
+    return matcher
+
+
+def _is_literal(text: str) -> bool:
+    """Check that *text* is one path segment with no glob magic."""
+    return bool(text) and not any(c in text for c in "*?[\\/")
+
+
+def _component_matcher(name: str, *, last: bool) -> _GlobMatcher:
+    """Match paths with a directory component equal to the literal *name*.
+
+    With *last* the final component counts too (for directory paths).
+    A single substring test replaces splitting the path and running fnmatch
+    on every part.
+    """
+    needle: str = os.path.normcase(f"/{name}/")
+    normcase: Callable[[str], str] = os.path.normcase
+    tail: str = "/" if last else ""
+
+    def match(path: str) -> bool:
+        return needle in normcase(f"/{path}{tail}")
+
+    return match
+
+
+def _component_set_matcher(names: frozenset[str], *, last: bool) -> _GlobMatcher:
+    """Match paths with a directory component in the normcased *names*.
+
+    One set lookup per component replaces a test per pattern, so long
+    lists of ``**/name/**`` excludes cost the same as a single one.
+    """
+    normcase: Callable[[str], str] = os.path.normcase
+
+    def match(path: str) -> bool:
+        parts: list[str] = path.split("/")
+        if not last:
+            parts.pop()
+        return any(normcase(part) in names for part in parts)
+
+    return match
+
+
+def _is_component_literal(pattern: str) -> bool:
+    """Check for the ``**/name/**`` shape with a literal *name*."""
+    return pattern.startswith("**/") and pattern.endswith("/**") and _is_literal(pattern[3:-3])
+
+
+def _component_prefix_matcher(prefix: str) -> _GlobMatcher:
+    """Match paths with any component starting with the literal *prefix*."""
+    needle: str = os.path.normcase(f"/{prefix}")
+    normcase: Callable[[str], str] = os.path.normcase
 
-    return any(_glob_match(path=rel_str, pattern=pattern) for pattern in patterns)
+    def match(path: str) -> bool:
+        return needle in normcase(f"/{path}")
 
+    return match
 
-def _glob_match(*, path: str, pattern: str) -> bool:
-    """Match a path against a glob pattern with ** support."""
-    if "**" in pattern:
-        return _match_doublestar(path=path, pattern=pattern)
-    return fnmatch(path, pattern)
 
+def _compile_glob(pattern: str) -> _GlobMatcher:
+    """Build a matcher for a glob pattern with ** support.
 
-def _match_doublestar(*, path: str, pattern: str) -> bool:
-    """Match path against pattern containing **."""
-    parts: list[str] = path.split("/")
+    The pattern's shape is classified and its fnmatch pieces compiled once,
+    so matching a path only splits it and runs precompiled regexes.
+    """
+    if "**" not in pattern:
+        return _fnmatcher(pattern)
 
     # Pattern like "**/*.py" - match any .py file at any depth
     if pattern == "**/*.py":
-        return path.endswith(".py")
+        return lambda path: path.endswith(".py")
 
     # Pattern like "**/name/**" - check if name is in path components
     if pattern.startswith("**/") and pattern.endswith("/**"):
-        middle: str = pattern[3:-3]  # Strip **/ and /**
+        if _is_component_literal(pattern):
+            return _component_matcher(pattern[3:-3], last=False)
         # Handle wildcards in middle (e.g., ".*" for dotfiles)
-        return any(fnmatch(part, middle) for part in parts[:-1])
+        middle: _GlobMatcher = _fnmatcher(pattern[3:-3])  # Strip **/ and /**
+
+        def match_component(path: str) -> bool:
+            return any(middle(part) for part in path.split("/")[:-1])
+
+        return match_component
 
     # Pattern like "**/name" - check if any suffix matches
     if pattern.startswith("**/"):
-        suffix: str = pattern[3:]  # Strip **/
-        for i in range(len(parts)):
-            candidate: str = "/".join(parts[i:])
-            if fnmatch(candidate, suffix):
-                return True
-        return False
+        # A literal stem plus "*" (e.g. "**/.*") matches exactly when some
+        # component starts with the stem, since "*" also spans "/"
+        if pattern.endswith("*") and _is_literal(pattern[3:-1]):
+            return _component_prefix_matcher(pattern[3:-1])
+        suffix: _GlobMatcher = _fnmatcher(pattern[3:])  # Strip **/
+
+        def match_suffix(path: str) -> bool:
+            parts: list[str] = path.split("/")
+            return any(suffix("/".join(parts[i:])) for i in range(len(parts)))
+
+        return match_suffix
 
     # Pattern like "prefix/**/*.py" - prefix must match, then any .py
     if "/**/" in pattern:
         prefix: str
         tail: str
         prefix, tail = pattern.split("/**/", 1)
-        # Try each split point: fnmatch supports wildcards in prefix
-        for i in range(1, len(parts)):
-            prefix_candidate: str = "/".join(parts[:i])
-            if fnmatch(prefix_candidate, prefix):
-                remainder_parts: list[str] = parts[i:]
-                return any(
-                    fnmatch("/".join(remainder_parts[j:]), tail)
-                    for j in range(len(remainder_parts))
-                )
-        return False
+        # fnmatch supports wildcards in prefix
+        prefix_match: _GlobMatcher = _fnmatcher(prefix)
+        tail_match: _GlobMatcher = _fnmatcher(tail)
+
+        def match_nested(path: str) -> bool:
+            parts: list[str] = path.split("/")
+            # Try each split point; only the first matching prefix counts
+            for i in range(1, len(parts)):
+                if prefix_match("/".join(parts[:i])):
+                    remainder_parts: list[str] = parts[i:]
+                    return any(
+                        tail_match("/".join(remainder_parts[j:]))
+                        for j in range(len(remainder_parts))
+                    )
+            return False
+
+        return match_nested
 
     # Pattern like "prefix/**" - anything under prefix
     if pattern.endswith("/**"):
-        prefix = pattern[:-3]  # Strip /**
         # fnmatch supports wildcards in prefix (e.g., "*.egg-info/**")
-        for i in range(1, len(parts)):
-            if fnmatch("/".join(parts[:i]), prefix):
-                return True
-        return fnmatch(path, prefix)
+        under: _GlobMatcher = _fnmatcher(pattern[:-3])  # Strip /**
+
+        def match_under(path: str) -> bool:
+            parts: list[str] = path.split("/")
+            for i in range(1, len(parts)):
+                if under("/".join(parts[:i])):
+                    return True
+            return under(path)
+
+        return match_under
 
     # Fallback to fnmatch
-    return fnmatch(path, pattern)
+    return _fnmatcher(pattern)
+
+
+def _compile_dir_prune(pattern: str) -> _GlobMatcher | None:
+    """Build a test for directories whose whole subtree *pattern* excludes.
+
+    Only the ``**/name/**``, ``**/stem*`` and ``prefix/**`` shapes qualify:
+    for those, matching a directory's relative path is the same as matching
+    every file below it.  Other shapes return ``None`` and are left to the
+    per-file filter.
+    """
+    if "**" not in pattern or pattern == "**/*.py":
+        return None
+
+    if pattern.startswith("**/") and pattern.endswith("/**"):
+        if _is_component_literal(pattern):
+            return _component_matcher(pattern[3:-3], last=True)
+        middle: _GlobMatcher = _fnmatcher(pattern[3:-3])
+
+        def prune_component(rel_dir: str) -> bool:
+            return any(middle(part) for part in rel_dir.split("/"))
 
+        return prune_component
 
-def _collect_python_files(*, path: Path) -> list[Path]:
-    """Recursively collect all .py files under a path."""
+    if pattern.startswith("**/") and pattern.endswith("*") and _is_literal(pattern[3:-1]):
+        return _component_prefix_matcher(pattern[3:-1])
+
+    if pattern.startswith("**/") or "/**/" in pattern or not pattern.endswith("/**"):
+        return None
+
+    under: _GlobMatcher = _fnmatcher(pattern[:-3])
+
+    def prune_under(rel_dir: str) -> bool:
+        parts: list[str] = rel_dir.split("/")
+        return any(under("/".join(parts[:i])) for i in range(1, len(parts) + 1))
+
+    return prune_under
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_dir_prunes(patterns: tuple[str, ...]) -> tuple[_GlobMatcher, ...]:
+    """Compile the directory tests for a config's exclude patterns once.
+
+    Two or more literal ``**/name/**`` patterns share one set lookup.
+    """
+    names: frozenset[str] = frozenset(
+        os.path.normcase(pattern[3:-3]) for pattern in patterns if _is_component_literal(pattern)
+    )
+    grouped: bool = len(names) > 1
+    prunes: list[_GlobMatcher | None] = [
+        _compile_dir_prune(pattern)
+        for pattern in patterns
+        if not (grouped and _is_component_literal(pattern))
+    ]
+    if grouped:
+        prunes.append(_component_set_matcher(names, last=True))
+    return tuple(prune for prune in prunes if prune is not None)
+
+
+def _base_for(*, path: Path, roots: tuple[tuple[Path, bool], ...]) -> Path | None:
+    """Return the base that *path* is matched against, as ``scan_files`` does.
+
+    *roots* holds each resolved input with whether it is a file.  The first
+    input containing *path* wins; a file input is its own parent's base.
+    """
+    for root, is_file in roots:
+        if is_file:
+            if path == root:
+                return root.parent
+        elif path.is_relative_to(root):
+            return root
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class _Listing:
+    """One directory's .py files and the subdirectories still to walk."""
+
+    files: list[Path]
+    subdirs: list[str]
+
+
+def _scan_directory(directory: str, *, prune: _GlobMatcher) -> _Listing:
+    """List one directory, skipping subdirectories *prune* accepts.
+
+    Entry types come from the ``DirEntry`` objects ``os.scandir`` yields, so
+    a plain tree is listed without a ``stat`` per entry.  Symlinks are
+    followed, matching ``Path.is_file``/``Path.is_dir``.
+    """
+    files: list[Path] = []
+    subdirs: list[str] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name: str = entry.name
+            if name.endswith(".py") and name != ".py" and entry.is_file():
+                files.append(Path(entry.path))
+            elif entry.is_dir() and not prune(entry.path):
+                subdirs.append(entry.path)
+    return _Listing(files=files, subdirs=subdirs)
+
+
+def _collect_python_files(
+    *, directories: list[str], prune: _GlobMatcher, executor: Executor | None,
+) -> list[Path]:
+    """Collect all .py files under *directories*, skipping those *prune* accepts.
+
+    The tree is listed one depth at a time; with an *executor* each depth's
+    directories are listed concurrently, since ``scandir`` releases the GIL.
+    """
+    scan: Callable[[str], _Listing] = functools.partial(
+        _scan_directory, prune=prune
+    )
     files: list[Path] = []
-    if path.is_file():
-        if path.suffix == ".py":
-            files.append(path)
-    elif path.is_dir():
-        for child in path.iterdir():
-            files.extend(_collect_python_files(path=child))
+    pending: list[str] = directories
+    while pending:
+        listings: Iterable[_Listing] = (
+            map(scan, pending) if executor is None else executor.map(scan, pending)
+        )
+        subdirs: list[str] = []
+        for listing in listings:
+            files.extend(listing.files)
+            subdirs.extend(listing.subdirs)
+        pending = subdirs
     return files
 
 
-def scan_files(*, paths: tuple[Path, ...], config: PyGuardConfig) -> list[Path]:
+def _literal_dir_prefix(pattern: str) -> tuple[str, ...]:
+    """Return the leading directory segments of *pattern* that hold no wildcards.
+
+    A path can only match the pattern if it starts with these directories,
+    so the walk never needs to look anywhere else.
+    """
+    prefix: list[str] = []
+    for segment in pattern.split("/")[:-1]:
+        if segment in (".", "..") or not _is_literal(segment):
+            break
+        prefix.append(segment)
+    return tuple(prefix)
+
+
+def _walk_prefixes(patterns: tuple[str, ...]) -> list[tuple[str, ...]]:
+    """Return the minimal set of literal directory prefixes covering *patterns*."""
+    prefixes: list[tuple[str, ...]] = sorted(
+        {_literal_dir_prefix(pattern) for pattern in patterns}, key=len
+    )
+    covering: list[tuple[str, ...]] = []
+    for prefix in prefixes:
+        if not any(prefix[: len(kept)] == kept for kept in covering):
+            covering.append(prefix)
+    return covering
+
+
+def _prefix_paths(
+    *, root: Path, prefix: tuple[str, ...], prune: _GlobMatcher,
+) -> list[Path]:
+    """Return the entries that spell *prefix* under *root*.
+
+    Names are compared like fnmatch compares them (after normcase), using
+    on-disk entries rather than joined paths, so case-insensitive
+    filesystems select exactly what a full walk would have matched.
+    """
+    current: list[Path] = [root]
+    for segment in prefix:
+        wanted: str = os.path.normcase(segment)
+        current = [
+            child
+            for directory in current
+            if directory.is_dir()
+            for child in directory.iterdir()
+            if os.path.normcase(child.name) == wanted and not prune(str(child))
+        ]
+    return current
+
+
+def _walk_roots(
+    *, roots: tuple[tuple[Path, bool], ...], config: PyGuardConfig, jobs: int,
+) -> list[Path]:
+    """Collect candidate .py files from resolved inputs.
+
+    *roots* holds each resolved input with whether it is a file; with
+    ``jobs > 1`` directories are listed on that many threads.
+    """
+    dir_prunes: tuple[_GlobMatcher, ...] = _compile_dir_prunes(config.exclude)
+
+    def prune(dir_path: str) -> bool:
+        # A directory holding another input is matched against that input
+        # for some of its files, so only prune directories free of inputs
+        if not dir_prunes:
+            return False
+        directory: Path = Path(dir_path)
+        if any(root.is_relative_to(directory) for root, _ in roots):
+            return False
+        base: Path | None = _base_for(path=directory, roots=roots)
+        if base is None:
+            return False
+        rel_dir: str = _relative_posix(path=directory, base=base)
+        if _matches_any(path=rel_dir, matchers=dir_prunes):
+            logger.debug("Excluded %s", directory)
+            return True
+        return False
+
+    # Only directories named by a literal include prefix (e.g. "src" in
+    # "src/**/*.py") can hold matching files, so skip everything else
+    prefixes: list[tuple[str, ...]] = _walk_prefixes(config.include)
+
+    files: list[Path] = []
+    directories: list[str] = []
+    for resolved, is_file in roots:
+        if is_file:
+            if resolved.suffix == ".py":
+                files.append(resolved)
+        elif resolved.is_dir():
+            for prefix in prefixes:
+                for path in _prefix_paths(root=resolved, prefix=prefix, prune=prune):
+                    if path.is_dir():
+                        directories.append(str(path))
+                    elif path.suffix == ".py" and path.is_file():
+                        files.append(path)
+
+    with contextlib.ExitStack() as stack:
+        executor: Executor | None = None
+        if jobs > 1 and directories:
+            logger.debug("Scanning with %d threads", jobs)
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=jobs))
+        files.extend(
+            _collect_python_files(directories=directories, prune=prune, executor=executor)
+        )
+    return files
+
+
+def scan_files(
+    *, paths: tuple[Path, ...], config: PyGuardConfig, jobs: int = 1,
+) -> list[Path]:
     """
     Find Python files matching include/exclude patterns.
 
     Args:
         paths: Root paths to scan (files or directories).
         config: PyGuard configuration with include/exclude patterns.
+        jobs: Threads used to list directories; 1 walks sequentially.
 
     Returns:
         Sorted list of Python files to lint.
     """
-    all_files: list[Path] = []
+    # Resolve every input once; the per-file base lookup below reuses these
+    roots: tuple[tuple[Path, bool], ...] = tuple(
+        (resolved, resolved.is_file()) for resolved in (path.resolve() for path in paths)
+    )
 
-    for path in paths:
-        resolved: Path = path.resolve()
-        all_files.extend(_collect_python_files(path=resolved))
+    candidates: list[tuple[Path, str]]
+    if all(is_file for _, is_file in roots):
+        # Each file input is matched by its own name: nothing to walk and
+        # no base to look up
+        candidates = [(root, root.name) for root, _ in roots if root.suffix == ".py"]
+    else:
+        candidates = [
+            (
+                file_path,
+                _relative_posix(
+                    path=file_path,
+                    base=_base_for(path=file_path, roots=roots) or file_path.parent,
+                ),
+            )
+            for file_path in _walk_roots(roots=roots, config=config, jobs=jobs)
+        ]
 
-    filtered: set[Path] = set()
-    for file_path in all_files:
-        base: Path = file_path.parent
-        for input_path in paths:
-            resolved_input: Path = input_path.resolve()
-            # If input was a file (not directory), use its parent as base
-            if resolved_input.is_file():
-                if file_path == resolved_input:
-                    base = resolved_input.parent
-                    break
-            else:
-                try:
-                    file_path.relative_to(resolved_input)
-                    base = resolved_input
-                    break
-                except ValueError:
-                    continue
+    excludes: tuple[_GlobMatcher, ...] = _compile_globs(config.exclude)
+    includes: tuple[_GlobMatcher, ...] = _compile_globs(config.include)
 
+    filtered: set[Path] = set()
+    for file_path, rel_str in candidates:
         # Exclusions take priority
-        if _matches_pattern(path=file_path, patterns=config.exclude, base=base):
+        if _matches_any(path=rel_str, matchers=excludes):
             logger.debug("Excluded %s", file_path)
             continue
 
-        if _matches_pattern(path=file_path, patterns=config.include, base=base):
+        if _matches_any(path=rel_str, matchers=includes):
             filtered.add(file_path)
 
     result: list[Path] = sorted(filtered)
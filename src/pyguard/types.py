@@ -8,6 +8,7 @@ from types import MappingProxyType
 from pyguard.constants import (
     DEFAULT_EXCLUDES,
     DEFAULT_SEVERITIES,
+    DEFAULT_TYP003_SCOPE,
     AnnotationScope,
     ColorMode,
     OutputFormat,
@@ -27,9 +28,7 @@ class TYP001Options:
 class TYP003Options:
     """Options for TYP003 (variable annotation) rule."""
 
-    scope: frozenset[AnnotationScope] = field(
-        default_factory=lambda: frozenset({AnnotationScope.MODULE})
-    )
+    scope: frozenset[AnnotationScope] = DEFAULT_TYP003_SCOPE
 
 
 @dataclass(frozen=True, slots=True)
@@ -83,7 +82,7 @@ class PyGuardConfig:
 
     def is_rule_enabled(self, rule_code: str) -> bool:
         """Check if a rule is enabled (not OFF)."""
-        return self.get_severity(rule_code) != Severity.OFF
+        return self.get_severity(rule_code) is not Severity.OFF
 
 
 class ConfigError(Exception):
@@ -0,0 +1,39 @@
+"""Shared helpers for PyGuard tests."""
+from __future__ import annotations
+
+import ast
+import functools
+from pathlib import Path
+
+from pyguard.parser import ParseResult
+
+_TEST_FILE: Path = Path("test.py")
+_TEST_FILENAME: str = str(_TEST_FILE)
+
+
+# What the parser yields for a file it could not read: no tree, no source.
+EMPTY_PARSE_RESULT: ParseResult = ParseResult(
+    file=_TEST_FILE,
+    tree=None,
+    source="",
+    source_lines=(),
+    syntax_error=None,
+)
+
+
+@functools.cache
+def make_parse_result(code: str) -> ParseResult:
+    """Parse *code* as ``test.py`` without touching the filesystem.
+
+    ParseResult is frozen and rules only read it, so identical snippets
+    share one parse across every test module.
+    """
+    source_lines: tuple[str, ...] = tuple(code.splitlines())
+    tree: ast.Module = ast.parse(code, filename=_TEST_FILENAME)
+    return ParseResult(
+        file=_TEST_FILE,
+        tree=tree,
+        source=code,
+        source_lines=source_lines,
+        syntax_error=None,
+    )
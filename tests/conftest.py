@@ -2,10 +2,17 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
 
 import pytest
 
+from pyguard.config import ConfigLoader
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache() -> None:
+    """Keep config discovery results from leaking between tests."""
+    ConfigLoader.clear_cache()
+
 
 @pytest.fixture
 def temp_pyproject(tmp_path: Path) -> Path:
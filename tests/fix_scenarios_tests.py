@@ -1378,6 +1378,19 @@ class TestCombinedFixes:
         actual: str = fix_all(input_code)
         assert actual == expected_output
 
+    def test_return_and_variable_fixes_same_line(self) -> None:
+        """
+        Scenario: TYP002 and TYP003 insertions on one line.
+
+        Both insertion fixers share one pass; offsets must not collide.
+        """
+        input_code: str = "def f(): x = 1\n"
+
+        expected_output: str = "def f() -> None: x: int = 1\n"
+
+        actual: str = fix_all(input_code)
+        assert actual == expected_output
+
 
 # =============================================================================
 # Fix Stability Tests
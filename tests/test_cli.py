@@ -101,7 +101,7 @@ class TestLintCommand:
         result = runner.invoke(cli, ["lint", "--format", "json", str(tmp_path)])
 
         assert result.exit_code == 1
-        assert '"code": "SYN001"' in result.output
+        assert '"code":"SYN001"' in result.output
 
     def test_lint_no_show_source(self, tmp_path: Path) -> None:
         (tmp_path / "bad.py").write_text("def broken(\n")
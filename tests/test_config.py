@@ -2,19 +2,26 @@
 from __future__ import annotations
 
 import os
+import sys
+from dataclasses import replace
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
 from pyguard.config import ConfigLoader, load_config
 from pyguard.constants import (
     DEFAULT_SEVERITIES,
+    DEFAULT_TYP003_SCOPE,
     AnnotationScope,
     ColorMode,
     OutputFormat,
     Severity,
 )
-from pyguard.types import ConfigError, PyGuardConfig
+from pyguard.types import ConfigError, PyGuardConfig, RuleConfig
+
+_SEV_INT_TOML: bytes = b"[tool.pyguard.rules.TYP001]\nseverity = 1\n"
+_DISALLOW_INT_TOML: bytes = b'[tool.pyguard.ignores]\ndisallow = [123, "TYP001"]\n'
 
 
 class TestConfigDefaults:
@@ -49,6 +56,19 @@ class TestConfigDefaults:
         assert config.is_rule_enabled("EXP001") is False
         assert config.is_rule_enabled("UNKNOWN") is False
 
+    def test_severity_lookup_after_replace(self) -> None:
+        """Replacing rules should rebuild the severity lookup."""
+        config: PyGuardConfig = PyGuardConfig()
+        rules: RuleConfig = RuleConfig(
+            severities=MappingProxyType({"TYP001": Severity.OFF}),
+        )
+
+        replaced: PyGuardConfig = replace(config, rules=rules)
+
+        assert replaced.is_rule_enabled("TYP001") is False
+        assert replaced.get_severity("TYP002") == Severity.OFF
+        assert config.is_rule_enabled("TYP001") is True
+
     def test_default_rule_options(self) -> None:
         """Default rule options should have expected values."""
         config: PyGuardConfig = PyGuardConfig()
@@ -56,6 +76,7 @@ class TestConfigDefaults:
         assert config.rules.typ001.exempt_dunder is True
         assert config.rules.typ001.exempt_self_cls is True
         assert config.rules.typ003.scope == frozenset({AnnotationScope.MODULE})
+        assert config.rules.typ003.scope is DEFAULT_TYP003_SCOPE
         assert config.rules.kw001.min_params == 2
         assert config.rules.kw001.exempt_dunder is True
 
@@ -140,6 +161,22 @@ class TestConfigLoading:
         assert config.rules.kw001.min_params == 3
         assert config.rules.kw001.exempt_dunder is False
 
+    def test_rule_table_names_are_case_insensitive(self, tmp_path: Path) -> None:
+        """Options in a lowercase rule table apply like its severity does."""
+        config_path: Path = tmp_path / "pyproject.toml"
+        config_path.write_text(
+            """
+[tool.pyguard.rules.kw001]
+severity = "error"
+min_params = 4
+"""
+        )
+
+        config: PyGuardConfig = load_config(path=config_path)
+
+        assert config.get_severity("KW001") == Severity.ERROR
+        assert config.rules.kw001.min_params == 4
+
     def test_load_ignore_governance(self, temp_pyproject: Path) -> None:
         """Ignore governance should be loaded correctly."""
         config: PyGuardConfig = load_config(path=temp_pyproject)
@@ -174,12 +211,7 @@ class TestConfigValidation:
     def test_non_string_severity_raises_config_error(self, tmp_path: Path) -> None:
         """Non-string severity value should raise ConfigError."""
         config_path: Path = tmp_path / "pyproject.toml"
-        config_path.write_text(
-            """
-[tool.pyguard.rules.TYP001]
-severity = 1
-"""
-        )
+        config_path.write_bytes(_SEV_INT_TOML)
 
         with pytest.raises(ConfigError) as exc_info:
             load_config(path=config_path)
@@ -190,12 +222,7 @@ severity = 1
     def test_non_string_disallow_entry_raises_config_error(self, tmp_path: Path) -> None:
         """Non-string entries in ignores.disallow should raise ConfigError."""
         config_path: Path = tmp_path / "pyproject.toml"
-        config_path.write_text(
-            """
-[tool.pyguard.ignores]
-disallow = [123, "TYP001"]
-"""
-        )
+        config_path.write_bytes(_DISALLOW_INT_TOML)
 
         with pytest.raises(ConfigError) as exc_info:
             load_config(path=config_path)
@@ -255,6 +282,22 @@ class TestConfigDiscovery:
         # May find pyproject.toml higher up, so just check it returns Path or None
         assert found is None or found.name == "pyproject.toml"
 
+    def test_lookup_is_cached_until_cleared(self, tmp_path: Path) -> None:
+        """Results are cached per directory until clear_cache is called."""
+        subdir: Path = tmp_path / "pkg"
+        subdir.mkdir()
+        (subdir / "pyproject.toml").write_text("[project]\nname = 'a'")
+
+        first: Path | None = ConfigLoader.find_config_file(start_path=subdir)
+        (subdir / "pyproject.toml").unlink()
+        cached: Path | None = ConfigLoader.find_config_file(start_path=subdir)
+        ConfigLoader.clear_cache()
+        refreshed: Path | None = ConfigLoader.find_config_file(start_path=subdir)
+
+        assert first == subdir / "pyproject.toml"
+        assert cached == first
+        assert refreshed != first
+
 
 class TestScopeParsing:
     """Test TYP003 scope parsing."""
@@ -277,3 +320,25 @@ scope = ["module", "class", "local"]
             AnnotationScope.LOCAL,
         })
         assert config.rules.typ003.scope == expected
+
+
+class TestRuleCodeInterning:
+    """Test that rule codes parsed from config are interned."""
+
+    def test_parsed_codes_are_interned(self, tmp_path: Path) -> None:
+        config_path: Path = tmp_path / "pyproject.toml"
+        config_path.write_text(
+            """
+[tool.pyguard.rules]
+typ001 = "warn"
+
+[tool.pyguard.ignores]
+disallow = ["kw001"]
+"""
+        )
+
+        config: PyGuardConfig = load_config(path=config_path)
+
+        severity_keys: dict[str, str] = {k: k for k in config.rules.severities}
+        assert severity_keys["TYP001"] is sys.intern("TYP001")
+        assert next(iter(config.ignores.disallow)) is sys.intern("KW001")
@@ -35,6 +35,11 @@ class TestSourceLocation:
         with pytest.raises(FrozenInstanceError):
             loc.line = 2  # type: ignore[misc]
 
+    def test_slotted(self) -> None:
+        """SourceLocation carries no per-instance __dict__."""
+        loc = SourceLocation(line=1, column=1)
+        assert not hasattr(loc, "__dict__")
+
 
 class TestDiagnostic:
     """Tests for Diagnostic dataclass."""
@@ -82,6 +87,17 @@ class TestDiagnostic:
         with pytest.raises(FrozenInstanceError):
             diag.message = "changed"  # type: ignore[misc]
 
+    def test_slotted(self) -> None:
+        """Diagnostic carries no per-instance __dict__."""
+        diag = Diagnostic(
+            file=Path("test.py"),
+            location=SourceLocation(line=1, column=1),
+            code="TYP001",
+            message="test",
+            severity=Severity.ERROR,
+        )
+        assert not hasattr(diag, "__dict__")
+
 
 class TestDiagnosticCollection:
     """Tests for DiagnosticCollection."""
@@ -170,6 +186,27 @@ class TestDiagnosticCollection:
         coll.add(diagnostic=self._make_diagnostic(severity=Severity.WARN))
         assert coll.warning_count == 2
 
+    def test_counts_after_add_all(self) -> None:
+        """add_all updates error and warning counts."""
+        coll = DiagnosticCollection()
+        coll.add_all(diagnostics=[
+            self._make_diagnostic(severity=Severity.ERROR),
+            self._make_diagnostic(severity=Severity.WARN),
+            self._make_diagnostic(severity=Severity.WARN),
+        ])
+        assert coll.has_errors is True
+        assert coll.error_count == 1
+        assert coll.warning_count == 2
+
+    def test_counts_from_initial_list(self) -> None:
+        """Diagnostics passed at construction are counted."""
+        coll = DiagnosticCollection([
+            self._make_diagnostic(severity=Severity.ERROR),
+            self._make_diagnostic(severity=Severity.WARN),
+        ])
+        assert coll.error_count == 1
+        assert coll.warning_count == 1
+
     def test_empty_collection(self) -> None:
         """Empty collection behavior."""
         coll = DiagnosticCollection()
@@ -1,11 +1,16 @@
 """Tests for the pyguard fix CLI command."""
 from __future__ import annotations
 
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
+import pytest
 from click.testing import CliRunner
 
+import pyguard.runner as runner_mod
 from pyguard.cli import cli
+from pyguard.constants import PARALLEL_THRESHOLD
 
 
 # Source that triggers TYP002 (missing -> None) fixer
@@ -14,6 +19,8 @@ def greet(name: str):
     print(name)
 """
 
+_FIXABLE_BYTES: bytes = _FIXABLE_SOURCE.encode()
+
 _FIXED_SOURCE: str = """\
 def greet(name: str) -> None:
     print(name)
@@ -34,7 +41,7 @@ class TestFixInPlace:
 
     def test_fix_writes_changed_file(self, tmp_path: Path) -> None:
         target: Path = tmp_path / "fixable.py"
-        target.write_text(_FIXABLE_SOURCE)
+        target.write_bytes(_FIXABLE_BYTES)
 
         runner: CliRunner = CliRunner()
         result = runner.invoke(cli, ["fix", str(tmp_path)])
@@ -55,8 +62,8 @@ class TestFixInPlace:
         assert target.read_text() == _CLEAN_SOURCE
 
     def test_fix_multiple_files(self, tmp_path: Path) -> None:
-        (tmp_path / "a.py").write_text(_FIXABLE_SOURCE)
-        (tmp_path / "b.py").write_text(_FIXABLE_SOURCE)
+        (tmp_path / "a.py").write_bytes(_FIXABLE_BYTES)
+        (tmp_path / "b.py").write_bytes(_FIXABLE_BYTES)
         (tmp_path / "c.py").write_text(_CLEAN_SOURCE)
 
         runner: CliRunner = CliRunner()
@@ -67,7 +74,7 @@ class TestFixInPlace:
 
     def test_fix_skips_syntax_errors(self, tmp_path: Path) -> None:
         (tmp_path / "bad.py").write_text(_SYNTAX_ERROR_SOURCE)
-        (tmp_path / "good.py").write_text(_FIXABLE_SOURCE)
+        (tmp_path / "good.py").write_bytes(_FIXABLE_BYTES)
 
         runner: CliRunner = CliRunner()
         result = runner.invoke(cli, ["fix", str(tmp_path)])
@@ -83,7 +90,7 @@ class TestFixDiff:
 
     def test_diff_shows_unified_diff(self, tmp_path: Path) -> None:
         target: Path = tmp_path / "fixable.py"
-        target.write_text(_FIXABLE_SOURCE)
+        target.write_bytes(_FIXABLE_BYTES)
 
         runner: CliRunner = CliRunner()
         result = runner.invoke(cli, ["fix", "--diff", str(tmp_path)])
@@ -96,7 +103,7 @@ class TestFixDiff:
 
     def test_diff_does_not_write(self, tmp_path: Path) -> None:
         target: Path = tmp_path / "fixable.py"
-        target.write_text(_FIXABLE_SOURCE)
+        target.write_bytes(_FIXABLE_BYTES)
 
         runner: CliRunner = CliRunner()
         runner.invoke(cli, ["fix", "--diff", str(tmp_path)])
@@ -119,7 +126,7 @@ class TestFixCheck:
     """Test --check mode (CI)."""
 
     def test_check_exits_1_when_changes_needed(self, tmp_path: Path) -> None:
-        (tmp_path / "fixable.py").write_text(_FIXABLE_SOURCE)
+        (tmp_path / "fixable.py").write_bytes(_FIXABLE_BYTES)
 
         runner: CliRunner = CliRunner()
         result = runner.invoke(cli, ["fix", "--check", str(tmp_path)])
@@ -138,7 +145,7 @@ class TestFixCheck:
 
     def test_check_does_not_write(self, tmp_path: Path) -> None:
         target: Path = tmp_path / "fixable.py"
-        target.write_text(_FIXABLE_SOURCE)
+        target.write_bytes(_FIXABLE_BYTES)
 
         runner: CliRunner = CliRunner()
         runner.invoke(cli, ["fix", "--check", str(tmp_path)])
@@ -160,8 +167,8 @@ exclude = ["**/excluded/**"]
         )
         excluded_dir: Path = tmp_path / "excluded"
         excluded_dir.mkdir()
-        (excluded_dir / "skip.py").write_text(_FIXABLE_SOURCE)
-        (tmp_path / "include.py").write_text(_FIXABLE_SOURCE)
+        (excluded_dir / "skip.py").write_bytes(_FIXABLE_BYTES)
+        (tmp_path / "include.py").write_bytes(_FIXABLE_BYTES)
 
         runner: CliRunner = CliRunner()
         result = runner.invoke(
@@ -183,3 +190,71 @@ class TestFixEmptyDirectory:
 
         assert result.exit_code == 0
         assert "Fixed 0 files." in result.output
+
+
+class TestFixJobs:
+    """Test --jobs worker count."""
+
+    def test_parallel_fix_matches_serial(self, tmp_path: Path) -> None:
+        names: list[str] = [f"m{i}.py" for i in range(PARALLEL_THRESHOLD)]
+        for name in names:
+            (tmp_path / name).write_bytes(_FIXABLE_BYTES)
+        (tmp_path / "clean.py").write_text(_CLEAN_SOURCE)
+
+        runner: CliRunner = CliRunner()
+        result = runner.invoke(cli, ["fix", "--jobs", "2", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert f"Fixed {len(names)} files." in result.output
+        for name in names:
+            assert (tmp_path / name).read_text() == _FIXED_SOURCE
+        assert (tmp_path / "clean.py").read_text() == _CLEAN_SOURCE
+
+    def test_parallel_fix_spreads_work_across_workers(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        file_count: int = PARALLEL_THRESHOLD
+        for i in range(file_count):
+            (tmp_path / f"m{i}.py").write_bytes(_FIXABLE_BYTES)
+        submitted: list[object] = []
+
+        class _CountingExecutor(ProcessPoolExecutor):
+            def submit(self, *args: Any, **kwargs: Any) -> Future[Any]:
+                submitted.append(args)
+                return super().submit(*args, **kwargs)
+
+        monkeypatch.setattr(runner_mod, "ProcessPoolExecutor", _CountingExecutor)
+        runner: CliRunner = CliRunner()
+        result = runner.invoke(cli, ["fix", "--jobs", "2", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert f"Fixed {file_count} files." in result.output
+        # One work item per file, so both workers get a share
+        assert len(submitted) == file_count
+
+    @pytest.mark.parametrize(
+        ("jobs", "file_count"),
+        [("1", PARALLEL_THRESHOLD), ("2", 2)],
+        ids=["single_job", "below_threshold"],
+    )
+    def test_runs_serially_without_pool(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, jobs: str, file_count: int,
+    ) -> None:
+        for i in range(file_count):
+            (tmp_path / f"m{i}.py").write_bytes(_FIXABLE_BYTES)
+
+        def no_pool(*args: object, **kwargs: object) -> None:
+            raise AssertionError("process pool should not be started")
+
+        monkeypatch.setattr(runner_mod, "ProcessPoolExecutor", no_pool)
+        runner: CliRunner = CliRunner()
+        result = runner.invoke(cli, ["fix", "--jobs", jobs, str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert f"Fixed {file_count} files." in result.output
+
+    def test_zero_jobs_rejected(self, tmp_path: Path) -> None:
+        runner: CliRunner = CliRunner()
+        result = runner.invoke(cli, ["fix", "--jobs", "0", str(tmp_path)])
+
+        assert result.exit_code == 2
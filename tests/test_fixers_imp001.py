@@ -1,122 +1,134 @@
 """Tests for IMP001 fixer: Move local imports to module level."""
 from __future__ import annotations
 
+import ast
 import textwrap
 
-from pyguard.fixers.imp001 import fix_local_imports
+from pyguard.fixers._util import DispatchVisitor, clear_parse_cache, parse_source
+from pyguard.fixers.imp001 import clear_fix_cache, fix_local_imports
 
+_SIMPLE_IMPORT_SRC: str = textwrap.dedent("""\
+    def f() -> None:
+        import json
+        json.loads("{}")
+""")
+_SIMPLE_IMPORT_EXPECTED: str = textwrap.dedent("""\
+    import json
 
-class TestFixBasicMove:
-    def test_simple_import(self) -> None:
-        source: str = textwrap.dedent("""\
-            def f() -> None:
-                import json
-                json.loads("{}")
-        """)
-        expected: str = textwrap.dedent("""\
+    def f() -> None:
+        json.loads("{}")
+""")
+
+_FROM_IMPORT_SRC: str = textwrap.dedent("""\
+    def f() -> str:
+        from pathlib import Path
+        return str(Path.cwd())
+""")
+_FROM_IMPORT_EXPECTED: str = textwrap.dedent("""\
+    from pathlib import Path
+
+    def f() -> str:
+        return str(Path.cwd())
+""")
+
+_MULTIPLE_IMPORTS_SRC: str = textwrap.dedent("""\
+    def f() -> str:
+        import json
+        import re
+        return re.sub(r"x", "", json.dumps({}))
+""")
+_MULTIPLE_IMPORTS_EXPECTED: str = textwrap.dedent("""\
+    import json
+    import re
+
+    def f() -> str:
+        return re.sub(r"x", "", json.dumps({}))
+""")
+
+_METHOD_IMPORT_SRC: str = textwrap.dedent("""\
+    class C:
+        def m(self) -> None:
             import json
+            json.loads("{}")
+""")
+_METHOD_IMPORT_EXPECTED: str = textwrap.dedent("""\
+    import json
 
-            def f() -> None:
-                json.loads("{}")
-        """)
-        assert fix_local_imports(source) == expected
+    class C:
+        def m(self) -> None:
+            json.loads("{}")
+""")
+
+
+class TestFixBasicMove:
+    def test_simple_import(self) -> None:
+        assert fix_local_imports(_SIMPLE_IMPORT_SRC) == _SIMPLE_IMPORT_EXPECTED
 
     def test_from_import(self) -> None:
-        source: str = textwrap.dedent("""\
-            def f() -> str:
-                from pathlib import Path
-                return str(Path.cwd())
-        """)
-        expected: str = textwrap.dedent("""\
-            from pathlib import Path
-
-            def f() -> str:
-                return str(Path.cwd())
-        """)
-        assert fix_local_imports(source) == expected
+        assert fix_local_imports(_FROM_IMPORT_SRC) == _FROM_IMPORT_EXPECTED
 
     def test_multiple_imports(self) -> None:
-        source: str = textwrap.dedent("""\
-            def f() -> str:
-                import json
-                import re
-                return re.sub(r"x", "", json.dumps({}))
-        """)
-        expected: str = textwrap.dedent("""\
-            import json
-            import re
-
-            def f() -> str:
-                return re.sub(r"x", "", json.dumps({}))
-        """)
-        assert fix_local_imports(source) == expected
+        assert fix_local_imports(_MULTIPLE_IMPORTS_SRC) == _MULTIPLE_IMPORTS_EXPECTED
 
     def test_method_import(self) -> None:
-        source: str = textwrap.dedent("""\
-            class C:
-                def m(self) -> None:
-                    import json
-                    json.loads("{}")
-        """)
-        expected: str = textwrap.dedent("""\
-            import json
+        assert fix_local_imports(_METHOD_IMPORT_SRC) == _METHOD_IMPORT_EXPECTED
 
-            class C:
-                def m(self) -> None:
-                    json.loads("{}")
-        """)
-        assert fix_local_imports(source) == expected
+
+_ALREADY_AT_MODULE_SRC: str = textwrap.dedent("""\
+    import json
+
+    def f() -> None:
+        import json
+        json.loads("{}")
+""")
+_ALREADY_AT_MODULE_EXPECTED: str = textwrap.dedent("""\
+    import json
+
+    def f() -> None:
+        json.loads("{}")
+""")
 
 
 class TestFixDuplicateRemoval:
     def test_already_at_module_level(self) -> None:
-        source: str = textwrap.dedent("""\
-            import json
+        assert fix_local_imports(_ALREADY_AT_MODULE_SRC) == _ALREADY_AT_MODULE_EXPECTED
 
-            def f() -> None:
-                import json
-                json.loads("{}")
-        """)
-        expected: str = textwrap.dedent("""\
-            import json
 
-            def f() -> None:
-                json.loads("{}")
-        """)
-        assert fix_local_imports(source) == expected
+_TRY_EXCEPT_IMPORT_SRC: str = textwrap.dedent("""\
+    def f() -> None:
+        try:
+            import ujson as json
+        except ImportError:
+            import json
+        json.loads("{}")
+""")
 
 
 class TestFixConditionalSkip:
     def test_try_except_import_error_no_change(self) -> None:
-        source: str = textwrap.dedent("""\
-            def f() -> None:
-                try:
-                    import ujson as json
-                except ImportError:
-                    import json
-                json.loads("{}")
-        """)
-        assert fix_local_imports(source) == source
+        assert fix_local_imports(_TRY_EXCEPT_IMPORT_SRC) == _TRY_EXCEPT_IMPORT_SRC
 
 
-class TestFixImportOrdering:
-    def test_stdlib_before_third_party(self) -> None:
-        source: str = textwrap.dedent("""\
-            from myapp.utils import helper
+_STDLIB_FIRST_SRC: str = textwrap.dedent("""\
+    from myapp.utils import helper
 
-            def f() -> None:
-                import json
-                json.loads("{}")
-        """)
-        expected: str = textwrap.dedent("""\
-            import json
+    def f() -> None:
+        import json
+        json.loads("{}")
+""")
+_STDLIB_FIRST_EXPECTED: str = textwrap.dedent("""\
+    import json
 
-            from myapp.utils import helper
+    from myapp.utils import helper
 
-            def f() -> None:
-                json.loads("{}")
-        """)
-        assert fix_local_imports(source) == expected
+    def f() -> None:
+        json.loads("{}")
+""")
+
+
+class TestFixImportOrdering:
+    def test_stdlib_before_third_party(self) -> None:
+        assert fix_local_imports(_STDLIB_FIRST_SRC) == _STDLIB_FIRST_EXPECTED
 
 
 class TestFixNoChange:
@@ -132,35 +144,124 @@ class TestFixNoChange:
         assert fix_local_imports(source) == source
 
 
-class TestFixEdgeCases:
-    def test_async_function(self) -> None:
-        source: str = textwrap.dedent("""\
-            async def f() -> None:
+_ASYNC_FUNCTION_SRC: str = textwrap.dedent("""\
+    async def f() -> None:
+        import json
+        json.loads("{}")
+""")
+_ASYNC_FUNCTION_EXPECTED: str = textwrap.dedent("""\
+    import json
+
+    async def f() -> None:
+        json.loads("{}")
+""")
+
+_NESTED_FUNCTION_SRC: str = textwrap.dedent("""\
+    def outer() -> str:
+        def inner() -> str:
+            import os
+            return os.getcwd()
+        return inner()
+""")
+_NESTED_FUNCTION_EXPECTED: str = textwrap.dedent("""\
+    import os
+
+    def outer() -> str:
+        def inner() -> str:
+            return os.getcwd()
+        return inner()
+""")
+
+_NESTED_BLOCKS_SRC: str = textwrap.dedent("""\
+    def f(x: int) -> str:
+        match x:
+            case 1:
+                import os
+                return os.sep
+        for _ in range(x):
+            with open("f") as fh:
                 import json
-                json.loads("{}")
-        """)
-        expected: str = textwrap.dedent("""\
-            import json
+                return json.dumps(fh.name)
+        return ""
+""")
+_NESTED_BLOCKS_EXPECTED: str = textwrap.dedent("""\
+    import os
+    import json
 
-            async def f() -> None:
-                json.loads("{}")
-        """)
-        assert fix_local_imports(source) == expected
+    def f(x: int) -> str:
+        match x:
+            case 1:
+                return os.sep
+        for _ in range(x):
+            with open("f") as fh:
+                return json.dumps(fh.name)
+        return ""
+""")
+
+
+class TestFixEdgeCases:
+    def test_async_function(self) -> None:
+        assert fix_local_imports(_ASYNC_FUNCTION_SRC) == _ASYNC_FUNCTION_EXPECTED
 
     def test_nested_function(self) -> None:
-        source: str = textwrap.dedent("""\
-            def outer() -> str:
-                def inner() -> str:
-                    import os
-                    return os.getcwd()
-                return inner()
-        """)
-        expected: str = textwrap.dedent("""\
-            import os
+        assert fix_local_imports(_NESTED_FUNCTION_SRC) == _NESTED_FUNCTION_EXPECTED
+
+    def test_import_in_nested_statement_blocks(self) -> None:
+        assert fix_local_imports(_NESTED_BLOCKS_SRC) == _NESTED_BLOCKS_EXPECTED
+
+
+class TestParseCache:
+    def test_repeated_source_reuses_tree(self) -> None:
+        source: str = "def f() -> None:\n    import os\n"
+        clear_parse_cache()
+        assert parse_source(source) is parse_source(source)
+
+    def test_clear_parse_cache(self) -> None:
+        source: str = "x: int = 1\n"
+        first = parse_source(source)
+        clear_parse_cache()
+        assert parse_source(source) is not first
+
+    def test_fix_result_unaffected_by_warm_cache(self) -> None:
+        source: str = "def f() -> None:\n    import os\n    os.getcwd()\n"
+        assert fix_local_imports(source) == fix_local_imports(source)
+
+    def test_clear_fix_cache(self) -> None:
+        source: str = "def f() -> None:\n    import os\n    os.getcwd()\n"
+        first: str = fix_local_imports(source)
+        clear_fix_cache()
+        assert fix_local_imports(source) is not first
+        assert fix_local_imports(source) == first
+
+
+class TestDispatchVisitor:
+    def test_dispatches_to_visit_methods_and_recurses(self) -> None:
+        class _NameCounter(DispatchVisitor):
+            __slots__ = ("names",)
 
-            def outer() -> str:
-                def inner() -> str:
-                    return os.getcwd()
-                return inner()
-        """)
+            def __init__(self) -> None:
+                self.names: list[str] = []
+
+            def visit_Name(self, node: ast.Name) -> None:
+                self.names.append(node.id)
+
+        counter: _NameCounter = _NameCounter()
+        counter.visit(ast.parse("def f():\n    return a + b(c)\n"))
+        assert counter.names == ["a", "b", "c"]
+
+
+class TestPrefilter:
+    def test_module_level_imports_only_unchanged(self) -> None:
+        source: str = "import os\nfrom pathlib import Path\n\nx: str = os.sep\n"
+        assert fix_local_imports(source) == source
+
+    def test_tab_indented_import_still_moved(self) -> None:
+        source: str = "def f() -> None:\n\timport os\n\tos.getcwd()\n"
+        expected: str = "import os\n\ndef f() -> None:\n\tos.getcwd()\n"
         assert fix_local_imports(source) == expected
+
+
+class TestOutputCache:
+    def test_repeated_source_returns_cached_output(self) -> None:
+        source: str = "def f() -> None:\n    import os\n    os.getcwd()\n"
+        assert fix_local_imports(source) is fix_local_imports(source)
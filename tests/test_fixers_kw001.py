@@ -2,20 +2,55 @@
 from __future__ import annotations
 
 import textwrap
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
+import pytest
+
+import pyguard.fixers.kw001 as kw001_mod
+from pyguard.constants import PARALLEL_THRESHOLD
 from pyguard.fixers.kw001 import FixResult, fix_keyword_only
-from pyguard.types import PyGuardConfig
+from pyguard.types import KW001Options, PyGuardConfig, RuleConfig
+
+_TEST_FILE: Path = Path("test.py")
+
+# PyGuardConfig is frozen, so one default instance is safe to share
+_DEFAULT_CONFIG: PyGuardConfig = PyGuardConfig()
 
 
 def _fix(source: str) -> str:
     """Fix a single source string with default config."""
-    config: PyGuardConfig = PyGuardConfig()
     result: FixResult = fix_keyword_only(
-        sources={Path("test.py"): source},
-        config=config,
+        sources={_TEST_FILE: source},
+        config=_DEFAULT_CONFIG,
     )
-    return result.sources[Path("test.py")]
+    return result.sources[_TEST_FILE]
+
+
+_INSERT_STAR_AFTER_SELF_SRC: str = textwrap.dedent("""\
+    class C:
+        def method(self, a: int, b: int) -> None:
+            pass
+""")
+_INSERT_STAR_AFTER_SELF_EXPECTED: str = textwrap.dedent("""\
+    class C:
+        def method(self, *, a: int, b: int) -> None:
+            pass
+""")
+
+_INSERT_STAR_AFTER_CLS_SRC: str = textwrap.dedent("""\
+    class Factory:
+        @classmethod
+        def create(cls, name: str, value: int) -> "Factory":
+            return cls()
+""")
+_INSERT_STAR_AFTER_CLS_EXPECTED: str = textwrap.dedent("""\
+    class Factory:
+        @classmethod
+        def create(cls, *, name: str, value: int) -> "Factory":
+            return cls()
+""")
 
 
 class TestSignatureFixBasic:
@@ -24,32 +59,10 @@ class TestSignatureFixBasic:
         assert _fix(source) == "def f(*, a: int, b: int, c: int) -> None:\n    pass\n"
 
     def test_insert_star_after_self(self) -> None:
-        source: str = textwrap.dedent("""\
-            class C:
-                def method(self, a: int, b: int) -> None:
-                    pass
-        """)
-        expected: str = textwrap.dedent("""\
-            class C:
-                def method(self, *, a: int, b: int) -> None:
-                    pass
-        """)
-        assert _fix(source) == expected
+        assert _fix(_INSERT_STAR_AFTER_SELF_SRC) == _INSERT_STAR_AFTER_SELF_EXPECTED
 
     def test_insert_star_after_cls(self) -> None:
-        source: str = textwrap.dedent("""\
-            class Factory:
-                @classmethod
-                def create(cls, name: str, value: int) -> "Factory":
-                    return cls()
-        """)
-        expected: str = textwrap.dedent("""\
-            class Factory:
-                @classmethod
-                def create(cls, *, name: str, value: int) -> "Factory":
-                    return cls()
-        """)
-        assert _fix(source) == expected
+        assert _fix(_INSERT_STAR_AFTER_CLS_SRC) == _INSERT_STAR_AFTER_CLS_EXPECTED
 
     def test_params_with_defaults(self) -> None:
         source: str = 'def greet(name: str, greeting: str = "Hello") -> str:\n    return "hi"\n'
@@ -57,6 +70,20 @@ class TestSignatureFixBasic:
         assert _fix(source) == expected
 
 
+_DUNDER_EXEMPT_SRC: str = textwrap.dedent("""\
+    class P:
+        def __init__(self, x: int, y: int) -> None:
+            pass
+""")
+
+_OVERRIDE_EXEMPT_SRC: str = textwrap.dedent("""\
+    class Child:
+        @override
+        def process(self, a: int, b: int) -> None:
+            pass
+""")
+
+
 class TestSignatureFixNoChange:
     def test_already_has_star_separator(self) -> None:
         source: str = "def f(*, a: int, b: int) -> None:\n    pass\n"
@@ -75,61 +102,53 @@ class TestSignatureFixNoChange:
         assert _fix(source) == source
 
     def test_dunder_exempt(self) -> None:
-        source: str = textwrap.dedent("""\
-            class P:
-                def __init__(self, x: int, y: int) -> None:
-                    pass
-        """)
-        assert _fix(source) == source
+        assert _fix(_DUNDER_EXEMPT_SRC) == _DUNDER_EXEMPT_SRC
 
     def test_private_exempt(self) -> None:
         source: str = "def _helper(a: int, b: int) -> int:\n    return a + b\n"
         assert _fix(source) == source
 
     def test_override_exempt(self) -> None:
-        source: str = textwrap.dedent("""\
-            class Child:
-                @override
-                def process(self, a: int, b: int) -> None:
-                    pass
-        """)
-        assert _fix(source) == source
+        assert _fix(_OVERRIDE_EXEMPT_SRC) == _OVERRIDE_EXEMPT_SRC
+
+
+_MULTIPLE_SAME_FILE_SRC: str = textwrap.dedent("""\
+    def first(a: int, b: int) -> None:
+        pass
+
+    def second(x: str, y: str) -> None:
+        pass
+""")
+_MULTIPLE_SAME_FILE_EXPECTED: str = textwrap.dedent("""\
+    def first(*, a: int, b: int) -> None:
+        pass
+
+    def second(*, x: str, y: str) -> None:
+        pass
+""")
+
+_MIXED_EXEMPT_SRC: str = textwrap.dedent("""\
+    def public(a: int, b: int) -> None:
+        pass
+
+    def _private(a: int, b: int) -> None:
+        pass
+""")
+_MIXED_EXEMPT_EXPECTED: str = textwrap.dedent("""\
+    def public(*, a: int, b: int) -> None:
+        pass
+
+    def _private(a: int, b: int) -> None:
+        pass
+""")
 
 
 class TestSignatureFixMultipleFunctions:
     def test_fix_multiple_in_same_file(self) -> None:
-        source: str = textwrap.dedent("""\
-            def first(a: int, b: int) -> None:
-                pass
-
-            def second(x: str, y: str) -> None:
-                pass
-        """)
-        expected: str = textwrap.dedent("""\
-            def first(*, a: int, b: int) -> None:
-                pass
-
-            def second(*, x: str, y: str) -> None:
-                pass
-        """)
-        assert _fix(source) == expected
+        assert _fix(_MULTIPLE_SAME_FILE_SRC) == _MULTIPLE_SAME_FILE_EXPECTED
 
     def test_fix_mixed_fixable_and_exempt(self) -> None:
-        source: str = textwrap.dedent("""\
-            def public(a: int, b: int) -> None:
-                pass
-
-            def _private(a: int, b: int) -> None:
-                pass
-        """)
-        expected: str = textwrap.dedent("""\
-            def public(*, a: int, b: int) -> None:
-                pass
-
-            def _private(a: int, b: int) -> None:
-                pass
-        """)
-        assert _fix(source) == expected
+        assert _fix(_MIXED_EXEMPT_SRC) == _MIXED_EXEMPT_EXPECTED
 
 
 class TestSignatureFixAsync:
@@ -150,6 +169,144 @@ class TestSignatureFixMultiFile:
         assert result.sources[Path("a.py")] == "def f(*, a: int, b: int) -> None:\n    pass\n"
         assert result.sources[Path("b.py")] == "def g(*, x: str, y: str) -> None:\n    pass\n"
 
+    def test_large_batch_matches_serial_result(self) -> None:
+        config: PyGuardConfig = PyGuardConfig()
+        sources: dict[Path, str] = {
+            Path(f"m{i}.py"): f"def f{i}(a: int, b: int) -> None:\n    pass\n"
+            for i in range(10)
+        }
+        result: FixResult = fix_keyword_only(sources=sources, config=config)
+        assert list(result.sources) == list(sources)
+        for i in range(10):
+            assert result.sources[Path(f"m{i}.py")] == (
+                f"def f{i}(*, a: int, b: int) -> None:\n    pass\n"
+            )
+
+    def test_process_pool_matches_serial_result(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        config: PyGuardConfig = PyGuardConfig()
+        # Distinct sources, mixing fixable and unfixable ones
+        sources: dict[Path, str] = {
+            Path(f"m{i}.py"): (
+                f"def f{i}(a: int, b: int) -> None:\n    pass\n" if i % 3 else f"x{i}: int = {i}\n"
+            )
+            for i in range(PARALLEL_THRESHOLD + 2)
+        }
+        serial: FixResult = fix_keyword_only(sources=sources, config=config, jobs=1)
+        submitted: list[object] = []
+
+        class _CountingExecutor(ProcessPoolExecutor):
+            def submit(self, *args: Any, **kwargs: Any) -> Future[Any]:
+                submitted.append(args)
+                return super().submit(*args, **kwargs)
+
+        monkeypatch.setattr(kw001_mod, "ProcessPoolExecutor", _CountingExecutor)
+        parallel: FixResult = fix_keyword_only(sources=sources, config=config, jobs=2)
+
+        assert submitted
+        assert list(parallel.sources) == list(sources)
+        assert parallel.sources == serial.sources
+
+    def test_identical_sources_share_result(self) -> None:
+        config: PyGuardConfig = PyGuardConfig()
+        source: str = "def f(a: int, b: int) -> None:\n    pass\n"
+        sources: dict[Path, str] = {
+            Path("a.py"): source,
+            Path("vendor/a.py"): source,
+            Path("b.py"): "x: int = 1\n",
+        }
+        result: FixResult = fix_keyword_only(sources=sources, config=config)
+        assert list(result.sources) == list(sources)
+        assert result.sources[Path("a.py")] == "def f(*, a: int, b: int) -> None:\n    pass\n"
+        assert result.sources[Path("vendor/a.py")] == result.sources[Path("a.py")]
+        assert result.sources[Path("b.py")] == "x: int = 1\n"
+
+    def test_single_param_fixed_when_min_params_is_one(self) -> None:
+        config: PyGuardConfig = PyGuardConfig(
+            rules=RuleConfig(kw001=KW001Options(min_params=1)),
+        )
+        sources: dict[Path, str] = {Path("a.py"): "def f(a: int) -> None:\n    pass\n"}
+        result: FixResult = fix_keyword_only(sources=sources, config=config)
+        assert result.sources[Path("a.py")] == "def f(*, a: int) -> None:\n    pass\n"
+
+    def test_source_without_def_unchanged(self) -> None:
+        source: str = "x: int = f(1, 2)\n"
+        assert _fix(source) == source
+
+
+_STATICMETHOD_FIXED_SRC: str = textwrap.dedent("""\
+    class Util:
+        @staticmethod
+        def add(a: int, b: int) -> int:
+            return a + b
+""")
+_STATICMETHOD_FIXED_EXPECTED: str = textwrap.dedent("""\
+    class Util:
+        @staticmethod
+        def add(*, a: int, b: int) -> int:
+            return a + b
+""")
+
+_MULTILINE_SIGNATURE_SRC: str = textwrap.dedent("""\
+    def f(
+        a: int,
+        b: int,
+    ) -> None:
+        pass
+""")
+# The separator follows the open paren, as single-line signatures get it
+_MULTILINE_SIGNATURE_EXPECTED: str = "def f(*, \n    a: int,\n    b: int,\n) -> None:\n    pass\n"
+
+_NO_SPACE_AFTER_SELF_SRC: str = textwrap.dedent("""\
+    class C:
+        def m(self,a: int, b: int) -> None:
+            pass
+""")
+_NO_SPACE_AFTER_SELF_EXPECTED: str = textwrap.dedent("""\
+    class C:
+        def m(self, *, a: int, b: int) -> None:
+            pass
+""")
+
+_MULTILINE_AFTER_SELF_SRC: str = textwrap.dedent("""\
+    class C:
+        def m(
+            self,
+            a: int,
+            b: int,
+        ) -> None:
+            pass
+""")
+_MULTILINE_AFTER_SELF_EXPECTED: str = _MULTILINE_AFTER_SELF_SRC.replace("self,\n", "self, *, \n")
+
+# With a comment or backslash continuation before the first parameter,
+# the separator goes on the parameter's own line
+_COMMENT_BEFORE_PARAM_SRC: str = textwrap.dedent("""\
+    def f(  # note
+        a: int, b: int) -> None:
+        pass
+""")
+_COMMENT_BEFORE_PARAM_EXPECTED: str = textwrap.dedent("""\
+    def f(  # note
+        *, a: int, b: int) -> None:
+        pass
+""")
+
+_COMMENT_AFTER_SELF_SRC: str = textwrap.dedent("""\
+    class C:
+        def m(self,  # note
+              a: int, b: int) -> None:
+            pass
+""")
+_COMMENT_AFTER_SELF_EXPECTED: str = textwrap.dedent("""\
+    class C:
+        def m(self,  # note
+              *, a: int, b: int) -> None:
+            pass
+""")
+
+_CONTINUATION_BEFORE_PARAM_SRC: str = "def f(\\\n    a: int, b: int) -> None:\n    pass\n"
+_CONTINUATION_BEFORE_PARAM_EXPECTED: str = "def f(\\\n    *, a: int, b: int) -> None:\n    pass\n"
+
 
 class TestSignatureFixEdgeCases:
     def test_syntax_error_returns_unchanged(self) -> None:
@@ -161,16 +318,32 @@ class TestSignatureFixEdgeCases:
         assert _fix(source) == source
 
     def test_staticmethod_fixed(self) -> None:
-        source: str = textwrap.dedent("""\
-            class Util:
-                @staticmethod
-                def add(a: int, b: int) -> int:
-                    return a + b
-        """)
-        expected: str = textwrap.dedent("""\
-            class Util:
-                @staticmethod
-                def add(*, a: int, b: int) -> int:
-                    return a + b
-        """)
+        assert _fix(_STATICMETHOD_FIXED_SRC) == _STATICMETHOD_FIXED_EXPECTED
+
+    def test_non_ascii_before_params(self) -> None:
+        source: str = 'def héllo(a: str = "é", b: int = 1) -> None:\n    pass\n'
+        expected: str = 'def héllo(*, a: str = "é", b: int = 1) -> None:\n    pass\n'
+        assert _fix(source) == expected
+
+    def test_multiline_signature(self) -> None:
+        assert _fix(_MULTILINE_SIGNATURE_SRC) == _MULTILINE_SIGNATURE_EXPECTED
+
+    def test_no_space_after_self_comma(self) -> None:
+        assert _fix(_NO_SPACE_AFTER_SELF_SRC) == _NO_SPACE_AFTER_SELF_EXPECTED
+
+    def test_multiline_signature_after_self(self) -> None:
+        assert _fix(_MULTILINE_AFTER_SELF_SRC) == _MULTILINE_AFTER_SELF_EXPECTED
+
+    def test_comment_before_first_param(self) -> None:
+        assert _fix(_COMMENT_BEFORE_PARAM_SRC) == _COMMENT_BEFORE_PARAM_EXPECTED
+
+    def test_comment_after_self(self) -> None:
+        assert _fix(_COMMENT_AFTER_SELF_SRC) == _COMMENT_AFTER_SELF_EXPECTED
+
+    def test_continuation_before_first_param(self) -> None:
+        assert _fix(_CONTINUATION_BEFORE_PARAM_SRC) == _CONTINUATION_BEFORE_PARAM_EXPECTED
+
+    def test_positional_only_params_kept_before_star(self) -> None:
+        source: str = "def f(a: int, /, b: int, c: int) -> None:\n    pass\n"
+        expected: str = "def f(a: int, /, *, b: int, c: int) -> None:\n    pass\n"
         assert _fix(source) == expected
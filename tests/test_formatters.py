@@ -16,10 +16,12 @@ from pyguard.formatters import (
 )
 from pyguard.types import PyGuardConfig
 
+_DEFAULT_FILE: Path = Path("src/example.py")
+
 
 def _make_diagnostic(
     *,
-    file: str = "src/example.py",
+    file: Path = _DEFAULT_FILE,
     line: int = 1,
     column: int = 1,
     code: str = "TYP001",
@@ -28,7 +30,7 @@ def _make_diagnostic(
     source_line: str | None = None,
 ) -> Diagnostic:
     return Diagnostic(
-        file=Path(file),
+        file=file,
         location=SourceLocation(line=line, column=column),
         code=code,
         message=message,
@@ -70,6 +72,24 @@ class TestTextFormatter:
         assert "def broken(" in result
         assert "    ^" in result
 
+    def test_exact_layout_with_source(self) -> None:
+        collection: DiagnosticCollection = DiagnosticCollection()
+        collection.add(
+            diagnostic=_make_diagnostic(
+                line=3,
+                column=5,
+                severity=Severity.WARN,
+                source_line="def broken(",
+            )
+        )
+        config: PyGuardConfig = PyGuardConfig(show_source=True)
+        result: str = TextFormatter().format(diagnostics=collection, config=config)
+        assert result == (
+            "src/example.py:3:5: WARN [TYP001] Missing type annotation\n"
+            "    def broken(\n"
+            "        ^\n"
+        )
+
     def test_without_source(self) -> None:
         collection: DiagnosticCollection = DiagnosticCollection()
         collection.add(
@@ -149,6 +169,14 @@ class TestJsonFormatter:
         result: str = JsonFormatter().format(diagnostics=collection, config=config)
         assert json.loads(result) == []
 
+    def test_compact_separators(self) -> None:
+        collection: DiagnosticCollection = DiagnosticCollection()
+        collection.add(diagnostic=_make_diagnostic())
+        config: PyGuardConfig = PyGuardConfig(show_source=False)
+        result: str = JsonFormatter().format(diagnostics=collection, config=config)
+        assert "\n" not in result
+        assert '"code":"TYP001","severity":"error"' in result
+
 
 class TestGetFormatter:
     def test_text(self) -> None:
@@ -188,3 +216,14 @@ class TestFormatSummary:
         collection.add(diagnostic=_make_diagnostic(severity=Severity.WARN))
         collection.add(diagnostic=_make_diagnostic(severity=Severity.WARN))
         assert format_summary(diagnostics=collection) == "Found 2 warnings."
+
+    def test_counts_from_add_all(self) -> None:
+        collection: DiagnosticCollection = DiagnosticCollection()
+        collection.add_all(
+            diagnostics=[
+                _make_diagnostic(severity=Severity.ERROR),
+                _make_diagnostic(severity=Severity.WARN),
+                _make_diagnostic(severity=Severity.ERROR),
+            ],
+        )
+        assert format_summary(diagnostics=collection) == "Found 2 errors, 1 warning."
@@ -1,30 +1,50 @@
 """Tests for the ignore pragma system (parsing, filtering, governance)."""
 from __future__ import annotations
 
-import ast
+import sys
 from pathlib import Path
 
+import pytest
+
 from pyguard.constants import IGN001_CODE, IGN002_CODE, IGN003_CODE, Severity
 from pyguard.diagnostics import Diagnostic, SourceLocation
 from pyguard.ignores import IgnoreDirective, apply_ignores, parse_ignore_directives
 from pyguard.parser import ParseResult
 from pyguard.types import IgnoreGovernance
+from tests._helpers import make_parse_result
 
 _TEST_FILE: Path = Path("test.py")
 
 _QUIET_GOVERNANCE: IgnoreGovernance = IgnoreGovernance(require_reason=False)
 
 
-def _make_parse_result(code: str) -> ParseResult:
-    file: Path = _TEST_FILE
-    source_lines: tuple[str, ...] = tuple(code.splitlines())
-    tree: ast.Module = ast.parse(code, filename=str(file))
-    return ParseResult(
-        file=file,
-        tree=tree,
-        source=code,
-        source_lines=source_lines,
-        syntax_error=None,
+@pytest.fixture(scope="module")
+def inline_ignore_pr() -> ParseResult:
+    """Inline TYP001 ignore with a reason on line 1."""
+    return make_parse_result(
+        "def add(x, y):  # pyguard: ignore[TYP001] because: legacy\n"
+        "    return x + y\n"
+    )
+
+
+@pytest.fixture(scope="module")
+def inline_ignore_no_reason_pr() -> ParseResult:
+    """Inline TYP001 ignore without a reason on line 1."""
+    return make_parse_result(
+        "def add(x, y):  # pyguard: ignore[TYP001]\n"
+        "    return x + y\n"
+    )
+
+
+@pytest.fixture(scope="module")
+def file_ignore_pr() -> ParseResult:
+    """File-level TYP001 ignore above two functions (lines 2 and 4)."""
+    return make_parse_result(
+        "# pyguard: ignore-file[TYP001] because: legacy module\n"
+        "def add(x, y):\n"
+        "    return x + y\n"
+        "def sub(a, b):\n"
+        "    return a - b\n"
     )
 
 
@@ -50,116 +70,123 @@ def _make_diagnostic(
 # ---------------------------------------------------------------------------
 
 
-class TestParseIgnoreDirectives:
-    def test_no_directives(self) -> None:
-        source_lines: tuple[str, ...] = (
-            "def add(x, y):",
-            "    return x + y",
-        )
-        result: list[IgnoreDirective] = parse_ignore_directives(
-            source_lines=source_lines,
-        )
-        assert result == []
+def _directive(
+    *,
+    line: int = 1,
+    codes: frozenset[str] = frozenset({"TYP001"}),
+    reason: str | None = None,
+    is_file_level: bool = False,
+    is_inline: bool = False,
+) -> IgnoreDirective:
+    return IgnoreDirective(
+        line=line,
+        codes=codes,
+        reason=reason,
+        is_file_level=is_file_level,
+        is_inline=is_inline,
+    )
 
-    def test_line_level_inline(self) -> None:
-        source_lines: tuple[str, ...] = (
-            "def add(x, y):  # pyguard: ignore[TYP001] because: legacy",
-        )
-        result: list[IgnoreDirective] = parse_ignore_directives(
-            source_lines=source_lines,
-        )
-        assert len(result) == 1
-        directive: IgnoreDirective = result[0]
-        assert directive.line == 1
-        assert directive.codes == frozenset({"TYP001"})
-        assert directive.reason == "legacy"
-        assert directive.is_inline is True
-        assert directive.is_file_level is False
-
-    def test_block_level_standalone(self) -> None:
-        source_lines: tuple[str, ...] = (
+
+_PARSE_CASES: list[object] = [
+    pytest.param(
+        ("def add(x, y):", "    return x + y"),
+        [],
+        id="no_directives",
+    ),
+    pytest.param(
+        ("def add(x, y):  # pyguard: ignore[TYP001] because: legacy",),
+        [_directive(reason="legacy", is_inline=True)],
+        id="line_level_inline",
+    ),
+    pytest.param(
+        (
             "# pyguard: ignore[TYP001] because: legacy",
             "def add(x, y):",
             "    return x + y",
-        )
-        result: list[IgnoreDirective] = parse_ignore_directives(
-            source_lines=source_lines,
-        )
-        assert len(result) == 1
-        directive: IgnoreDirective = result[0]
-        assert directive.line == 1
-        assert directive.is_inline is False
-        assert directive.is_file_level is False
-
-    def test_file_level(self) -> None:
-        source_lines: tuple[str, ...] = (
-            "# pyguard: ignore-file[IMP001] because: plugin",
-        )
-        result: list[IgnoreDirective] = parse_ignore_directives(
-            source_lines=source_lines,
-        )
-        assert len(result) == 1
-        directive: IgnoreDirective = result[0]
-        assert directive.line == 1
-        assert directive.codes == frozenset({"IMP001"})
-        assert directive.reason == "plugin"
-        assert directive.is_file_level is True
-        assert directive.is_inline is False
-
-    def test_multiple_codes(self) -> None:
-        source_lines: tuple[str, ...] = (
-            "# pyguard: ignore[TYP001,TYP002] because: legacy",
-        )
-        result: list[IgnoreDirective] = parse_ignore_directives(
-            source_lines=source_lines,
-        )
-        assert len(result) == 1
-        assert result[0].codes == frozenset({"TYP001", "TYP002"})
-
-    def test_no_reason(self) -> None:
-        source_lines: tuple[str, ...] = (
-            "# pyguard: ignore[TYP001]",
-        )
-        result: list[IgnoreDirective] = parse_ignore_directives(
-            source_lines=source_lines,
-        )
-        assert len(result) == 1
-        assert result[0].reason is None
-
-    def test_indented_standalone(self) -> None:
-        source_lines: tuple[str, ...] = (
+        ),
+        [_directive(reason="legacy")],
+        id="block_level_standalone",
+    ),
+    pytest.param(
+        ("# pyguard: ignore-file[IMP001] because: plugin",),
+        [_directive(codes=frozenset({"IMP001"}), reason="plugin", is_file_level=True)],
+        id="file_level",
+    ),
+    pytest.param(
+        ("# pyguard: ignore[TYP001,TYP002] because: legacy",),
+        [_directive(codes=frozenset({"TYP001", "TYP002"}), reason="legacy")],
+        id="multiple_codes",
+    ),
+    pytest.param(
+        ("# pyguard: ignore[TYP001]",),
+        [_directive()],
+        id="no_reason",
+    ),
+    pytest.param(
+        (
             "def outer():",
             "    # pyguard: ignore[TYP001] because: x",
             "    def inner(a):",
             "        pass",
-        )
-        result: list[IgnoreDirective] = parse_ignore_directives(
-            source_lines=source_lines,
-        )
-        assert len(result) == 1
-        directive: IgnoreDirective = result[0]
-        assert directive.line == 2
-        assert directive.is_inline is False
-        assert directive.is_file_level is False
-
-    def test_multiple_directives(self) -> None:
-        source_lines: tuple[str, ...] = (
+        ),
+        [_directive(line=2, reason="x")],
+        id="indented_standalone",
+    ),
+    pytest.param(
+        (
             "# pyguard: ignore-file[IMP001] because: plugin",
             "# pyguard: ignore[TYP001] because: block-level",
             "def add(x, y):  # pyguard: ignore[TYP002] because: inline",
             "    return x + y",
-        )
+        ),
+        [
+            _directive(codes=frozenset({"IMP001"}), reason="plugin", is_file_level=True),
+            _directive(line=2, reason="block-level"),
+            _directive(
+                line=3, codes=frozenset({"TYP002"}), reason="inline", is_inline=True,
+            ),
+        ],
+        id="multiple_directives",
+    ),
+    pytest.param(
+        ('x = "#"  # pyguard: ignore[TYP001] because: legacy',),
+        [_directive(reason="legacy", is_inline=True)],
+        id="directive_after_unrelated_comment_hash",
+    ),
+    pytest.param(
+        (
+            "x = 1  # pyguard: ignore[]",
+            "x = 1  # pyguard: ignore[TYP001",
+            "x = 1  # pyguard: ignore[TYP001] because:",
+            "x = 1  # pyguard: ignore[TYP001] trailing text",
+        ),
+        [],
+        id="malformed_directives_ignored",
+    ),
+]
+
+
+class TestParseIgnoreDirectives:
+    @pytest.mark.parametrize(("source_lines", "expected"), _PARSE_CASES)
+    def test_parse(
+        self,
+        source_lines: tuple[str, ...],
+        expected: list[IgnoreDirective],
+    ) -> None:
         result: list[IgnoreDirective] = parse_ignore_directives(
             source_lines=source_lines,
         )
-        assert len(result) == 3
-        assert result[0].is_file_level is True
-        assert result[0].codes == frozenset({"IMP001"})
-        assert result[1].is_inline is False
-        assert result[1].is_file_level is False
-        assert result[1].codes == frozenset({"TYP001"})
-        assert result[2].is_inline is True
-        assert result[2].codes == frozenset({"TYP002"})
+        assert result == expected
+
+    def test_codes_are_interned(self) -> None:
+        code: str = "".join(["typ", "001"])
+        result: list[IgnoreDirective] = parse_ignore_directives(
+            source_lines=(f"x = 1  # pyguard: ignore[{code}]",),
+        )
+        assert next(iter(result[0].codes)) is sys.intern("TYP001")
+
+    def test_directive_is_slotted(self) -> None:
+        assert not hasattr(_directive(), "__dict__")
 
 
 # ---------------------------------------------------------------------------
@@ -168,16 +195,11 @@ class TestParseIgnoreDirectives:
 
 
 class TestApplyIgnoresLinelevel:
-    def test_inline_ignore_suppresses_matching_code(self) -> None:
-        code: str = (
-            "def add(x, y):  # pyguard: ignore[TYP001] because: legacy\n"
-            "    return x + y\n"
-        )
-        pr: ParseResult = _make_parse_result(code)
+    def test_inline_ignore_suppresses_matching_code(self, inline_ignore_pr: ParseResult) -> None:
         diag: Diagnostic = _make_diagnostic(line=1, code="TYP001")
         result: list[Diagnostic] = apply_ignores(
             diagnostics=[diag],
-            parse_result=pr,
+            parse_result=inline_ignore_pr,
             governance=_QUIET_GOVERNANCE,
         )
         assert result == []
@@ -189,7 +211,7 @@ class TestApplyIgnoresLinelevel:
             "def sub(a, b):\n"
             "    return a - b\n"
         )
-        pr: ParseResult = _make_parse_result(code)
+        pr: ParseResult = make_parse_result(code)
         diag_line1: Diagnostic = _make_diagnostic(line=1, code="TYP001")
         diag_line3: Diagnostic = _make_diagnostic(line=3, code="TYP001")
         result: list[Diagnostic] = apply_ignores(
@@ -200,16 +222,14 @@ class TestApplyIgnoresLinelevel:
         assert len(result) == 1
         assert result[0].location.line == 3
 
-    def test_inline_ignore_different_code_not_suppressed(self) -> None:
-        code: str = (
-            "def add(x, y):  # pyguard: ignore[TYP001] because: legacy\n"
-            "    return x + y\n"
-        )
-        pr: ParseResult = _make_parse_result(code)
+    def test_inline_ignore_different_code_not_suppressed(
+        self,
+        inline_ignore_pr: ParseResult,
+    ) -> None:
         diag: Diagnostic = _make_diagnostic(line=1, code="TYP002")
         result: list[Diagnostic] = apply_ignores(
             diagnostics=[diag],
-            parse_result=pr,
+            parse_result=inline_ignore_pr,
             governance=_QUIET_GOVERNANCE,
         )
         assert len(result) == 1
@@ -229,7 +249,7 @@ class TestApplyIgnoresBlockLevel:
             "    z = x + y\n"
             "    return z\n"
         )
-        pr: ParseResult = _make_parse_result(code)
+        pr: ParseResult = make_parse_result(code)
         diag_line2: Diagnostic = _make_diagnostic(line=2, code="TYP001")
         diag_line3: Diagnostic = _make_diagnostic(line=3, code="TYP001")
         result: list[Diagnostic] = apply_ignores(
@@ -247,7 +267,7 @@ class TestApplyIgnoresBlockLevel:
             "def sub(a, b):\n"
             "    return a - b\n"
         )
-        pr: ParseResult = _make_parse_result(code)
+        pr: ParseResult = make_parse_result(code)
         diag_inside: Diagnostic = _make_diagnostic(line=2, code="TYP001")
         diag_outside: Diagnostic = _make_diagnostic(line=4, code="TYP001")
         result: list[Diagnostic] = apply_ignores(
@@ -258,6 +278,46 @@ class TestApplyIgnoresBlockLevel:
         assert len(result) == 1
         assert result[0].location.line == 4
 
+    def test_block_and_inline_ignores_combine_on_same_line(self) -> None:
+        code: str = (
+            "# pyguard: ignore[TYP001] because: generated code\n"
+            "def add(x, y):\n"
+            "    return x + y  # pyguard: ignore[TYP002] because: legacy\n"
+        )
+        pr: ParseResult = make_parse_result(code)
+        diag_typ001: Diagnostic = _make_diagnostic(line=3, code="TYP001")
+        diag_typ002: Diagnostic = _make_diagnostic(line=3, code="TYP002")
+        diag_kw001: Diagnostic = _make_diagnostic(line=3, code="KW001")
+        result: list[Diagnostic] = apply_ignores(
+            diagnostics=[diag_typ001, diag_typ002, diag_kw001],
+            parse_result=pr,
+            governance=_QUIET_GOVERNANCE,
+        )
+        assert [d.code for d in result] == ["KW001"]
+
+    def test_nested_block_ignores_both_apply(self) -> None:
+        code: str = (
+            "# pyguard: ignore[TYP001] because: generated code\n"
+            "class C:\n"
+            "    # pyguard: ignore[TYP002] because: legacy\n"
+            "    def m(self, x):\n"
+            "        return x\n"
+            "    def n(self, y):\n"
+            "        return y\n"
+        )
+        pr: ParseResult = make_parse_result(code)
+        result: list[Diagnostic] = apply_ignores(
+            diagnostics=[
+                _make_diagnostic(line=4, code="TYP001"),
+                _make_diagnostic(line=4, code="TYP002"),
+                _make_diagnostic(line=6, code="TYP001"),
+                _make_diagnostic(line=6, code="TYP002"),
+            ],
+            parse_result=pr,
+            governance=_QUIET_GOVERNANCE,
+        )
+        assert [(d.location.line, d.code) for d in result] == [(6, "TYP002")]
+
 
 # ---------------------------------------------------------------------------
 # TestApplyIgnoresFileLevel
@@ -265,36 +325,22 @@ class TestApplyIgnoresBlockLevel:
 
 
 class TestApplyIgnoresFileLevel:
-    def test_file_ignore_suppresses_all_matching(self) -> None:
-        code: str = (
-            "# pyguard: ignore-file[TYP001] because: legacy module\n"
-            "def add(x, y):\n"
-            "    return x + y\n"
-            "def sub(a, b):\n"
-            "    return a - b\n"
-        )
-        pr: ParseResult = _make_parse_result(code)
+    def test_file_ignore_suppresses_all_matching(self, file_ignore_pr: ParseResult) -> None:
         diag1: Diagnostic = _make_diagnostic(line=2, code="TYP001")
         diag2: Diagnostic = _make_diagnostic(line=4, code="TYP001")
         result: list[Diagnostic] = apply_ignores(
             diagnostics=[diag1, diag2],
-            parse_result=pr,
+            parse_result=file_ignore_pr,
             governance=_QUIET_GOVERNANCE,
         )
         assert result == []
 
-    def test_file_ignore_does_not_affect_other_codes(self) -> None:
-        code: str = (
-            "# pyguard: ignore-file[TYP001] because: legacy module\n"
-            "def add(x, y):\n"
-            "    return x + y\n"
-        )
-        pr: ParseResult = _make_parse_result(code)
+    def test_file_ignore_does_not_affect_other_codes(self, file_ignore_pr: ParseResult) -> None:
         diag_typ001: Diagnostic = _make_diagnostic(line=2, code="TYP001")
         diag_typ002: Diagnostic = _make_diagnostic(line=2, code="TYP002")
         result: list[Diagnostic] = apply_ignores(
             diagnostics=[diag_typ001, diag_typ002],
-            parse_result=pr,
+            parse_result=file_ignore_pr,
             governance=_QUIET_GOVERNANCE,
         )
         assert len(result) == 1
@@ -307,51 +353,39 @@ class TestApplyIgnoresFileLevel:
 
 
 class TestGovernance:
-    def test_require_reason_generates_ign001(self) -> None:
+    def test_require_reason_generates_ign001(self, inline_ignore_no_reason_pr: ParseResult) -> None:
         """When require_reason=True and no reason, IGN001 is emitted but
         the original diagnostic is still suppressed by the ignore."""
-        code: str = (
-            "def add(x, y):  # pyguard: ignore[TYP001]\n"
-            "    return x + y\n"
-        )
-        pr: ParseResult = _make_parse_result(code)
         diag: Diagnostic = _make_diagnostic(line=1, code="TYP001")
         governance: IgnoreGovernance = IgnoreGovernance(require_reason=True)
         result: list[Diagnostic] = apply_ignores(
             diagnostics=[diag],
-            parse_result=pr,
+            parse_result=inline_ignore_no_reason_pr,
             governance=governance,
         )
         # Original TYP001 is suppressed; IGN001 is emitted for missing reason
-        ign_codes: list[str] = [d.code for d in result]
+        ign_codes: set[str] = {d.code for d in result}
         assert IGN001_CODE in ign_codes
         assert "TYP001" not in ign_codes
 
-    def test_require_reason_false_no_ign001(self) -> None:
-        code: str = (
-            "def add(x, y):  # pyguard: ignore[TYP001]\n"
-            "    return x + y\n"
-        )
-        pr: ParseResult = _make_parse_result(code)
+    def test_require_reason_false_no_ign001(self, inline_ignore_no_reason_pr: ParseResult) -> None:
         diag: Diagnostic = _make_diagnostic(line=1, code="TYP001")
         governance: IgnoreGovernance = IgnoreGovernance(require_reason=False)
         result: list[Diagnostic] = apply_ignores(
             diagnostics=[diag],
-            parse_result=pr,
+            parse_result=inline_ignore_no_reason_pr,
             governance=governance,
         )
-        ign_codes: list[str] = [d.code for d in result]
+        ign_codes: set[str] = {d.code for d in result}
         assert IGN001_CODE not in ign_codes
         assert "TYP001" not in ign_codes
 
-    def test_disallow_generates_ign002_and_keeps_diagnostic(self) -> None:
+    def test_disallow_generates_ign002_and_keeps_diagnostic(
+        self,
+        inline_ignore_pr: ParseResult,
+    ) -> None:
         """When a code is in the disallow set, IGN002 is emitted and the
         original diagnostic is NOT suppressed."""
-        code: str = (
-            "def add(x, y):  # pyguard: ignore[TYP001] because: legacy\n"
-            "    return x + y\n"
-        )
-        pr: ParseResult = _make_parse_result(code)
         diag: Diagnostic = _make_diagnostic(line=1, code="TYP001")
         governance: IgnoreGovernance = IgnoreGovernance(
             require_reason=False,
@@ -359,10 +393,10 @@ class TestGovernance:
         )
         result: list[Diagnostic] = apply_ignores(
             diagnostics=[diag],
-            parse_result=pr,
+            parse_result=inline_ignore_pr,
             governance=governance,
         )
-        result_codes: list[str] = [d.code for d in result]
+        result_codes: set[str] = {d.code for d in result}
         assert IGN002_CODE in result_codes
         assert "TYP001" in result_codes
 
@@ -372,7 +406,7 @@ class TestGovernance:
             "y = 2  # pyguard: ignore[TYP001] because: b\n"
             "z = 3  # pyguard: ignore[TYP001] because: c\n"
         )
-        pr: ParseResult = _make_parse_result(code)
+        pr: ParseResult = make_parse_result(code)
         governance: IgnoreGovernance = IgnoreGovernance(
             require_reason=False,
             max_per_file=2,
@@ -382,7 +416,7 @@ class TestGovernance:
             parse_result=pr,
             governance=governance,
         )
-        result_codes: list[str] = [d.code for d in result]
+        result_codes: set[str] = {d.code for d in result}
         assert IGN003_CODE in result_codes
         ign003_diags: list[Diagnostic] = [
             d for d in result if d.code == IGN003_CODE
@@ -390,3 +424,18 @@ class TestGovernance:
         assert len(ign003_diags) == 1
         assert "3 ignore directives" in ign003_diags[0].message
         assert "maximum allowed is 2" in ign003_diags[0].message
+
+    def test_source_without_pragma_returned_unchanged(self) -> None:
+        pr: ParseResult = make_parse_result("def add(x, y):\n    return x + y\n")
+        diag: Diagnostic = _make_diagnostic(line=1, code="TYP001")
+        governance: IgnoreGovernance = IgnoreGovernance(
+            require_reason=True,
+            disallow=frozenset({"TYP001"}),
+            max_per_file=0,
+        )
+        result: list[Diagnostic] = apply_ignores(
+            diagnostics=[diag],
+            parse_result=pr,
+            governance=governance,
+        )
+        assert result == [diag]
@@ -1,37 +1,80 @@
 """Tests for --verbose and --debug logging flags."""
 from __future__ import annotations
 
+import collections
 import contextlib
 import logging
 from collections.abc import Generator
+from dataclasses import dataclass
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
 from pyguard.cli import cli
 
-
 _SAMPLE_SOURCE: str = """\
 def greet(name: str) -> None:
     print(name)
 """
 
+# mode -> (global flags, subcommand args, captured log level).  Ordered so
+# the fix run comes last and cannot affect what the lint runs see.
+_INVOCATIONS: dict[str, tuple[list[str], list[str], int]] = {
+    "default": ([], ["lint"], logging.DEBUG),
+    "verbose": (["--verbose"], ["lint"], logging.INFO),
+    "verbose_json": (["--verbose"], ["lint", "--format", "json"], logging.INFO),
+    "debug": (["--debug"], ["lint"], logging.DEBUG),
+    "verbose_fix": (["--verbose"], ["fix"], logging.INFO),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _CliRun:
+    exit_code: int
+    output: str
+    records: list[logging.LogRecord]
+
+    @property
+    def messages(self) -> str:
+        return "\n".join(r.message for r in self.records)
+
+
+@pytest.fixture(scope="module")
+def cli_runs(tmp_path_factory: pytest.TempPathFactory) -> dict[str, _CliRun]:
+    """Run every logging mode once over one shared project.
+
+    The project holds one clean module plus a ``__pycache__`` copy that
+    the scanner must exclude.
+    """
+    root: Path = tmp_path_factory.mktemp("logs")
+    (root / "a.py").write_text(_SAMPLE_SOURCE)
+    cache_dir: Path = root / "__pycache__"
+    cache_dir.mkdir()
+    (cache_dir / "cached.py").write_text(_SAMPLE_SOURCE)
+
+    runner: CliRunner = CliRunner()
+    runs: dict[str, _CliRun] = {}
+    for mode, (flags, command, level) in _INVOCATIONS.items():
+        with _capture_logs("pyguard", level=level) as records:
+            result = runner.invoke(cli, [*flags, *command, str(root)])
+        runs[mode] = _CliRun(
+            exit_code=result.exit_code,
+            output=result.output,
+            records=list(records),
+        )
+    return runs
+
 
 class TestDefaultNoLogging:
     """Default mode should not emit logging output."""
 
-    def test_lint_no_log_by_default(
-        self, tmp_path: Path, caplog: logging.LogRecord,
-    ) -> None:
-        (tmp_path / "a.py").write_text(_SAMPLE_SOURCE)
-        runner: CliRunner = CliRunner()
-        with caplog.at_level(logging.DEBUG):  # type: ignore[union-attr]
-            result = runner.invoke(cli, ["lint", str(tmp_path)])
-
-        assert result.exit_code == 0
+    def test_lint_no_log_by_default(self, cli_runs: dict[str, _CliRun]) -> None:
+        run: _CliRun = cli_runs["default"]
+        assert run.exit_code == 0
         # No pyguard log records at WARNING or above in normal output
         pyguard_warnings: list[str] = [
-            r.message for r in caplog.records  # type: ignore[union-attr]
+            r.message for r in run.records
             if r.name.startswith("pyguard") and r.levelno >= logging.WARNING
         ]
         assert pyguard_warnings == []
@@ -40,80 +83,36 @@ class TestDefaultNoLogging:
 class TestVerboseFlag:
     """--verbose shows INFO-level messages."""
 
-    def test_verbose_lint_shows_file_count(self, tmp_path: Path) -> None:
-        (tmp_path / "a.py").write_text(_SAMPLE_SOURCE)
-        runner: CliRunner = CliRunner()
-        with _capture_logs("pyguard") as records:
-            runner.invoke(cli, ["--verbose", "lint", str(tmp_path)])
-
-        messages: str = "\n".join(r.message for r in records)
+    def test_verbose_lint_shows_file_count(self, cli_runs: dict[str, _CliRun]) -> None:
+        messages: str = cli_runs["verbose"].messages
         assert "Found 1 files" in messages
         assert "Completed in" in messages
 
-    def test_verbose_fix_shows_file_count(self, tmp_path: Path) -> None:
-        (tmp_path / "a.py").write_text(_SAMPLE_SOURCE)
-        runner: CliRunner = CliRunner()
-        with _capture_logs("pyguard") as records:
-            runner.invoke(cli, ["--verbose", "fix", str(tmp_path)])
+    def test_verbose_fix_shows_file_count(self, cli_runs: dict[str, _CliRun]) -> None:
+        assert "Found 1 files to fix" in cli_runs["verbose_fix"].messages
 
-        messages: str = "\n".join(r.message for r in records)
-        assert "Found 1 files to fix" in messages
-
-    def test_verbose_does_not_corrupt_stdout(self, tmp_path: Path) -> None:
-        (tmp_path / "a.py").write_text(_SAMPLE_SOURCE)
-        runner: CliRunner = CliRunner()
-        result = runner.invoke(
-            cli, ["--verbose", "lint", "--format", "json", str(tmp_path)],
-        )
-
-        assert result.exit_code == 0
+    def test_verbose_does_not_corrupt_stdout(self, cli_runs: dict[str, _CliRun]) -> None:
+        run: _CliRun = cli_runs["verbose_json"]
+        assert run.exit_code == 0
         # Stdout should not contain log prefixes
-        assert "pyguard.runner:" not in result.output
+        assert "pyguard.runner:" not in run.output
 
 
 class TestDebugFlag:
     """--debug shows DEBUG-level messages."""
 
-    def test_debug_shows_per_file_detail(self, tmp_path: Path) -> None:
-        (tmp_path / "a.py").write_text(_SAMPLE_SOURCE)
-        runner: CliRunner = CliRunner()
-        with _capture_logs("pyguard", level=logging.DEBUG) as records:
-            runner.invoke(cli, ["--debug", "lint", str(tmp_path)])
-
-        messages: str = "\n".join(r.message for r in records)
-        assert "Checking" in messages
-
-    def test_debug_shows_rule_diagnostics(self, tmp_path: Path) -> None:
-        (tmp_path / "a.py").write_text(_SAMPLE_SOURCE)
-        runner: CliRunner = CliRunner()
-        with _capture_logs("pyguard", level=logging.DEBUG) as records:
-            runner.invoke(cli, ["--debug", "lint", str(tmp_path)])
-
-        messages: str = "\n".join(r.message for r in records)
-        assert "diagnostics" in messages
-
-    def test_debug_shows_scanner_exclusions(self, tmp_path: Path) -> None:
-        (tmp_path / "good.py").write_text(_SAMPLE_SOURCE)
-        cache_dir: Path = tmp_path / "__pycache__"
-        cache_dir.mkdir()
-        (cache_dir / "cached.py").write_text(_SAMPLE_SOURCE)
-
-        runner: CliRunner = CliRunner()
-        with _capture_logs("pyguard", level=logging.DEBUG) as records:
-            runner.invoke(cli, ["--debug", "lint", str(tmp_path)])
-
-        messages: str = "\n".join(r.message for r in records)
-        assert "Excluded" in messages
-
-    def test_debug_includes_info_messages(self, tmp_path: Path) -> None:
-        (tmp_path / "a.py").write_text(_SAMPLE_SOURCE)
-        runner: CliRunner = CliRunner()
-        with _capture_logs("pyguard", level=logging.DEBUG) as records:
-            runner.invoke(cli, ["--debug", "lint", str(tmp_path)])
-
-        messages: str = "\n".join(r.message for r in records)
-        assert "Found" in messages
-        assert "Completed in" in messages
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            "Checking",  # per-file detail
+            "diagnostics",  # per-rule diagnostics
+            "Excluded",  # scanner exclusions
+            "Found",  # INFO messages are included
+            "Completed in",
+        ],
+    )
+    def test_debug_lint_output(self, cli_runs: dict[str, _CliRun], needle: str) -> None:
+        assert needle in cli_runs["debug"].messages
 
 
 class _LogCapture(logging.Handler):
@@ -121,7 +120,7 @@ class _LogCapture(logging.Handler):
 
     def __init__(self) -> None:
         super().__init__()
-        self.records: list[logging.LogRecord] = []
+        self.records: collections.deque[logging.LogRecord] = collections.deque()
 
     def emit(self, record: logging.LogRecord) -> None:
         self.records.append(record)
@@ -130,7 +129,7 @@ class _LogCapture(logging.Handler):
 @contextlib.contextmanager
 def _capture_logs(
     name: str, *, level: int = logging.INFO,
-) -> Generator[list[logging.LogRecord], None, None]:
+) -> Generator[collections.deque[logging.LogRecord], None, None]:
     """Capture log records from a named logger."""
     handler = _LogCapture()
     handler.setLevel(level)
@@ -130,3 +130,11 @@ def test_dataclasses_are_frozen() -> None:
     info = SyntaxErrorInfo(line=1, column=1, message="test", source_line=None)
     with pytest.raises(AttributeError):
         info.line = 2  # type: ignore[misc]
+
+
+def test_results_are_slotted(tmp_path: Path) -> None:
+    file_path: Path = tmp_path / "broken.py"
+    file_path.write_text("def broken(\n")
+    result = parse_file(file=file_path)
+    assert not hasattr(result, "__dict__")
+    assert not hasattr(result.syntax_error, "__dict__")
@@ -4,6 +4,10 @@ from __future__ import annotations
 from pathlib import Path
 
 _HOOKS_FILE: Path = Path(__file__).parent.parent / ".pre-commit-hooks.yaml"
+# Read once at import; a missing file is reported by test_hooks_file_exists
+_HOOKS_CONTENT: str = _HOOKS_FILE.read_text() if _HOOKS_FILE.exists() else ""
+_HOOKS_LINES: tuple[str, ...] = tuple(_HOOKS_CONTENT.splitlines())
+_HOOKS_BLOCKS: tuple[str, ...] = tuple(_HOOKS_CONTENT.split("- id:")[1:])
 
 
 class TestPreCommitHooksFile:
@@ -13,38 +17,34 @@ class TestPreCommitHooksFile:
         assert _HOOKS_FILE.exists()
 
     def test_hooks_file_is_valid_yaml(self) -> None:
-        content: str = _HOOKS_FILE.read_text()
+        content: str = _HOOKS_CONTENT
         # Basic structure check: should have id, name, language, entry, types
         assert "- id:" in content
 
     def test_lint_hook_defined(self) -> None:
-        content: str = _HOOKS_FILE.read_text()
+        content: str = _HOOKS_CONTENT
         assert "id: pyguard-lint" in content
         assert "entry: pyguard lint" in content
         assert "language: python" in content
         assert "types: [python]" in content
 
     def test_fix_hook_defined(self) -> None:
-        content: str = _HOOKS_FILE.read_text()
+        content: str = _HOOKS_CONTENT
         assert "id: pyguard-fix" in content
         assert "entry: pyguard fix --check" in content
         assert "language: python" in content
 
     def test_hook_ids_are_unique(self) -> None:
-        content: str = _HOOKS_FILE.read_text()
         ids: list[str] = [
             line.split("id:")[1].strip()
-            for line in content.splitlines()
+            for line in _HOOKS_LINES
             if line.strip().startswith("- id:")
         ]
         assert len(ids) == len(set(ids))
         assert len(ids) == 2
 
     def test_all_hooks_have_required_fields(self) -> None:
-        content: str = _HOOKS_FILE.read_text()
-        # Split into hook blocks
-        blocks: list[str] = content.split("- id:")[1:]
-        for block in blocks:
+        for block in _HOOKS_BLOCKS:
             assert "name:" in block
             assert "language:" in block
             assert "entry:" in block
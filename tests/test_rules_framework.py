@@ -45,14 +45,36 @@ class FakeRule:
         ]
 
 
+# Stateless, so one instance serves every test
+_FAKE_RULE: FakeRule = FakeRule()
+
+
+class CountingRule:
+    """A rule that records how often the runner invoked it."""
+
+    def __init__(self) -> None:
+        self.calls: int = 0
+
+    @property
+    def code(self) -> str:
+        return "FAKE01"
+
+    def check(
+        self,
+        *,
+        parse_result: ParseResult,
+        config: PyGuardConfig,
+    ) -> list[Diagnostic]:
+        self.calls += 1
+        return []
+
+
 class TestRuleProtocol:
     def test_fake_rule_satisfies_protocol(self) -> None:
-        rule: FakeRule = FakeRule()
-        assert isinstance(rule, Rule)
+        assert isinstance(_FAKE_RULE, Rule)
 
     def test_fake_rule_has_code(self) -> None:
-        rule: FakeRule = FakeRule()
-        assert rule.code == "FAKE01"
+        assert _FAKE_RULE.code == "FAKE01"
 
 
 class TestRegistry:
@@ -73,28 +95,46 @@ class TestRegistry:
         assert "TYP001" not in codes
 
 
+@pytest.fixture(scope="module")
+def good_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A project holding one parseable module, shared by the runner tests."""
+    root: Path = tmp_path_factory.mktemp("good")
+    _write_file(root / "good.py", "x: int = 1\n")
+    return root
+
+
 class TestRunnerRuleIntegration:
+    @pytest.mark.parametrize(
+        ("severity", "expected_diags", "expected_exit"),
+        [
+            pytest.param(Severity.WARN, 1, 0, id="warn"),
+            pytest.param(Severity.ERROR, 1, 1, id="error"),
+            pytest.param(Severity.OFF, 0, 0, id="off"),
+        ],
+    )
     def test_rules_run_on_valid_files(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        good_project: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        severity: Severity,
+        expected_diags: int,
+        expected_exit: int,
     ) -> None:
-        """Rules should produce diagnostics for valid (parseable) files."""
-        _write_file(tmp_path / "good.py", "x: int = 1\n")
-
-        fake_rule: FakeRule = FakeRule()
+        """Rules run on parseable files; OFF rules are skipped and only ERROR fails."""
+        monkeypatch.setattr(registry_mod, "_all_rules", lambda: [_FAKE_RULE])
 
-        monkeypatch.setattr(registry_mod, "_all_rules", lambda: [fake_rule])
-
-        severities: dict[str, Severity] = {"FAKE01": Severity.WARN}
+        severities: dict[str, Severity] = {"FAKE01": severity}
         config: PyGuardConfig = PyGuardConfig(
             rules=RuleConfig(severities=MappingProxyType(severities)),
         )
-        result: LintResult = lint_paths(paths=(tmp_path,), config=config)
+        result: LintResult = lint_paths(paths=(good_project,), config=config)
 
         assert result.files_checked == 1
-        assert len(result.diagnostics) == 1
-        diag: Diagnostic = result.diagnostics.sorted[0]
-        assert diag.code == "FAKE01"
-        assert diag.severity == Severity.WARN
+        assert len(result.diagnostics) == expected_diags
+        assert result.exit_code == expected_exit
+        for diag in result.diagnostics.sorted:
+            assert diag.code == "FAKE01"
+            assert diag.severity == severity
 
     def test_rules_skipped_on_syntax_error(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
@@ -102,27 +142,8 @@ class TestRunnerRuleIntegration:
         """Rules should NOT run on files with syntax errors."""
         _write_file(tmp_path / "bad.py", "def broken(\n")
 
-        call_count: list[int] = [0]
-
-        class CountingRule:
-            @property
-            def code(self) -> str:
-                return "FAKE01"
-
-            def check(
-                self,
-                *,
-                parse_result: ParseResult,
-                config: PyGuardConfig,
-            ) -> list[Diagnostic]:
-                call_count[0] += 1
-                return []
-
-        monkeypatch.setattr(
-            registry_mod,
-            "_all_rules",
-            lambda: [CountingRule()],
-        )
+        counting_rule: CountingRule = CountingRule()
+        monkeypatch.setattr(registry_mod, "_all_rules", lambda: [counting_rule])
 
         severities: dict[str, Severity] = {"FAKE01": Severity.ERROR}
         config: PyGuardConfig = PyGuardConfig(
@@ -130,55 +151,6 @@ class TestRunnerRuleIntegration:
         )
         result: LintResult = lint_paths(paths=(tmp_path,), config=config)
 
-        assert call_count[0] == 0
+        assert counting_rule.calls == 0
         assert result.diagnostics.error_count == 1
         assert result.diagnostics.sorted[0].code == "SYN001"
-
-    def test_disabled_rules_not_run(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Rules set to OFF should not be included."""
-        _write_file(tmp_path / "good.py", "x: int = 1\n")
-
-        monkeypatch.setattr(registry_mod, "_all_rules", lambda: [FakeRule()])
-
-        severities: dict[str, Severity] = {"FAKE01": Severity.OFF}
-        config: PyGuardConfig = PyGuardConfig(
-            rules=RuleConfig(severities=MappingProxyType(severities)),
-        )
-        result: LintResult = lint_paths(paths=(tmp_path,), config=config)
-
-        assert result.files_checked == 1
-        assert len(result.diagnostics) == 0
-
-    def test_error_severity_sets_exit_code(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """ERROR-severity diagnostics should cause exit code 1."""
-        _write_file(tmp_path / "good.py", "x: int = 1\n")
-
-        monkeypatch.setattr(registry_mod, "_all_rules", lambda: [FakeRule()])
-
-        severities: dict[str, Severity] = {"FAKE01": Severity.ERROR}
-        config: PyGuardConfig = PyGuardConfig(
-            rules=RuleConfig(severities=MappingProxyType(severities)),
-        )
-        result: LintResult = lint_paths(paths=(tmp_path,), config=config)
-
-        assert result.exit_code == 1
-
-    def test_warn_severity_exit_code_zero(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """WARN-severity diagnostics should NOT cause exit code 1."""
-        _write_file(tmp_path / "good.py", "x: int = 1\n")
-
-        monkeypatch.setattr(registry_mod, "_all_rules", lambda: [FakeRule()])
-
-        severities: dict[str, Severity] = {"FAKE01": Severity.WARN}
-        config: PyGuardConfig = PyGuardConfig(
-            rules=RuleConfig(severities=MappingProxyType(severities)),
-        )
-        result: LintResult = lint_paths(paths=(tmp_path,), config=config)
-
-        assert result.exit_code == 0
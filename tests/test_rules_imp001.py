@@ -1,47 +1,58 @@
 """Tests for IMP001 rule: Disallow imports inside function bodies."""
 from __future__ import annotations
 
-import ast
-from pathlib import Path
+import pytest
 
 from pyguard.diagnostics import Diagnostic
-from pyguard.parser import ParseResult
 from pyguard.rules.imp001 import IMP001Rule
 from pyguard.types import PyGuardConfig
+from tests._helpers import EMPTY_PARSE_RESULT, make_parse_result
 
-
-def _make_parse_result(code: str) -> ParseResult:
-    file: Path = Path("test.py")
-    source_lines: tuple[str, ...] = tuple(code.splitlines())
-    tree: ast.Module = ast.parse(code, filename=str(file))
-    return ParseResult(
-        file=file,
-        tree=tree,
-        source=code,
-        source_lines=source_lines,
-        syntax_error=None,
-    )
+RULE: IMP001Rule = IMP001Rule()
+CONFIG: PyGuardConfig = PyGuardConfig()
 
 
 def _check(code: str) -> list[Diagnostic]:
-    rule: IMP001Rule = IMP001Rule()
-    return rule.check(parse_result=_make_parse_result(code), config=PyGuardConfig())
+    return RULE.check(parse_result=make_parse_result(code), config=CONFIG)
+
+
+_FLAGGED_CASES: list[object] = [
+    pytest.param("def f() -> None:\n    import json\n", 2, "'json'", id="import"),
+    pytest.param(
+        "def f() -> None:\n    from pathlib import Path\n",
+        2,
+        "'pathlib.Path'",
+        id="from_import",
+    ),
+    pytest.param(
+        "def outer() -> None:\n"
+        "    def inner() -> None:\n"
+        "        import os\n"
+        "    inner()\n",
+        3,
+        "'os'",
+        id="nested_function",
+    ),
+    pytest.param("async def f() -> None:\n    import json\n", 2, "'json'", id="async_function"),
+    pytest.param(
+        "class C:\n"
+        "    def m(self) -> None:\n"
+        "        import json\n",
+        3,
+        "'json'",
+        id="method",
+    ),
+]
 
 
 class TestIMP001BasicDetection:
-    def test_import_in_function(self) -> None:
-        diags: list[Diagnostic] = _check("def f() -> None:\n    import json\n")
+    @pytest.mark.parametrize(("code", "line", "needle"), _FLAGGED_CASES)
+    def test_function_import_flagged(self, code: str, line: int, needle: str) -> None:
+        diags: list[Diagnostic] = _check(code)
         assert len(diags) == 1
         assert diags[0].code == "IMP001"
-        assert diags[0].location.line == 2
-        assert "'json'" in diags[0].message
-
-    def test_from_import_in_function(self) -> None:
-        diags: list[Diagnostic] = _check(
-            "def f() -> None:\n    from pathlib import Path\n"
-        )
-        assert len(diags) == 1
-        assert "'pathlib.Path'" in diags[0].message
+        assert diags[0].location.line == line
+        assert needle in diags[0].message
 
     def test_multiple_imports(self) -> None:
         code: str = (
@@ -54,32 +65,6 @@ class TestIMP001BasicDetection:
         assert diags[0].location.line == 2
         assert diags[1].location.line == 3
 
-    def test_nested_function(self) -> None:
-        code: str = (
-            "def outer() -> None:\n"
-            "    def inner() -> None:\n"
-            "        import os\n"
-            "    inner()\n"
-        )
-        diags: list[Diagnostic] = _check(code)
-        assert len(diags) == 1
-        assert "'os'" in diags[0].message
-
-    def test_async_function(self) -> None:
-        diags: list[Diagnostic] = _check(
-            "async def f() -> None:\n    import json\n"
-        )
-        assert len(diags) == 1
-
-    def test_method_import(self) -> None:
-        code: str = (
-            "class C:\n"
-            "    def m(self) -> None:\n"
-            "        import json\n"
-        )
-        diags: list[Diagnostic] = _check(code)
-        assert len(diags) == 1
-
 
 class TestIMP001NoFalsePositives:
     def test_top_level_import_ok(self) -> None:
@@ -115,49 +100,26 @@ class TestIMP001Exemptions:
         diags: list[Diagnostic] = _check(code)
         assert diags == []
 
-    def test_try_except_import_error_exempt(self) -> None:
+    @pytest.mark.parametrize(
+        ("handler", "expected_lines"),
+        [
+            pytest.param(" ImportError", [], id="import_error"),
+            pytest.param(" ModuleNotFoundError", [], id="module_not_found"),
+            pytest.param("", [], id="bare"),
+            pytest.param(" (ImportError, ValueError)", [], id="tuple"),
+            pytest.param(" ValueError", [3, 5], id="non_import_error"),
+        ],
+    )
+    def test_try_except_fallback(self, handler: str, expected_lines: list[int]) -> None:
         code: str = (
             "def f() -> None:\n"
             "    try:\n"
             "        import ujson as json\n"
-            "    except ImportError:\n"
+            f"    except{handler}:\n"
             "        import json\n"
         )
         diags: list[Diagnostic] = _check(code)
-        assert diags == []
-
-    def test_try_except_module_not_found_exempt(self) -> None:
-        code: str = (
-            "def f() -> None:\n"
-            "    try:\n"
-            "        import ujson\n"
-            "    except ModuleNotFoundError:\n"
-            "        import json\n"
-        )
-        diags: list[Diagnostic] = _check(code)
-        assert diags == []
-
-    def test_bare_except_exempt(self) -> None:
-        code: str = (
-            "def f() -> None:\n"
-            "    try:\n"
-            "        import ujson\n"
-            "    except:\n"
-            "        import json\n"
-        )
-        diags: list[Diagnostic] = _check(code)
-        assert diags == []
-
-    def test_try_except_non_import_error_not_exempt(self) -> None:
-        code: str = (
-            "def f() -> None:\n"
-            "    try:\n"
-            "        import json\n"
-            "    except ValueError:\n"
-            "        pass\n"
-        )
-        diags: list[Diagnostic] = _check(code)
-        assert len(diags) == 1
+        assert [d.location.line for d in diags] == expected_lines
 
     def test_type_checking_in_function_exempt(self) -> None:
         code: str = (
@@ -171,13 +133,6 @@ class TestIMP001Exemptions:
 
 
 class TestIMP001SyntaxError:
-    def test_syntax_error_returns_empty(self) -> None:
-        rule: IMP001Rule = IMP001Rule()
-        pr: ParseResult = ParseResult(
-            file=Path("test.py"),
-            tree=None,
-            source="def f(\n",
-            source_lines=("def f(",),
-            syntax_error=None,
-        )
-        assert rule.check(parse_result=pr, config=PyGuardConfig()) == []
+    def test_none_tree_returns_empty(self) -> None:
+        diags: list[Diagnostic] = RULE.check(parse_result=EMPTY_PARSE_RESULT, config=CONFIG)
+        assert diags == []
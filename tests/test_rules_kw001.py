@@ -1,30 +1,20 @@
 """Tests for KW001: Require keyword-only parameters."""
 from __future__ import annotations
 
-import ast
-from pathlib import Path
+import functools
 from types import MappingProxyType
 
+import pytest
+
 from pyguard.constants import Severity
 from pyguard.diagnostics import Diagnostic
 from pyguard.parser import ParseResult
 from pyguard.rules.kw001 import KW001Rule
 from pyguard.types import KW001Options, PyGuardConfig, RuleConfig
+from tests._helpers import EMPTY_PARSE_RESULT, make_parse_result
 
 
-def _make_parse_result(code: str) -> ParseResult:
-    file: Path = Path("test.py")
-    source_lines: tuple[str, ...] = tuple(code.splitlines())
-    tree: ast.Module = ast.parse(code, filename=str(file))
-    return ParseResult(
-        file=file,
-        tree=tree,
-        source=code,
-        source_lines=source_lines,
-        syntax_error=None,
-    )
-
-
+@functools.cache
 def _make_config(
     *,
     severity: Severity = Severity.WARN,
@@ -50,10 +40,19 @@ def _make_config(
 RULE: KW001Rule = KW001Rule()
 CONFIG: PyGuardConfig = _make_config()
 
+# Two positional parameters: exactly the default min_params threshold
+_TWO_PARAM_SRC: str = "def func(a: int, b: int) -> None:\n    pass\n"
+
+
+@pytest.fixture(scope="module")
+def two_param_diags() -> list[Diagnostic]:
+    """Diagnostics for ``_TWO_PARAM_SRC`` under the default config."""
+    return RULE.check(parse_result=make_parse_result(_TWO_PARAM_SRC), config=CONFIG)
+
 
 class TestKW001BasicDetection:
     def test_public_function_multiple_params_flagged(self) -> None:
-        result: ParseResult = _make_parse_result(
+        result: ParseResult = make_parse_result(
             "def create_user(name: str, email: str, age: int) -> None:\n    pass\n"
         )
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
@@ -63,107 +62,82 @@ class TestKW001BasicDetection:
         assert "Function" in diags[0].message
 
     def test_function_with_star_separator_clean(self) -> None:
-        result: ParseResult = _make_parse_result(
+        result: ParseResult = make_parse_result(
             "def create_user(*, name: str, email: str) -> None:\n    pass\n"
         )
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
     def test_function_with_star_args_clean(self) -> None:
-        result: ParseResult = _make_parse_result(
+        result: ParseResult = make_parse_result(
             "def func(*args: int) -> None:\n    pass\n"
         )
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
     def test_function_with_args_and_kwonly_clean(self) -> None:
-        result: ParseResult = _make_parse_result(
+        result: ParseResult = make_parse_result(
             "def func(a: int, *args: int, key: str) -> None:\n    pass\n"
         )
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
     def test_single_param_exempt(self) -> None:
-        result: ParseResult = _make_parse_result(
+        result: ParseResult = make_parse_result(
             "def get_user(user_id: int) -> None:\n    pass\n"
         )
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
     def test_no_params_exempt(self) -> None:
-        result: ParseResult = _make_parse_result(
+        result: ParseResult = make_parse_result(
             "def noop() -> None:\n    pass\n"
         )
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
-    def test_exactly_min_params_flagged(self) -> None:
-        result: ParseResult = _make_parse_result(
-            "def func(a: int, b: int) -> None:\n    pass\n"
-        )
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
-        assert len(diags) == 1
+    def test_exactly_min_params_flagged(self, two_param_diags: list[Diagnostic]) -> None:
+        assert len(two_param_diags) == 1
+
+
+# exemption option -> a snippet that option exempts
+_EXEMPTION_CASES: list[object] = [
+    pytest.param(
+        "exempt_dunder",
+        "class Point:\n"
+        "    def __init__(self, x: int, y: int) -> None:\n"
+        "        self.x = x\n",
+        id="dunder",
+    ),
+    pytest.param(
+        "exempt_private",
+        "def _helper(a: int, b: int) -> int:\n    return a + b\n",
+        id="private",
+    ),
+    pytest.param(
+        "exempt_overrides",
+        "class Child:\n"
+        "    @override\n"
+        "    def process(self, a: int, b: int) -> None:\n"
+        "        pass\n",
+        id="override",
+    ),
+]
 
 
 class TestKW001Exemptions:
-    def test_dunder_method_exempt(self) -> None:
-        code: str = (
-            "class Point:\n"
-            "    def __init__(self, x: int, y: int) -> None:\n"
-            "        self.x = x\n"
-        )
-        result: ParseResult = _make_parse_result(code)
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
-        assert diags == []
-
-    def test_dunder_not_exempt_when_disabled(self) -> None:
-        config: PyGuardConfig = _make_config(exempt_dunder=False)
-        code: str = (
-            "class Point:\n"
-            "    def __init__(self, x: int, y: int) -> None:\n"
-            "        self.x = x\n"
-        )
-        result: ParseResult = _make_parse_result(code)
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=config)
-        assert len(diags) == 1
-
-    def test_private_function_exempt(self) -> None:
-        result: ParseResult = _make_parse_result(
-            "def _internal_helper(a: int, b: int, c: int) -> int:\n    return a + b + c\n"
-        )
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
-        assert diags == []
-
-    def test_private_not_exempt_when_disabled(self) -> None:
-        config: PyGuardConfig = _make_config(exempt_private=False)
-        result: ParseResult = _make_parse_result(
-            "def _helper(a: int, b: int) -> int:\n    return a + b\n"
-        )
+    @pytest.mark.parametrize(("option", "code"), _EXEMPTION_CASES)
+    @pytest.mark.parametrize(
+        ("exempt", "expected_len"),
+        [pytest.param(True, 0, id="enabled"), pytest.param(False, 1, id="disabled")],
+    )
+    def test_exemption_toggle(
+        self, option: str, code: str, exempt: bool, expected_len: int
+    ) -> None:
+        config: PyGuardConfig = _make_config(**{option: exempt})
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=config)
-        assert len(diags) == 1
-
-    def test_override_decorated_exempt(self) -> None:
-        code: str = (
-            "class Child:\n"
-            "    @override\n"
-            "    def process(self, a: int, b: int) -> None:\n"
-            "        pass\n"
-        )
-        result: ParseResult = _make_parse_result(code)
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
-        assert diags == []
-
-    def test_override_not_exempt_when_disabled(self) -> None:
-        config: PyGuardConfig = _make_config(exempt_overrides=False)
-        code: str = (
-            "class Child:\n"
-            "    @override\n"
-            "    def process(self, a: int, b: int) -> None:\n"
-            "        pass\n"
-        )
-        result: ParseResult = _make_parse_result(code)
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=config)
-        assert len(diags) == 1
+        assert len(diags) == expected_len
 
 
 class TestKW001Methods:
@@ -173,7 +147,7 @@ class TestKW001Methods:
             "    def double(self, value: int) -> int:\n"
             "        return value * 2\n"
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
@@ -183,7 +157,7 @@ class TestKW001Methods:
             "    def compute(self, a: int, b: int, op: str) -> int:\n"
             "        return a + b\n"
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
         assert "Method" in diags[0].message
@@ -196,7 +170,7 @@ class TestKW001Methods:
             "    def create(cls, name: str) -> None:\n"
             "        pass\n"
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
@@ -207,7 +181,7 @@ class TestKW001Methods:
             "    def create(cls, name: str, value: int) -> None:\n"
             "        pass\n"
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
 
@@ -218,7 +192,7 @@ class TestKW001Methods:
             "    def add(a: int, b: int) -> int:\n"
             "        return a + b\n"
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
 
@@ -226,15 +200,13 @@ class TestKW001Methods:
 class TestKW001Config:
     def test_min_params_3(self) -> None:
         config: PyGuardConfig = _make_config(min_params=3)
-        result: ParseResult = _make_parse_result(
-            "def func(a: int, b: int) -> None:\n    pass\n"
-        )
+        result: ParseResult = make_parse_result(_TWO_PARAM_SRC)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=config)
         assert diags == []
 
     def test_min_params_3_with_3_params_flagged(self) -> None:
         config: PyGuardConfig = _make_config(min_params=3)
-        result: ParseResult = _make_parse_result(
+        result: ParseResult = make_parse_result(
             "def func(a: int, b: int, c: int) -> None:\n    pass\n"
         )
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=config)
@@ -242,16 +214,14 @@ class TestKW001Config:
 
     def test_severity_from_config(self) -> None:
         config: PyGuardConfig = _make_config(severity=Severity.ERROR)
-        result: ParseResult = _make_parse_result(
-            "def func(a: int, b: int) -> None:\n    pass\n"
-        )
+        result: ParseResult = make_parse_result(_TWO_PARAM_SRC)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=config)
         assert diags[0].severity == Severity.ERROR
 
 
 class TestKW001AsyncAndNested:
     def test_async_function_flagged(self) -> None:
-        result: ParseResult = _make_parse_result(
+        result: ParseResult = make_parse_result(
             "async def fetch(url: str, timeout: int) -> None:\n    pass\n"
         )
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
@@ -263,34 +233,26 @@ class TestKW001AsyncAndNested:
             "    def inner(a: int, b: int) -> int:\n"
             "        return a + b\n"
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
         assert diags[0].location.line == 2
 
 
 class TestKW001Metadata:
-    def test_code_is_kw001(self) -> None:
-        result: ParseResult = _make_parse_result(
-            "def func(a: int, b: int) -> None:\n    pass\n"
-        )
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
-        assert diags[0].code == "KW001"
-
-    def test_source_line_captured(self) -> None:
-        result: ParseResult = _make_parse_result(
-            "def func(a: int, b: int) -> None:\n    pass\n"
-        )
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
-        assert diags[0].source_line == "def func(a: int, b: int) -> None:"
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("code", "KW001"),
+            ("source_line", "def func(a: int, b: int) -> None:"),
+            ("severity", Severity.WARN),
+        ],
+    )
+    def test_diagnostic_fields(
+        self, two_param_diags: list[Diagnostic], attr: str, expected: object
+    ) -> None:
+        assert getattr(two_param_diags[0], attr) == expected
 
     def test_none_tree_returns_empty(self) -> None:
-        result: ParseResult = ParseResult(
-            file=Path("test.py"),
-            tree=None,
-            source="",
-            source_lines=(),
-            syntax_error=None,
-        )
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
+        diags: list[Diagnostic] = RULE.check(parse_result=EMPTY_PARSE_RESULT, config=CONFIG)
         assert diags == []
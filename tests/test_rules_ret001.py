@@ -1,8 +1,7 @@
 """Tests for RET001: Disallow heterogeneous tuple returns."""
 from __future__ import annotations
 
-import ast
-from pathlib import Path
+import functools
 from types import MappingProxyType
 
 from pyguard.constants import Severity
@@ -10,21 +9,10 @@ from pyguard.diagnostics import Diagnostic
 from pyguard.parser import ParseResult
 from pyguard.rules.ret001 import RET001Rule
 from pyguard.types import PyGuardConfig, RuleConfig
+from tests._helpers import EMPTY_PARSE_RESULT, make_parse_result
 
 
-def _make_parse_result(code: str) -> ParseResult:
-    file: Path = Path("test.py")
-    source_lines: tuple[str, ...] = tuple(code.splitlines())
-    tree: ast.Module = ast.parse(code, filename=str(file))
-    return ParseResult(
-        file=file,
-        tree=tree,
-        source=code,
-        source_lines=source_lines,
-        syntax_error=None,
-    )
-
-
+@functools.cache
 def _make_config(
     *,
     severity: Severity = Severity.WARN,
@@ -47,7 +35,7 @@ class TestRET001BasicDetection:
             "def get_info() -> tuple[str, int, bool]:\n"
             '    return "Alice", 30, True\n'
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
         assert diags[0].location.line == 2
@@ -59,7 +47,7 @@ class TestRET001BasicDetection:
             "def divide(a: int, b: int) -> tuple[int, int]:\n"
             "    return a // b, a % b\n"
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
         assert diags[0].location.line == 2
@@ -71,7 +59,7 @@ class TestRET001BasicDetection:
             '        return x, "positive"\n'
             '    return 0, "zero"\n'
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 2
         assert diags[0].location.line == 3
@@ -84,19 +72,19 @@ class TestRET001Exemptions:
             "def get_ids() -> tuple[int, ...]:\n"
             "    return (1, 2, 3)\n"
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
     def test_no_return_annotation_ok(self) -> None:
         code: str = "def get_stuff():\n    return 1, 2\n"
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
     def test_non_tuple_return_annotation_ok(self) -> None:
         code: str = "def get_name() -> str:\n    return 'Alice'\n"
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
@@ -108,19 +96,19 @@ class TestRET001Exemptions:
             "def get_info() -> Info:\n"
             "    return Info()\n"
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
     def test_bare_tuple_annotation_ok(self) -> None:
         code: str = "def get_stuff() -> tuple:\n    return (1, 2)\n"
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
     def test_single_element_tuple_ok(self) -> None:
         code: str = "def get_one() -> tuple[int]:\n    return (42,)\n"
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
@@ -129,7 +117,7 @@ class TestRET001Exemptions:
             "def maybe() -> tuple[int, str]:\n"
             "    return\n"
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
@@ -140,7 +128,7 @@ class TestRET001AsyncAndNested:
             "async def fetch() -> tuple[int, str]:\n"
             '    return 200, "OK"\n'
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
         assert diags[0].location.line == 2
@@ -153,7 +141,7 @@ class TestRET001AsyncAndNested:
             '        return "hello"\n'
             '    return 1, inner()\n'
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
         assert diags[0].location.line == 4
@@ -166,7 +154,7 @@ class TestRET001AsyncAndNested:
             '        return 1, "hello"\n'
             "    return str(inner())\n"
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
         assert diags[0].location.line == 3
@@ -177,7 +165,7 @@ class TestRET001AsyncAndNested:
             "    def get_pair(self) -> tuple[str, int]:\n"
             '        return "name", 42\n'
         )
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
         assert diags[0].location.line == 3
@@ -187,19 +175,19 @@ class TestRET001Metadata:
     def test_severity_from_config(self) -> None:
         config: PyGuardConfig = _make_config(severity=Severity.ERROR)
         code: str = "def f() -> tuple[int, str]:\n    return 1, 'a'\n"
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=config)
         assert diags[0].severity == Severity.ERROR
 
     def test_code_is_ret001(self) -> None:
         code: str = "def f() -> tuple[int, str]:\n    return 1, 'a'\n"
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags[0].code == "RET001"
 
     def test_source_line_captured(self) -> None:
         code: str = "def f() -> tuple[int, str]:\n    return 1, 'a'\n"
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags[0].source_line == "    return 1, 'a'"
 
@@ -207,12 +195,5 @@ class TestRET001Metadata:
         assert RULE.code == "RET001"
 
     def test_none_tree_returns_empty(self) -> None:
-        result: ParseResult = ParseResult(
-            file=Path("test.py"),
-            tree=None,
-            source="",
-            source_lines=(),
-            syntax_error=None,
-        )
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
+        diags: list[Diagnostic] = RULE.check(parse_result=EMPTY_PARSE_RESULT, config=CONFIG)
         assert diags == []
@@ -1,132 +1,120 @@
 """Tests for TYP010: Disallow legacy typing syntax."""
 from __future__ import annotations
 
-import ast
+import dataclasses
 import textwrap
-from pathlib import Path
 from types import MappingProxyType
 
+import pytest
+
 from pyguard.constants import Severity
 from pyguard.diagnostics import Diagnostic
 from pyguard.parser import ParseResult
 from pyguard.rules.typ010 import TYP010Rule
 from pyguard.types import PyGuardConfig, RuleConfig
+from tests._helpers import EMPTY_PARSE_RESULT, make_parse_result
 
+RULE: TYP010Rule = TYP010Rule()
+CONFIG: PyGuardConfig = PyGuardConfig()
 
-def _make_parse_result(code: str) -> ParseResult:
-    file: Path = Path("test.py")
-    source_lines: tuple[str, ...] = tuple(code.splitlines())
-    tree: ast.Module = ast.parse(code, filename=str(file))
-    return ParseResult(
-        file=file,
-        tree=tree,
-        source=code,
-        source_lines=source_lines,
-        syntax_error=None,
-    )
+_LIST_RETURN_SRC: str = textwrap.dedent("""\
+    from typing import List
 
+    def f() -> List[str]:
+        return []
+""")
 
-RULE: TYP010Rule = TYP010Rule()
-CONFIG: PyGuardConfig = PyGuardConfig()
 
+@pytest.fixture(scope="module")
+def list_return_diags() -> list[Diagnostic]:
+    """Diagnostics for ``_LIST_RETURN_SRC`` under the default config."""
+    return RULE.check(parse_result=make_parse_result(_LIST_RETURN_SRC), config=CONFIG)
 
-class TestTYP010BasicDetection:
-    def test_optional_detected(self) -> None:
-        code: str = textwrap.dedent("""\
+
+# Each snippet imports one legacy name and uses it on line 3
+_BASIC_CASES: list[object] = [
+    pytest.param(
+        textwrap.dedent("""\
             from typing import Optional
 
             def f(x: int) -> Optional[str]:
                 return None
-        """)
-        result: ParseResult = _make_parse_result(code)
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
-        assert len(diags) == 1
-        assert diags[0].message == "Use 'str | None' instead of 'Optional[str]'"
-        assert diags[0].location.line == 3
-
-    def test_union_detected(self) -> None:
-        code: str = textwrap.dedent("""\
+        """),
+        "Use 'str | None' instead of 'Optional[str]'",
+        id="optional",
+    ),
+    pytest.param(
+        textwrap.dedent("""\
             from typing import Union
 
             def f(x: Union[str, int]) -> str:
                 return str(x)
-        """)
-        result: ParseResult = _make_parse_result(code)
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
-        assert len(diags) == 1
-        assert diags[0].message == "Use 'str | int' instead of 'Union[str, int]'"
-
-    def test_list_detected(self) -> None:
-        code: str = textwrap.dedent("""\
-            from typing import List
-
-            def f() -> List[str]:
-                return []
-        """)
-        result: ParseResult = _make_parse_result(code)
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
-        assert len(diags) == 1
-        assert diags[0].message == "Use 'list[str]' instead of 'List[str]'"
-
-    def test_dict_detected(self) -> None:
-        code: str = textwrap.dedent("""\
+        """),
+        "Use 'str | int' instead of 'Union[str, int]'",
+        id="union",
+    ),
+    pytest.param(_LIST_RETURN_SRC, "Use 'list[str]' instead of 'List[str]'", id="list"),
+    pytest.param(
+        textwrap.dedent("""\
             from typing import Dict
 
             def f() -> Dict[str, int]:
                 return {}
-        """)
-        result: ParseResult = _make_parse_result(code)
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
-        assert len(diags) == 1
-        assert diags[0].message == "Use 'dict[str, int]' instead of 'Dict[str, int]'"
-
-    def test_tuple_detected(self) -> None:
-        code: str = textwrap.dedent("""\
+        """),
+        "Use 'dict[str, int]' instead of 'Dict[str, int]'",
+        id="dict",
+    ),
+    pytest.param(
+        textwrap.dedent("""\
             from typing import Tuple
 
             def f() -> Tuple[int, int]:
                 return (0, 0)
-        """)
-        result: ParseResult = _make_parse_result(code)
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
-        assert len(diags) == 1
-        assert diags[0].message == "Use 'tuple[int, int]' instead of 'Tuple[int, int]'"
-
-    def test_set_detected(self) -> None:
-        code: str = textwrap.dedent("""\
+        """),
+        "Use 'tuple[int, int]' instead of 'Tuple[int, int]'",
+        id="tuple",
+    ),
+    pytest.param(
+        textwrap.dedent("""\
             from typing import Set
 
             def f() -> Set[str]:
                 return set()
-        """)
-        result: ParseResult = _make_parse_result(code)
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
-        assert len(diags) == 1
-        assert diags[0].message == "Use 'set[str]' instead of 'Set[str]'"
-
-    def test_frozenset_detected(self) -> None:
-        code: str = textwrap.dedent("""\
+        """),
+        "Use 'set[str]' instead of 'Set[str]'",
+        id="set",
+    ),
+    pytest.param(
+        textwrap.dedent("""\
             from typing import FrozenSet
 
             def f() -> FrozenSet[int]:
                 return frozenset()
-        """)
-        result: ParseResult = _make_parse_result(code)
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
-        assert len(diags) == 1
-        assert diags[0].message == "Use 'frozenset[int]' instead of 'FrozenSet[int]'"
-
-    def test_type_detected(self) -> None:
-        code: str = textwrap.dedent("""\
+        """),
+        "Use 'frozenset[int]' instead of 'FrozenSet[int]'",
+        id="frozenset",
+    ),
+    pytest.param(
+        textwrap.dedent("""\
             from typing import Type
 
             def f() -> Type[str]:
                 return str
-        """)
-        result: ParseResult = _make_parse_result(code)
+        """),
+        "Use 'type[str]' instead of 'Type[str]'",
+        id="type",
+    ),
+]
+
+
+class TestTYP010BasicDetection:
+    @pytest.mark.parametrize(("code", "expected_msg"), _BASIC_CASES)
+    def test_legacy_detected(self, code: str, expected_msg: str) -> None:
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
-        assert diags[0].message == "Use 'type[str]' instead of 'Type[str]'"
+        assert diags[0].message == expected_msg
+        assert diags[0].location.line == 3
 
 
 class TestTYP010NestedTypes:
@@ -137,7 +125,7 @@ class TestTYP010NestedTypes:
             def f() -> Optional[Dict[str, List[int]]]:
                 return None
         """)
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
         assert diags[0].message == (
@@ -152,7 +140,7 @@ class TestTYP010NestedTypes:
             def f() -> list[Dict[str, int]]:
                 return []
         """)
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
         assert diags[0].message == "Use 'dict[str, int]' instead of 'Dict[str, int]'"
@@ -166,7 +154,7 @@ class TestTYP010MultipleAnnotations:
             def f(a: List[str], b: Dict[str, int]) -> None:
                 pass
         """)
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 2
         msgs: list[str] = [d.message for d in diags]
@@ -180,7 +168,7 @@ class TestTYP010MultipleAnnotations:
             def f(items: List[str]) -> Optional[str]:
                 return None
         """)
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 2
 
@@ -192,7 +180,7 @@ class TestTYP010VariableAnnotations:
 
             ITEMS: List[str] = []
         """)
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
         assert diags[0].message == "Use 'list[str]' instead of 'List[str]'"
@@ -204,7 +192,7 @@ class TestTYP010VariableAnnotations:
             class Config:
                 name: Optional[str] = None
         """)
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
 
@@ -219,7 +207,7 @@ class TestTYP010ImportTracking:
             def f() -> Optional[str]:
                 return None
         """)
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
@@ -230,7 +218,7 @@ class TestTYP010ImportTracking:
             def f() -> typing.List[str]:
                 return []
         """)
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
         assert diags[0].message == "Use 'list[str]' instead of 'typing.List[str]'"
@@ -242,10 +230,18 @@ class TestTYP010ImportTracking:
             def f() -> L[str]:
                 return []
         """)
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
 
+    def test_source_without_typing_skips_walk(self) -> None:
+        """The tree is not walked when the source never mentions typing."""
+        result: ParseResult = dataclasses.replace(
+            make_parse_result(_LIST_RETURN_SRC), source="x = 1\n"
+        )
+        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
+        assert diags == []
+
 
 class TestTYP010ModernSyntaxOK:
     def test_builtin_generics_no_diagnostic(self) -> None:
@@ -256,7 +252,7 @@ class TestTYP010ModernSyntaxOK:
             def g() -> dict[str, int]:
                 return {}
         """)
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
@@ -268,7 +264,7 @@ class TestTYP010ModernSyntaxOK:
             def g(x: int | str) -> str:
                 return str(x)
         """)
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
@@ -282,7 +278,7 @@ class TestTYP010ModernSyntaxOK:
                 def handle(self, func: Callable[[int], int]) -> T:
                     ...
         """)
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert diags == []
 
@@ -295,7 +291,7 @@ class TestTYP010AsyncAndSpecialCases:
             async def f() -> List[str]:
                 return []
         """)
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 1
 
@@ -306,7 +302,7 @@ class TestTYP010AsyncAndSpecialCases:
             def f(*args: List[str], **kwargs: List[int]) -> None:
                 pass
         """)
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(code)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
         assert len(diags) == 2
 
@@ -317,45 +313,22 @@ class TestTYP010Metadata:
         config: PyGuardConfig = PyGuardConfig(
             rules=RuleConfig(severities=MappingProxyType(severities)),
         )
-        code: str = textwrap.dedent("""\
-            from typing import List
-
-            def f() -> List[str]:
-                return []
-        """)
-        result: ParseResult = _make_parse_result(code)
+        result: ParseResult = make_parse_result(_LIST_RETURN_SRC)
         diags: list[Diagnostic] = RULE.check(parse_result=result, config=config)
         assert diags[0].severity == Severity.WARN
 
-    def test_code_is_typ010(self) -> None:
-        code: str = textwrap.dedent("""\
-            from typing import List
-
-            def f() -> List[str]:
-                return []
-        """)
-        result: ParseResult = _make_parse_result(code)
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
-        assert diags[0].code == "TYP010"
-
-    def test_source_line_captured(self) -> None:
-        code: str = textwrap.dedent("""\
-            from typing import List
-
-            def f() -> List[str]:
-                return []
-        """)
-        result: ParseResult = _make_parse_result(code)
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
-        assert diags[0].source_line == "def f() -> List[str]:"
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("code", "TYP010"),
+            ("source_line", "def f() -> List[str]:"),
+        ],
+    )
+    def test_diagnostic_fields(
+        self, list_return_diags: list[Diagnostic], attr: str, expected: object
+    ) -> None:
+        assert getattr(list_return_diags[0], attr) == expected
 
     def test_none_tree_returns_empty(self) -> None:
-        result: ParseResult = ParseResult(
-            file=Path("test.py"),
-            tree=None,
-            source="",
-            source_lines=(),
-            syntax_error=None,
-        )
-        diags: list[Diagnostic] = RULE.check(parse_result=result, config=CONFIG)
+        diags: list[Diagnostic] = RULE.check(parse_result=EMPTY_PARSE_RESULT, config=CONFIG)
         assert diags == []
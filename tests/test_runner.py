@@ -3,33 +3,61 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from pyguard.constants import SYNTAX_ERROR_CODE, OutputFormat
 from pyguard.runner import LintResult, format_results, lint_paths
 from pyguard.types import PyGuardConfig
 
+_DEFAULT_CONFIG: PyGuardConfig = PyGuardConfig()
+
+# project name -> {file name: source}; each project is one directory
+_PROJECTS: dict[str, dict[str, str]] = {
+    "good": {"good.py": "x: int = 1\n"},
+    "bad": {"bad.py": "def broken(\n"},
+    "mixed": {"good.py": "x: int = 1\n", "bad.py": "def broken(\n"},
+    "syntax": {"a.py": "def f(\n", "b.py": "class C(\n"},
+    "plural": {"a.py": "x: int = 1\n", "b.py": "y: int = 2\n"},
+}
+
 
 def _write_file(path: Path, content: str) -> Path:
     path.write_text(content, encoding="utf-8")
     return path
 
 
+@pytest.fixture(scope="module")
+def projects(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Write every canonical project once for the whole module."""
+    root: Path = tmp_path_factory.mktemp("runner")
+    dirs: dict[str, Path] = {}
+    for name, files in _PROJECTS.items():
+        project: Path = root / name
+        project.mkdir()
+        for file_name, content in files.items():
+            _write_file(project / file_name, content)
+        dirs[name] = project
+    return dirs
+
+
+@pytest.fixture(scope="module")
+def lint_results(projects: dict[str, Path]) -> dict[str, LintResult]:
+    """Lint each project once with the default config."""
+    return {
+        name: lint_paths(paths=(project,), config=_DEFAULT_CONFIG)
+        for name, project in projects.items()
+    }
+
+
 class TestLintPaths:
-    def test_valid_files_no_errors(self, tmp_path: Path) -> None:
-        _write_file(tmp_path / "good.py", "x: int = 1\n")
-        result: LintResult = lint_paths(
-            paths=(tmp_path,),
-            config=PyGuardConfig(),
-        )
+    def test_valid_files_no_errors(self, lint_results: dict[str, LintResult]) -> None:
+        result: LintResult = lint_results["good"]
         assert result.files_checked == 1
         assert result.exit_code == 0
         assert not result.diagnostics.has_errors
 
-    def test_syntax_error_detected(self, tmp_path: Path) -> None:
-        _write_file(tmp_path / "bad.py", "def broken(\n")
-        result: LintResult = lint_paths(
-            paths=(tmp_path,),
-            config=PyGuardConfig(),
-        )
+    def test_syntax_error_detected(self, lint_results: dict[str, LintResult]) -> None:
+        result: LintResult = lint_results["bad"]
         assert result.files_checked == 1
         assert result.exit_code == 1
         assert result.diagnostics.has_errors
@@ -37,13 +65,8 @@ class TestLintPaths:
         assert len(diags) == 1
         assert diags[0].code == SYNTAX_ERROR_CODE
 
-    def test_mixed_files(self, tmp_path: Path) -> None:
-        _write_file(tmp_path / "good.py", "x: int = 1\n")
-        _write_file(tmp_path / "bad.py", "def broken(\n")
-        result: LintResult = lint_paths(
-            paths=(tmp_path,),
-            config=PyGuardConfig(),
-        )
+    def test_mixed_files(self, lint_results: dict[str, LintResult]) -> None:
+        result: LintResult = lint_results["mixed"]
         assert result.files_checked == 2
         assert result.exit_code == 1
         assert result.diagnostics.error_count == 1
@@ -51,67 +74,40 @@ class TestLintPaths:
     def test_empty_directory(self, tmp_path: Path) -> None:
         result: LintResult = lint_paths(
             paths=(tmp_path,),
-            config=PyGuardConfig(),
+            config=_DEFAULT_CONFIG,
         )
         assert result.files_checked == 0
         assert result.exit_code == 0
 
-    def test_multiple_syntax_errors(self, tmp_path: Path) -> None:
-        _write_file(tmp_path / "a.py", "def f(\n")
-        _write_file(tmp_path / "b.py", "class C(\n")
-        result: LintResult = lint_paths(
-            paths=(tmp_path,),
-            config=PyGuardConfig(),
-        )
+    def test_multiple_syntax_errors(self, lint_results: dict[str, LintResult]) -> None:
+        result: LintResult = lint_results["syntax"]
         assert result.files_checked == 2
         assert result.diagnostics.error_count == 2
 
-    def test_syntax_error_has_source_line(self, tmp_path: Path) -> None:
-        _write_file(tmp_path / "bad.py", "def broken(\n")
-        result: LintResult = lint_paths(
-            paths=(tmp_path,),
-            config=PyGuardConfig(),
-        )
-        diag = result.diagnostics.sorted[0]
+    def test_syntax_error_has_source_line(self, lint_results: dict[str, LintResult]) -> None:
+        diag = lint_results["bad"].diagnostics.sorted[0]
         assert diag.source_line is not None
         assert "broken" in diag.source_line
 
 
 class TestFormatResults:
-    def test_clean_output(self, tmp_path: Path) -> None:
-        _write_file(tmp_path / "good.py", "x: int = 1\n")
-        result: LintResult = lint_paths(
-            paths=(tmp_path,),
-            config=PyGuardConfig(),
-        )
-        output: str = format_results(result=result, config=PyGuardConfig())
+    def test_clean_output(self, lint_results: dict[str, LintResult]) -> None:
+        output: str = format_results(result=lint_results["good"], config=_DEFAULT_CONFIG)
         assert "No issues found." in output
         assert "Checked 1 file." in output
 
-    def test_error_output(self, tmp_path: Path) -> None:
-        _write_file(tmp_path / "bad.py", "def broken(\n")
-        result: LintResult = lint_paths(
-            paths=(tmp_path,),
-            config=PyGuardConfig(),
-        )
-        output: str = format_results(result=result, config=PyGuardConfig())
+    def test_error_output(self, lint_results: dict[str, LintResult]) -> None:
+        output: str = format_results(result=lint_results["bad"], config=_DEFAULT_CONFIG)
         assert "SYN001" in output
         assert "1 error" in output
         assert "Checked 1 file." in output
 
-    def test_plural_files(self, tmp_path: Path) -> None:
-        _write_file(tmp_path / "a.py", "x: int = 1\n")
-        _write_file(tmp_path / "b.py", "y: int = 2\n")
-        result: LintResult = lint_paths(
-            paths=(tmp_path,),
-            config=PyGuardConfig(),
-        )
-        output: str = format_results(result=result, config=PyGuardConfig())
+    def test_plural_files(self, lint_results: dict[str, LintResult]) -> None:
+        output: str = format_results(result=lint_results["plural"], config=_DEFAULT_CONFIG)
         assert "Checked 2 files." in output
 
-    def test_json_format(self, tmp_path: Path) -> None:
-        _write_file(tmp_path / "bad.py", "def broken(\n")
+    def test_json_format(self, projects: dict[str, Path]) -> None:
         config: PyGuardConfig = PyGuardConfig(output_format=OutputFormat.JSON)
-        result: LintResult = lint_paths(paths=(tmp_path,), config=config)
+        result: LintResult = lint_paths(paths=(projects["bad"],), config=config)
         output: str = format_results(result=result, config=config)
-        assert '"code": "SYN001"' in output
+        assert '"code":"SYN001"' in output
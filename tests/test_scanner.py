@@ -8,36 +8,40 @@ import pytest
 from pyguard.scanner import scan_files
 from pyguard.types import PyGuardConfig
 
-
-@pytest.fixture
-def sample_project(tmp_path: Path) -> Path:
-    """Create a sample project structure."""
-    (tmp_path / "src").mkdir()
-    (tmp_path / "src" / "pkg").mkdir()
-    (tmp_path / "tests").mkdir()
-    (tmp_path / "__pycache__").mkdir()
-    (tmp_path / ".hidden").mkdir()
-
-    (tmp_path / "main.py").write_text("# main")
-    (tmp_path / "src" / "app.py").write_text("# app")
-    (tmp_path / "src" / "pkg" / "module.py").write_text("# module")
-    (tmp_path / "src" / "pkg" / "__init__.py").write_text("")
-    (tmp_path / "tests" / "test_app.py").write_text("# test")
-    (tmp_path / "__pycache__" / "cached.cpython-311.pyc").write_bytes(b"")
-    (tmp_path / "__pycache__" / "module.py").write_text("# cached py")
-    (tmp_path / ".hidden" / "secret.py").write_text("# hidden")
-
-    (tmp_path / "README.md").write_text("# README")
-    (tmp_path / "src" / "data.json").write_text("{}")
-
-    return tmp_path
+_DEFAULT_CONFIG: PyGuardConfig = PyGuardConfig()
+
+
+# relative path -> contents; parent directories are created as needed
+_SAMPLE_TREE: dict[str, bytes] = {
+    "main.py": b"# main",
+    "src/app.py": b"# app",
+    "src/pkg/module.py": b"# module",
+    "src/pkg/__init__.py": b"",
+    "tests/test_app.py": b"# test",
+    "__pycache__/cached.cpython-311.pyc": b"",
+    "__pycache__/module.py": b"# cached py",
+    ".hidden/secret.py": b"# hidden",
+    "README.md": b"# README",
+    "src/data.json": b"{}",
+}
+
+
+@pytest.fixture(scope="module")
+def sample_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a sample project structure, shared read-only by the module."""
+    root: Path = tmp_path_factory.mktemp("sample_project")
+    for rel_path, content in _SAMPLE_TREE.items():
+        file_path: Path = root / rel_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(content)
+    return root
 
 
 def test_scan_single_python_file(tmp_path: Path) -> None:
     py_file = tmp_path / "test.py"
     py_file.write_text("# test")
 
-    result = scan_files(paths=(py_file,), config=PyGuardConfig())
+    result = scan_files(paths=(py_file,), config=_DEFAULT_CONFIG)
 
     assert result == [py_file.resolve()]
 
@@ -46,7 +50,7 @@ def test_scan_ignores_non_python_files(tmp_path: Path) -> None:
     txt_file = tmp_path / "test.txt"
     txt_file.write_text("not python")
 
-    result = scan_files(paths=(txt_file,), config=PyGuardConfig())
+    result = scan_files(paths=(txt_file,), config=_DEFAULT_CONFIG)
 
     assert result == []
 
@@ -109,7 +113,7 @@ def test_multiple_paths(tmp_path: Path) -> None:
     (dir1 / "a.py").write_text("# a")
     (dir2 / "b.py").write_text("# b")
 
-    result = scan_files(paths=(dir1, dir2), config=PyGuardConfig())
+    result = scan_files(paths=(dir1, dir2), config=_DEFAULT_CONFIG)
 
     assert len(result) == 2
     assert {p.name for p in result} == {"a.py", "b.py"}
@@ -119,7 +123,7 @@ def test_results_are_sorted(tmp_path: Path) -> None:
     for name in ["z.py", "a.py", "m.py"]:
         (tmp_path / name).write_text("")
 
-    result = scan_files(paths=(tmp_path,), config=PyGuardConfig())
+    result = scan_files(paths=(tmp_path,), config=_DEFAULT_CONFIG)
 
     names = [p.name for p in result]
     assert names == sorted(names)
@@ -129,13 +133,13 @@ def test_empty_directory_returns_empty_list(tmp_path: Path) -> None:
     empty_dir = tmp_path / "empty"
     empty_dir.mkdir()
 
-    result = scan_files(paths=(empty_dir,), config=PyGuardConfig())
+    result = scan_files(paths=(empty_dir,), config=_DEFAULT_CONFIG)
 
     assert result == []
 
 
 def test_default_excludes_work(sample_project: Path) -> None:
-    result = scan_files(paths=(sample_project,), config=PyGuardConfig())
+    result = scan_files(paths=(sample_project,), config=_DEFAULT_CONFIG)
 
     for path in result:
         path_str = str(path)
@@ -160,3 +164,93 @@ def test_exclude_wildcard_prefix_pattern(tmp_path: Path) -> None:
     file_names = {p.name for p in result}
     assert "real.py" in file_names
     assert "PKG-INFO.py" not in file_names
+
+
+def test_wildcard_prefix_doublestar_pattern(sample_project: Path) -> None:
+    config = PyGuardConfig(include=("s*/**/*.py",), exclude=())
+
+    result = scan_files(paths=(sample_project,), config=config)
+
+    assert {p.name for p in result} == {"app.py", "module.py", "__init__.py"}
+
+
+@pytest.mark.parametrize(
+    ("include", "expected"),
+    [
+        (("src/pkg/*.py", "src/**/*.py"), {"app.py", "module.py", "__init__.py"}),
+        (("src/pkg/*.py", "tests/*.py"), {"module.py", "__init__.py", "test_app.py"}),
+        (("missing/**/*.py",), set()),
+        (("../src/*.py",), set()),
+    ],
+)
+def test_literal_include_prefixes(
+    sample_project: Path, include: tuple[str, ...], expected: set[str],
+) -> None:
+    config = PyGuardConfig(include=include, exclude=())
+
+    result = scan_files(paths=(sample_project,), config=config)
+
+    assert {p.name for p in result} == expected
+
+
+@pytest.mark.parametrize(
+    ("inputs", "cached_found"),
+    [
+        (("__pycache__",), True),
+        (("__pycache__", "."), True),
+        ((".", "__pycache__"), False),
+    ],
+)
+def test_excluded_directory_given_as_input(
+    sample_project: Path, inputs: tuple[str, ...], cached_found: bool,
+) -> None:
+    # The first input containing a file is its base, so the cache copy is
+    # only excluded when the project root is listed first
+    config = PyGuardConfig(include=("**/*.py",), exclude=("**/__pycache__/**",))
+
+    result = scan_files(paths=tuple(sample_project / name for name in inputs), config=config)
+
+    cached: Path = (sample_project / "__pycache__" / "module.py").resolve()
+    assert (cached in result) is cached_found
+
+
+def test_file_inputs_still_filtered_by_name(sample_project: Path) -> None:
+    config = PyGuardConfig(include=("**/*.py",), exclude=("**/test_*.py",))
+    files = (sample_project / "tests" / "test_app.py", sample_project / "src" / "app.py")
+
+    result = scan_files(paths=files, config=config)
+
+    assert result == [(sample_project / "src" / "app.py").resolve()]
+
+
+def test_threaded_scan_matches_sequential(sample_project: Path) -> None:
+    paths = (sample_project, sample_project / "src")
+
+    threaded = scan_files(paths=paths, config=_DEFAULT_CONFIG, jobs=4)
+
+    assert threaded == scan_files(paths=paths, config=_DEFAULT_CONFIG)
+
+
+def test_literal_excludes_match_whole_components(tmp_path: Path) -> None:
+    for rel_path in ("pkg/__pycache__/m.py", "pkg/not__pycache__/m.py", "pkg/.env.py", "a.b/c.py"):
+        (tmp_path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel_path).write_text("")
+    config = PyGuardConfig(include=("**/*.py",), exclude=("**/__pycache__/**", "**/.*"))
+
+    result = scan_files(paths=(tmp_path,), config=config)
+
+    assert [p.relative_to(tmp_path.resolve()).as_posix() for p in result] == [
+        "a.b/c.py",
+        "pkg/not__pycache__/m.py",
+    ]
+
+
+def test_many_directory_excludes(sample_project: Path) -> None:
+    config = PyGuardConfig(
+        include=("**/*.py",),
+        exclude=("**/__pycache__/**", "**/pkg/**", "**/tests/**", "**/node_modules/**"),
+    )
+
+    result = scan_files(paths=(sample_project,), config=config)
+
+    assert {p.name for p in result} == {"main.py", "app.py", "secret.py"}
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
 from pyguard.cli import cli
@@ -23,6 +24,21 @@ def greet(name: str) -> None:
     print(name)
 """
 
+# invoke() isolates stdio per call, so one runner serves every test
+_RUNNER: CliRunner = CliRunner()
+
+_FIXABLE_BYTES: bytes = _FIXABLE_SOURCE.encode()
+
+
+def _write_fixable(directory: Path, *names: str) -> None:
+    """Seed *directory* with independent copies of the fixable module.
+
+    ``fix`` rewrites files in place, so each name gets its own file rather
+    than a hardlink to a shared seed.
+    """
+    for name in names:
+        (directory / name).write_bytes(_FIXABLE_BYTES)
+
 
 class TestTryoutYes:
     """Test 'y' (yes) response applies the fix."""
@@ -31,8 +47,7 @@ class TestTryoutYes:
         target: Path = tmp_path / "fixable.py"
         target.write_text(_FIXABLE_SOURCE)
 
-        runner: CliRunner = CliRunner()
-        result = runner.invoke(
+        result = _RUNNER.invoke(
             cli, ["fix", "--tryout", str(tmp_path)], input="y\n",
         )
 
@@ -48,8 +63,7 @@ class TestTryoutNo:
         target: Path = tmp_path / "fixable.py"
         target.write_text(_FIXABLE_SOURCE)
 
-        runner: CliRunner = CliRunner()
-        result = runner.invoke(
+        result = _RUNNER.invoke(
             cli, ["fix", "--tryout", str(tmp_path)], input="n\n",
         )
 
@@ -62,13 +76,10 @@ class TestTryoutAll:
     """Test 'a' (all) response applies all remaining."""
 
     def test_a_applies_all_remaining(self, tmp_path: Path) -> None:
-        (tmp_path / "a.py").write_text(_FIXABLE_SOURCE)
-        (tmp_path / "b.py").write_text(_FIXABLE_SOURCE)
-        (tmp_path / "c.py").write_text(_FIXABLE_SOURCE)
+        _write_fixable(tmp_path, "a.py", "b.py", "c.py")
 
-        runner: CliRunner = CliRunner()
         # First file: 'a' (apply all remaining)
-        result = runner.invoke(
+        result = _RUNNER.invoke(
             cli, ["fix", "--tryout", str(tmp_path)], input="a\n",
         )
 
@@ -83,11 +94,9 @@ class TestTryoutQuit:
     """Test 'q' (quit) response stops immediately."""
 
     def test_q_stops_early(self, tmp_path: Path) -> None:
-        (tmp_path / "a.py").write_text(_FIXABLE_SOURCE)
-        (tmp_path / "b.py").write_text(_FIXABLE_SOURCE)
+        _write_fixable(tmp_path, "a.py", "b.py")
 
-        runner: CliRunner = CliRunner()
-        result = runner.invoke(
+        result = _RUNNER.invoke(
             cli, ["fix", "--tryout", str(tmp_path)], input="q\n",
         )
 
@@ -102,11 +111,9 @@ class TestTryoutMixed:
     """Test mixed responses."""
 
     def test_y_then_n(self, tmp_path: Path) -> None:
-        (tmp_path / "a.py").write_text(_FIXABLE_SOURCE)
-        (tmp_path / "b.py").write_text(_FIXABLE_SOURCE)
+        _write_fixable(tmp_path, "a.py", "b.py")
 
-        runner: CliRunner = CliRunner()
-        result = runner.invoke(
+        result = _RUNNER.invoke(
             cli, ["fix", "--tryout", str(tmp_path)], input="y\nn\n",
         )
 
@@ -122,37 +129,43 @@ class TestTryoutNoChanges:
     def test_no_changes_shows_summary(self, tmp_path: Path) -> None:
         (tmp_path / "clean.py").write_text(_CLEAN_SOURCE)
 
-        runner: CliRunner = CliRunner()
-        result = runner.invoke(cli, ["fix", "--tryout", str(tmp_path)])
+        result = _RUNNER.invoke(cli, ["fix", "--tryout", str(tmp_path)])
 
         assert result.exit_code == 0
         assert "Applied 0 of 0 files." in result.output
 
 
 class TestTryoutMutualExclusion:
-    """Test that --tryout is mutually exclusive with --diff and --check."""
+    """Test that --tryout is mutually exclusive with --diff and --check.
+
+    These only check the exit code and one stderr line, so they call the
+    command directly and let pytest capture stderr instead of going
+    through the runner's stream isolation.
+    """
 
-    def test_tryout_with_diff_errors(self, tmp_path: Path) -> None:
+    def test_tryout_with_diff_errors(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str],
+    ) -> None:
         (tmp_path / "a.py").write_text(_FIXABLE_SOURCE)
 
-        runner: CliRunner = CliRunner()
-        result = runner.invoke(
-            cli, ["fix", "--tryout", "--diff", str(tmp_path)],
+        exit_code = cli.main(
+            ["fix", "--tryout", "--diff", str(tmp_path)], standalone_mode=False,
         )
 
-        assert result.exit_code == 2
-        assert "mutually exclusive" in result.output
+        assert exit_code == 2
+        assert "mutually exclusive" in capsys.readouterr().err
 
-    def test_tryout_with_check_errors(self, tmp_path: Path) -> None:
+    def test_tryout_with_check_errors(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str],
+    ) -> None:
         (tmp_path / "a.py").write_text(_FIXABLE_SOURCE)
 
-        runner: CliRunner = CliRunner()
-        result = runner.invoke(
-            cli, ["fix", "--tryout", "--check", str(tmp_path)],
+        exit_code = cli.main(
+            ["fix", "--tryout", "--check", str(tmp_path)], standalone_mode=False,
         )
 
-        assert result.exit_code == 2
-        assert "mutually exclusive" in result.output
+        assert exit_code == 2
+        assert "mutually exclusive" in capsys.readouterr().err
 
 
 class TestTryoutShowsDiff:
@@ -162,8 +175,7 @@ class TestTryoutShowsDiff:
         target: Path = tmp_path / "fixable.py"
         target.write_text(_FIXABLE_SOURCE)
 
-        runner: CliRunner = CliRunner()
-        result = runner.invoke(
+        result = _RUNNER.invoke(
             cli, ["fix", "--tryout", str(tmp_path)], input="y\n",
         )
 